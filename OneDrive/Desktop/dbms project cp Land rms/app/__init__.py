@@ -52,6 +52,10 @@ def create_app(config_name='default'):
     migrate.init_app(app, db)
     mail.init_app(app)
     
+    # Load compiled templates from the shared bytecode cache
+    from app.utils.template_cache import init_template_cache
+    init_template_cache(app)
+    
     # User loader for Flask-Login
     @login_manager.user_loader
     def load_user(user_id):
@@ -100,6 +104,21 @@ def create_app(config_name='default'):
         from flask import render_template
         return render_template('errors/403.html'), 403
     
+    # Keep the navbar notification summaries in memory, dropped when they change
+    from app.utils.notification_cache import notification_cache
+    notification_cache.setup_listeners()
+    
+    # Keep the citizen dashboard summaries current with every flush
+    from app.utils.citizen_summary import citizen_summaries
+    citizen_summaries.setup_listeners()
+    
+    # Keep the mutation work-queue counters current with every flush
+    from app.utils.mutation_queue import mutation_queue
+    mutation_queue.setup_listeners()
+    with app.app_context():
+        # Count the existing mutations on first start (and after `flask init-db`)
+        mutation_queue.ensure_seeded()
+    
     # Context processors
     @app.context_processor
     def inject_globals():
@@ -109,16 +128,8 @@ def create_app(config_name='default'):
         unread_notifications_count = 0
         recent_notifications = []
         if current_user.is_authenticated:
-            from app.models.notification import Notification
-            unread_notifications_count = Notification.query.filter_by(
-                user_id=current_user.id,
-                is_read=False
-            ).count()
-            
-            # Get recent 5 notifications for dropdown
-            recent_notifications = Notification.query.filter_by(
-                user_id=current_user.id
-            ).order_by(Notification.created_at.desc()).limit(5).all()
+            # Unread count and recent 5 notifications for the dropdown
+            unread_notifications_count, recent_notifications = notification_cache.get(current_user.id)
         
         return {
             'app_name': app.config.get('APP_NAME', 'LRMS'),
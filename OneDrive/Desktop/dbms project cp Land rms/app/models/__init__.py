@@ -30,6 +30,9 @@ from app.models.task import Task
 from app.models.meeting import Meeting
 from app.models.certificate import Certificate
 from app.models.complaint import Complaint
+from app.models.analytics_cache import AnalyticsCache
+from app.models.citizen_summary import CitizenSummary
+from app.models.mutation_queue import MutationQueueCounter
 
 __all__ = [
     'db',
@@ -58,5 +61,8 @@ __all__ = [
     'Task',
     'Meeting',
     'Certificate',
-    'Complaint'
+    'Complaint',
+    'AnalyticsCache',
+    'CitizenSummary',
+    'MutationQueueCounter'
 ]
@@ -0,0 +1,23 @@
+"""
+Analytics cache model for precomputed dashboard metrics.
+Same table as the one sp_update_analytics_cache creates on MySQL.
+"""
+
+from datetime import datetime
+from app.models import db
+
+
+class AnalyticsCache(db.Model):
+    """
+    One precomputed metric per row, stored as a JSON document.
+    Filled by `flask refresh-analytics` (see app/utils/analytics_cache.py).
+    """
+
+    __tablename__ = 'analytics_cache'
+
+    cache_key = db.Column(db.String(100), primary_key=True)
+    cache_value = db.Column(db.Text)  # JSON
+    last_updated = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)  # UTC
+
+    def __repr__(self):
+        return f'<AnalyticsCache {self.cache_key} at {self.last_updated}>'
@@ -0,0 +1,62 @@
+"""
+Citizen summary model - one precomputed dashboard row per user.
+"""
+
+import json
+from datetime import datetime
+from app.models import db
+
+
+class CitizenSummary(db.Model):
+    """
+    Counts and totals shown on the citizen dashboard.
+    Kept up to date in the same transaction as the ownership, property, mutation,
+    tax assessment and payment changes that affect them
+    (see app/utils/citizen_summary.py).
+    """
+
+    __tablename__ = 'citizen_summaries'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+
+    # Properties
+    properties_count = db.Column(db.Integer, default=0, nullable=False)  # active ownerships
+    approved_properties = db.Column(db.Integer, default=0, nullable=False)
+    rejected_properties = db.Column(db.Integer, default=0, nullable=False)
+    pending_properties = db.Column(db.Integer, default=0, nullable=False)  # pending or under review
+    property_types = db.Column(db.Text)  # JSON [[property_type, count], ...] of active ownerships
+
+    # Mutations requested
+    pending_mutations = db.Column(db.Integer, default=0, nullable=False)
+    approved_mutations = db.Column(db.Integer, default=0, nullable=False)
+    rejected_mutations = db.Column(db.Integer, default=0, nullable=False)
+
+    # Payments and tax
+    total_payments = db.Column(db.Integer, default=0, nullable=False)
+    total_amount_paid = db.Column(db.Float, default=0.0, nullable=False)  # completed payments
+    pending_payments = db.Column(db.Integer, default=0, nullable=False)
+    monthly_payments = db.Column(db.Text)  # JSON [[year, month, total, count], ...] oldest first
+    tax_due = db.Column(db.Float, default=0.0, nullable=False)  # unpaid assessments of owned properties
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def get_property_types(self):
+        """Active ownerships by property type as (property_type, count) tuples."""
+        return [tuple(row) for row in json.loads(self.property_types or '[]')]
+
+    def get_monthly_payments(self, since):
+        """
+        Payment totals per month from the month of since onwards.
+
+        Args:
+            since: datetime; its whole month is included
+
+        Returns:
+            list: (year, month, total, count) tuples, oldest first
+        """
+        first = since.year * 12 + since.month
+        return [tuple(row) for row in json.loads(self.monthly_payments or '[]')
+                if row[0] * 12 + row[1] >= first]
+
+    def __repr__(self):
+        return f'<CitizenSummary user {self.user_id}>'
@@ -123,7 +123,41 @@ class Mutation(db.Model):
             return 0
         
         return (datetime.utcnow() - self.created_at).days
-    
+
+    @classmethod
+    def summaries(cls, property_ids):
+        """
+        Mutation count, latest status and last mutation date per property, in one query.
+
+        Args:
+            property_ids: IDs of the properties on the current page
+
+        Returns:
+            dict: property_id -> row with mutation_count, latest_status and last_date
+                  (properties without mutations are absent)
+        """
+        if not property_ids:
+            return {}
+
+        grouped = db.session.query(
+            cls.property_id,
+            db.func.count(cls.id).label('mutation_count'),
+            db.func.max(cls.created_at).label('last_date')
+        ).filter(cls.property_id.in_(property_ids)).group_by(cls.property_id).subquery()
+
+        latest = db.aliased(cls)
+        latest_status = db.session.query(latest.status).filter(
+            latest.property_id == grouped.c.property_id
+        ).order_by(latest.created_at.desc(), latest.id.desc()).limit(1).correlate(grouped).scalar_subquery()
+
+        rows = db.session.query(
+            grouped.c.property_id,
+            grouped.c.mutation_count,
+            latest_status.label('latest_status'),
+            grouped.c.last_date
+        ).all()
+        return {row.property_id: row for row in rows}
+
     def __repr__(self):
         return f'<Mutation {self.mutation_number} - {self.mutation_type} ({self.status})>'
     
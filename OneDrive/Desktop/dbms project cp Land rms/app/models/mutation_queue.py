@@ -0,0 +1,24 @@
+"""
+Mutation queue counter model - maintained work-queue depths.
+"""
+
+from app.models import db
+
+
+class MutationQueueCounter(db.Model):
+    """
+    Number of mutations per status, type, processing officer and day of submission.
+    Adjusted in the same transaction as every mutation insert, status transition
+    or reassignment (see app/utils/mutation_queue.py).
+    """
+
+    __tablename__ = 'mutation_queue_counters'
+
+    status = db.Column(db.String(30), primary_key=True)
+    mutation_type = db.Column(db.String(30), primary_key=True)
+    officer_id = db.Column(db.Integer, primary_key=True, default=0)  # processed_by, 0 when unassigned
+    created_on = db.Column(db.Date, primary_key=True)  # submission day, for age buckets
+    mutation_count = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f'<MutationQueueCounter {self.status}/{self.mutation_type}/{self.officer_id} {self.created_on}: {self.mutation_count}>'
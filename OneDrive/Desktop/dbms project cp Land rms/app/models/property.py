@@ -2,9 +2,15 @@
 ULTRA COMPREHENSIVE Property Model
 Collects extensive information about land/property
 150+ fields for detailed data collection
+
+Only the columns shown on list and summary pages load with the row. The
+detailed sections are deferred in named groups: a group is fetched in one
+extra query the first time any of its attributes is read, or together with
+the row when the query asks for it with Property.load_groups().
 """
 
 from datetime import datetime
+from sqlalchemy.orm import deferred, undefer_group
 from app.models import db
 
 
@@ -13,6 +19,11 @@ class Property(db.Model):
     
     __tablename__ = 'properties'
     
+    # Deferred column groups, in form order
+    COLUMN_GROUPS = ('location', 'mapping', 'measurements', 'classification', 'construction',
+                     'agriculture', 'water', 'utilities', 'access', 'infrastructure', 'surroundings',
+                     'environment', 'legal', 'planning', 'valuation', 'history', 'media', 'notes')
+    
     # ========== BASIC INFORMATION ==========
     id = db.Column(db.Integer, primary_key=True)
     ulpin = db.Column(db.String(50), unique=True, nullable=True, index=True)
@@ -23,65 +34,65 @@ class Property(db.Model):
     taluka = db.Column(db.String(100))
     village_city = db.Column(db.String(100), nullable=False)
     locality = db.Column(db.String(200))
-    sub_locality = db.Column(db.String(200))
+    sub_locality = deferred(db.Column(db.String(200)), group='location')
     street_address = db.Column(db.Text)
-    landmark = db.Column(db.String(200))
+    landmark = deferred(db.Column(db.String(200)), group='location')
     pincode = db.Column(db.String(10))
-    ward_number = db.Column(db.String(50))
-    zone = db.Column(db.String(100))
-    municipal_area = db.Column(db.Boolean, default=False)
-    gram_panchayat = db.Column(db.String(200))
-    assembly_constituency = db.Column(db.String(100))
-    parliamentary_constituency = db.Column(db.String(100))
+    ward_number = deferred(db.Column(db.String(50)), group='location')
+    zone = deferred(db.Column(db.String(100)), group='location')
+    municipal_area = deferred(db.Column(db.Boolean, default=False), group='location')
+    gram_panchayat = deferred(db.Column(db.String(200)), group='location')
+    assembly_constituency = deferred(db.Column(db.String(100)), group='location')
+    parliamentary_constituency = deferred(db.Column(db.String(100)), group='location')
     
     # ========== GPS & MAPPING (10 fields) ==========
     latitude = db.Column(db.Float)
     longitude = db.Column(db.Float)
-    gps_latitude = db.Column(db.Float)
-    gps_longitude = db.Column(db.Float)
-    altitude = db.Column(db.Float)
-    polygon_coordinates = db.Column(db.Text)  # JSON
-    property_corners_gps = db.Column(db.Text)  # JSON
-    mapping_accuracy = db.Column(db.String(50))
-    survey_method = db.Column(db.String(100))
-    last_survey_date = db.Column(db.Date)
+    gps_latitude = deferred(db.Column(db.Float), group='mapping')
+    gps_longitude = deferred(db.Column(db.Float), group='mapping')
+    altitude = deferred(db.Column(db.Float), group='mapping')
+    polygon_coordinates = deferred(db.Column(db.Text), group='mapping')  # JSON
+    property_corners_gps = deferred(db.Column(db.Text), group='mapping')  # JSON
+    mapping_accuracy = deferred(db.Column(db.String(50)), group='mapping')
+    survey_method = deferred(db.Column(db.String(100)), group='mapping')
+    last_survey_date = deferred(db.Column(db.Date), group='mapping')
     
     # ========== LAND MEASUREMENTS (20 fields) ==========
     survey_number = db.Column(db.String(100))
     plot_number = db.Column(db.String(100))
-    block_number = db.Column(db.String(100))
-    khasra_number = db.Column(db.String(100))
+    block_number = deferred(db.Column(db.String(100)), group='measurements')
+    khasra_number = deferred(db.Column(db.String(100)), group='measurements')
     
     area = db.Column(db.Float, nullable=False)
     area_unit = db.Column(db.Enum('sqm', 'sqft', 'acre', 'hectare', 'gunta', 'bigha', name='area_units'))
     
-    length = db.Column(db.Float)
-    width = db.Column(db.Float)
-    perimeter = db.Column(db.Float)
+    length = deferred(db.Column(db.Float), group='measurements')
+    width = deferred(db.Column(db.Float), group='measurements')
+    perimeter = deferred(db.Column(db.Float), group='measurements')
     
-    road_frontage = db.Column(db.Float)
-    frontage_direction = db.Column(db.String(50))
+    road_frontage = deferred(db.Column(db.Float), group='measurements')
+    frontage_direction = deferred(db.Column(db.String(50)), group='measurements')
     
-    plot_shape = db.Column(db.String(50))  # rectangular, irregular, triangular
-    slope_percentage = db.Column(db.Float)
-    terrain_type = db.Column(db.String(100))  # flat, sloping, hilly
-    elevation_from_road = db.Column(db.Float)
+    plot_shape = deferred(db.Column(db.String(50)), group='measurements')  # rectangular, irregular, triangular
+    slope_percentage = deferred(db.Column(db.Float), group='measurements')
+    terrain_type = deferred(db.Column(db.String(100)), group='measurements')  # flat, sloping, hilly
+    elevation_from_road = deferred(db.Column(db.Float), group='measurements')
     
-    built_up_area = db.Column(db.Float)
-    carpet_area = db.Column(db.Float)
-    super_built_up_area = db.Column(db.Float)
-    balcony_area = db.Column(db.Float)
-    common_area_share = db.Column(db.Float)
+    built_up_area = deferred(db.Column(db.Float), group='measurements')
+    carpet_area = deferred(db.Column(db.Float), group='measurements')
+    super_built_up_area = deferred(db.Column(db.Float), group='measurements')
+    balcony_area = deferred(db.Column(db.Float), group='measurements')
+    common_area_share = deferred(db.Column(db.Float), group='measurements')
     
     # ========== BOUNDARIES (8 fields) ==========
-    north_boundary = db.Column(db.String(200))
-    south_boundary = db.Column(db.String(200))
-    east_boundary = db.Column(db.String(200))
-    west_boundary = db.Column(db.String(200))
-    north_boundary_length = db.Column(db.Float)
-    south_boundary_length = db.Column(db.Float)
-    east_boundary_length = db.Column(db.Float)
-    west_boundary_length = db.Column(db.Float)
+    north_boundary = deferred(db.Column(db.String(200)), group='measurements')
+    south_boundary = deferred(db.Column(db.String(200)), group='measurements')
+    east_boundary = deferred(db.Column(db.String(200)), group='measurements')
+    west_boundary = deferred(db.Column(db.String(200)), group='measurements')
+    north_boundary_length = deferred(db.Column(db.Float), group='measurements')
+    south_boundary_length = deferred(db.Column(db.Float), group='measurements')
+    east_boundary_length = deferred(db.Column(db.Float), group='measurements')
+    west_boundary_length = deferred(db.Column(db.Float), group='measurements')
     
     # ========== PROPERTY CLASSIFICATION (15 fields) ==========
     property_type = db.Column(db.Enum('residential', 'commercial', 'agricultural', 
@@ -90,284 +101,284 @@ class Property(db.Model):
     land_category_id = db.Column(db.Integer, db.ForeignKey('land_categories.id'))
     usage_type_id = db.Column(db.Integer, db.ForeignKey('usage_types.id'))
     
-    current_land_use = db.Column(db.String(200))
-    proposed_land_use = db.Column(db.String(200))
-    zoning_classification = db.Column(db.String(100))
-    development_zone = db.Column(db.String(100))
+    current_land_use = deferred(db.Column(db.String(200)), group='classification')
+    proposed_land_use = deferred(db.Column(db.String(200)), group='classification')
+    zoning_classification = deferred(db.Column(db.String(100)), group='classification')
+    development_zone = deferred(db.Column(db.String(100)), group='classification')
     
-    is_freehold = db.Column(db.Boolean, default=True)
-    lease_type = db.Column(db.String(100))
-    lease_years_remaining = db.Column(db.Integer)
+    is_freehold = deferred(db.Column(db.Boolean, default=True), group='classification')
+    lease_type = deferred(db.Column(db.String(100)), group='classification')
+    lease_years_remaining = deferred(db.Column(db.Integer), group='classification')
     
-    property_nature = db.Column(db.String(100))  # urban, rural, semi-urban
-    property_age_years = db.Column(db.Integer)
-    property_condition = db.Column(db.String(100))  # new, good, average, poor
-    occupancy_status = db.Column(db.String(100))  # owner-occupied, tenant, vacant
+    property_nature = deferred(db.Column(db.String(100)), group='classification')  # urban, rural, semi-urban
+    property_age_years = deferred(db.Column(db.Integer), group='classification')
+    property_condition = deferred(db.Column(db.String(100)), group='classification')  # new, good, average, poor
+    occupancy_status = deferred(db.Column(db.String(100)), group='classification')  # owner-occupied, tenant, vacant
     
     # ========== CONSTRUCTION DETAILS (25 fields) ==========
-    is_constructed = db.Column(db.Boolean, default=False)
-    construction_type = db.Column(db.String(100))  # RCC, load-bearing, etc
-    construction_quality = db.Column(db.String(100))  # premium, standard, basic
-    
-    number_of_floors = db.Column(db.Integer)
-    floor_number = db.Column(db.Integer)  # for apartments
-    total_floors_in_building = db.Column(db.Integer)
-    
-    number_of_rooms = db.Column(db.Integer)
-    number_of_bedrooms = db.Column(db.Integer)
-    number_of_bathrooms = db.Column(db.Integer)
-    number_of_kitchens = db.Column(db.Integer)
-    number_of_balconies = db.Column(db.Integer)
-    
-    has_basement = db.Column(db.Boolean, default=False)
-    basement_area = db.Column(db.Float)
-    has_terrace = db.Column(db.Boolean, default=False)
-    terrace_area = db.Column(db.Float)
-    has_garage = db.Column(db.Boolean, default=False)
-    parking_spaces = db.Column(db.Integer)
-    
-    ceiling_height = db.Column(db.Float)
-    flooring_type = db.Column(db.String(200))  # marble, tiles, wooden
-    roofing_type = db.Column(db.String(200))  # RCC, asbestos, tile
-    wall_type = db.Column(db.String(200))
-    doors_windows_type = db.Column(db.String(200))
-    
-    year_of_construction = db.Column(db.Integer)
-    last_renovation_year = db.Column(db.Integer)
-    depreciation_percentage = db.Column(db.Float)
-    remaining_life_years = db.Column(db.Integer)
+    is_constructed = deferred(db.Column(db.Boolean, default=False), group='construction')
+    construction_type = deferred(db.Column(db.String(100)), group='construction')  # RCC, load-bearing, etc
+    construction_quality = deferred(db.Column(db.String(100)), group='construction')  # premium, standard, basic
+    
+    number_of_floors = deferred(db.Column(db.Integer), group='construction')
+    floor_number = deferred(db.Column(db.Integer), group='construction')  # for apartments
+    total_floors_in_building = deferred(db.Column(db.Integer), group='construction')
+    
+    number_of_rooms = deferred(db.Column(db.Integer), group='construction')
+    number_of_bedrooms = deferred(db.Column(db.Integer), group='construction')
+    number_of_bathrooms = deferred(db.Column(db.Integer), group='construction')
+    number_of_kitchens = deferred(db.Column(db.Integer), group='construction')
+    number_of_balconies = deferred(db.Column(db.Integer), group='construction')
+    
+    has_basement = deferred(db.Column(db.Boolean, default=False), group='construction')
+    basement_area = deferred(db.Column(db.Float), group='construction')
+    has_terrace = deferred(db.Column(db.Boolean, default=False), group='construction')
+    terrace_area = deferred(db.Column(db.Float), group='construction')
+    has_garage = deferred(db.Column(db.Boolean, default=False), group='construction')
+    parking_spaces = deferred(db.Column(db.Integer), group='construction')
+    
+    ceiling_height = deferred(db.Column(db.Float), group='construction')
+    flooring_type = deferred(db.Column(db.String(200)), group='construction')  # marble, tiles, wooden
+    roofing_type = deferred(db.Column(db.String(200)), group='construction')  # RCC, asbestos, tile
+    wall_type = deferred(db.Column(db.String(200)), group='construction')
+    doors_windows_type = deferred(db.Column(db.String(200)), group='construction')
+    
+    year_of_construction = deferred(db.Column(db.Integer), group='construction')
+    last_renovation_year = deferred(db.Column(db.Integer), group='construction')
+    depreciation_percentage = deferred(db.Column(db.Float), group='construction')
+    remaining_life_years = deferred(db.Column(db.Integer), group='construction')
     
     # ========== SOIL & AGRICULTURE (15 fields) ==========
-    soil_type = db.Column(db.String(100))  # red, black, alluvial, sandy, clayey
-    soil_quality = db.Column(db.String(100))  # excellent, good, average, poor
-    soil_ph_level = db.Column(db.Float)
-    soil_fertility = db.Column(db.String(100))
-    soil_depth_cm = db.Column(db.Float)
-    
-    is_irrigated = db.Column(db.Boolean, default=False)
-    irrigation_type = db.Column(db.String(200))  # well, canal, drip, sprinkler
-    number_of_crops_per_year = db.Column(db.Integer)
-    current_crop = db.Column(db.String(200))
-    previous_crops = db.Column(db.Text)  # JSON array
-    crop_yield_per_acre = db.Column(db.Float)
-    
-    has_trees = db.Column(db.Boolean, default=False)
-    tree_count = db.Column(db.Integer)
-    tree_types = db.Column(db.Text)  # JSON
-    
-    is_organic_certified = db.Column(db.Boolean, default=False)
-    organic_certification_number = db.Column(db.String(100))
+    soil_type = deferred(db.Column(db.String(100)), group='agriculture')  # red, black, alluvial, sandy, clayey
+    soil_quality = deferred(db.Column(db.String(100)), group='agriculture')  # excellent, good, average, poor
+    soil_ph_level = deferred(db.Column(db.Float), group='agriculture')
+    soil_fertility = deferred(db.Column(db.String(100)), group='agriculture')
+    soil_depth_cm = deferred(db.Column(db.Float), group='agriculture')
+    
+    is_irrigated = deferred(db.Column(db.Boolean, default=False), group='agriculture')
+    irrigation_type = deferred(db.Column(db.String(200)), group='agriculture')  # well, canal, drip, sprinkler
+    number_of_crops_per_year = deferred(db.Column(db.Integer), group='agriculture')
+    current_crop = deferred(db.Column(db.String(200)), group='agriculture')
+    previous_crops = deferred(db.Column(db.Text), group='agriculture')  # JSON array
+    crop_yield_per_acre = deferred(db.Column(db.Float), group='agriculture')
+    
+    has_trees = deferred(db.Column(db.Boolean, default=False), group='agriculture')
+    tree_count = deferred(db.Column(db.Integer), group='agriculture')
+    tree_types = deferred(db.Column(db.Text), group='agriculture')  # JSON
+    
+    is_organic_certified = deferred(db.Column(db.Boolean, default=False), group='agriculture')
+    organic_certification_number = deferred(db.Column(db.String(100)), group='agriculture')
     
     # ========== WATER RESOURCES (15 fields) ==========
-    water_source = db.Column(db.String(200))  # municipal, borewell, well, river
-    has_borewell = db.Column(db.Boolean, default=False)
-    borewell_depth_ft = db.Column(db.Float)
-    borewell_yield_gpm = db.Column(db.Float)
-    water_table_depth_ft = db.Column(db.Float)
+    water_source = deferred(db.Column(db.String(200)), group='water')  # municipal, borewell, well, river
+    has_borewell = deferred(db.Column(db.Boolean, default=False), group='water')
+    borewell_depth_ft = deferred(db.Column(db.Float), group='water')
+    borewell_yield_gpm = deferred(db.Column(db.Float), group='water')
+    water_table_depth_ft = deferred(db.Column(db.Float), group='water')
     
-    has_open_well = db.Column(db.Boolean, default=False)
-    well_depth_ft = db.Column(db.Float)
-    well_diameter_ft = db.Column(db.Float)
+    has_open_well = deferred(db.Column(db.Boolean, default=False), group='water')
+    well_depth_ft = deferred(db.Column(db.Float), group='water')
+    well_diameter_ft = deferred(db.Column(db.Float), group='water')
     
-    has_water_connection = db.Column(db.Boolean, default=False)
-    water_connection_type = db.Column(db.String(100))
-    water_meter_number = db.Column(db.String(100))
-    water_supply_hours_per_day = db.Column(db.Integer)
+    has_water_connection = deferred(db.Column(db.Boolean, default=False), group='water')
+    water_connection_type = deferred(db.Column(db.String(100)), group='water')
+    water_meter_number = deferred(db.Column(db.String(100)), group='water')
+    water_supply_hours_per_day = deferred(db.Column(db.Integer), group='water')
     
-    water_quality = db.Column(db.String(100))  # potable, non-potable, treated
-    water_testing_date = db.Column(db.Date)
-    water_storage_capacity_liters = db.Column(db.Integer)
+    water_quality = deferred(db.Column(db.String(100)), group='water')  # potable, non-potable, treated
+    water_testing_date = deferred(db.Column(db.Date), group='water')
+    water_storage_capacity_liters = deferred(db.Column(db.Integer), group='water')
     
     # ========== ELECTRICITY & UTILITIES (12 fields) ==========
-    has_electricity = db.Column(db.Boolean, default=False)
-    electricity_connection_type = db.Column(db.String(100))  # residential, commercial, industrial
-    electricity_load_kw = db.Column(db.Float)
-    electricity_meter_number = db.Column(db.String(100))
-    electricity_provider = db.Column(db.String(200))
-    has_three_phase = db.Column(db.Boolean, default=False)
+    has_electricity = deferred(db.Column(db.Boolean, default=False), group='utilities')
+    electricity_connection_type = deferred(db.Column(db.String(100)), group='utilities')  # residential, commercial, industrial
+    electricity_load_kw = deferred(db.Column(db.Float), group='utilities')
+    electricity_meter_number = deferred(db.Column(db.String(100)), group='utilities')
+    electricity_provider = deferred(db.Column(db.String(200)), group='utilities')
+    has_three_phase = deferred(db.Column(db.Boolean, default=False), group='utilities')
     
-    has_gas_connection = db.Column(db.Boolean, default=False)
-    gas_connection_number = db.Column(db.String(100))
+    has_gas_connection = deferred(db.Column(db.Boolean, default=False), group='utilities')
+    gas_connection_number = deferred(db.Column(db.String(100)), group='utilities')
     
-    has_solar_panels = db.Column(db.Boolean, default=False)
-    solar_capacity_kw = db.Column(db.Float)
+    has_solar_panels = deferred(db.Column(db.Boolean, default=False), group='utilities')
+    solar_capacity_kw = deferred(db.Column(db.Float), group='utilities')
     
-    has_generator = db.Column(db.Boolean, default=False)
-    generator_capacity_kva = db.Column(db.Float)
+    has_generator = deferred(db.Column(db.Boolean, default=False), group='utilities')
+    generator_capacity_kva = deferred(db.Column(db.Float), group='utilities')
     
     # ========== ROAD & ACCESS (10 fields) ==========
-    road_access = db.Column(db.String(100))  # direct, through common path
-    road_type = db.Column(db.String(100))  # paved, unpaved, tar, cement
-    road_width_ft = db.Column(db.Float)
-    road_condition = db.Column(db.String(100))  # excellent, good, average, poor
+    road_access = deferred(db.Column(db.String(100)), group='access')  # direct, through common path
+    road_type = deferred(db.Column(db.String(100)), group='access')  # paved, unpaved, tar, cement
+    road_width_ft = deferred(db.Column(db.Float), group='access')
+    road_condition = deferred(db.Column(db.String(100)), group='access')  # excellent, good, average, poor
     
-    distance_from_main_road_m = db.Column(db.Float)
-    nearest_bus_stop_km = db.Column(db.Float)
-    nearest_railway_station_km = db.Column(db.Float)
-    nearest_airport_km = db.Column(db.Float)
+    distance_from_main_road_m = deferred(db.Column(db.Float), group='access')
+    nearest_bus_stop_km = deferred(db.Column(db.Float), group='access')
+    nearest_railway_station_km = deferred(db.Column(db.Float), group='access')
+    nearest_airport_km = deferred(db.Column(db.Float), group='access')
     
-    access_road_ownership = db.Column(db.String(100))  # govt, private, common
-    right_of_way_width_ft = db.Column(db.Float)
+    access_road_ownership = deferred(db.Column(db.String(100)), group='access')  # govt, private, common
+    right_of_way_width_ft = deferred(db.Column(db.Float), group='access')
     
     # ========== INFRASTRUCTURE (15 fields) ==========
-    has_drainage = db.Column(db.Boolean, default=False)
-    drainage_type = db.Column(db.String(100))  # open, covered, underground
+    has_drainage = deferred(db.Column(db.Boolean, default=False), group='infrastructure')
+    drainage_type = deferred(db.Column(db.String(100)), group='infrastructure')  # open, covered, underground
     
-    has_sewage_connection = db.Column(db.Boolean, default=False)
-    sewage_type = db.Column(db.String(100))  # septic, municipal
+    has_sewage_connection = deferred(db.Column(db.Boolean, default=False), group='infrastructure')
+    sewage_type = deferred(db.Column(db.String(100)), group='infrastructure')  # septic, municipal
     
-    has_street_lights = db.Column(db.Boolean, default=False)
-    street_light_coverage = db.Column(db.String(100))
+    has_street_lights = deferred(db.Column(db.Boolean, default=False), group='infrastructure')
+    street_light_coverage = deferred(db.Column(db.String(100)), group='infrastructure')
     
-    has_compound_wall = db.Column(db.Boolean, default=False)
-    compound_wall_type = db.Column(db.String(100))
-    compound_wall_height_ft = db.Column(db.Float)
+    has_compound_wall = deferred(db.Column(db.Boolean, default=False), group='infrastructure')
+    compound_wall_type = deferred(db.Column(db.String(100)), group='infrastructure')
+    compound_wall_height_ft = deferred(db.Column(db.Float), group='infrastructure')
     
-    has_gate = db.Column(db.Boolean, default=False)
-    gate_type = db.Column(db.String(100))  # manual, automatic
+    has_gate = deferred(db.Column(db.Boolean, default=False), group='infrastructure')
+    gate_type = deferred(db.Column(db.String(100)), group='infrastructure')  # manual, automatic
     
-    has_security = db.Column(db.Boolean, default=False)
-    security_type = db.Column(db.String(100))  # guard, cctv, alarm
+    has_security = deferred(db.Column(db.Boolean, default=False), group='infrastructure')
+    security_type = deferred(db.Column(db.String(100)), group='infrastructure')  # guard, cctv, alarm
     
-    waste_management_type = db.Column(db.String(100))
-    green_coverage_percentage = db.Column(db.Float)
+    waste_management_type = deferred(db.Column(db.String(100)), group='infrastructure')
+    green_coverage_percentage = deferred(db.Column(db.Float), group='infrastructure')
     
     # ========== AMENITIES & SURROUNDINGS (20 fields) ==========
-    nearest_school_km = db.Column(db.Float)
-    school_names = db.Column(db.Text)  # JSON
+    nearest_school_km = deferred(db.Column(db.Float), group='surroundings')
+    school_names = deferred(db.Column(db.Text), group='surroundings')  # JSON
     
-    nearest_hospital_km = db.Column(db.Float)
-    hospital_names = db.Column(db.Text)  # JSON
+    nearest_hospital_km = deferred(db.Column(db.Float), group='surroundings')
+    hospital_names = deferred(db.Column(db.Text), group='surroundings')  # JSON
     
-    nearest_market_km = db.Column(db.Float)
-    nearest_bank_km = db.Column(db.Float)
-    nearest_atm_km = db.Column(db.Float)
-    nearest_post_office_km = db.Column(db.Float)
-    nearest_police_station_km = db.Column(db.Float)
+    nearest_market_km = deferred(db.Column(db.Float), group='surroundings')
+    nearest_bank_km = deferred(db.Column(db.Float), group='surroundings')
+    nearest_atm_km = deferred(db.Column(db.Float), group='surroundings')
+    nearest_post_office_km = deferred(db.Column(db.Float), group='surroundings')
+    nearest_police_station_km = deferred(db.Column(db.Float), group='surroundings')
     
-    nearest_temple_km = db.Column(db.Float)
-    nearest_mosque_km = db.Column(db.Float)
-    nearest_church_km = db.Column(db.Float)
+    nearest_temple_km = deferred(db.Column(db.Float), group='surroundings')
+    nearest_mosque_km = deferred(db.Column(db.Float), group='surroundings')
+    nearest_church_km = deferred(db.Column(db.Float), group='surroundings')
     
-    nearest_park_km = db.Column(db.Float)
-    nearest_playground_km = db.Column(db.Float)
+    nearest_park_km = deferred(db.Column(db.Float), group='surroundings')
+    nearest_playground_km = deferred(db.Column(db.Float), group='surroundings')
     
-    connectivity_rating = db.Column(db.Integer)  # 1-10
-    locality_rating = db.Column(db.Integer)  # 1-10
+    connectivity_rating = deferred(db.Column(db.Integer), group='surroundings')  # 1-10
+    locality_rating = deferred(db.Column(db.Integer), group='surroundings')  # 1-10
     
-    nearby_amenities = db.Column(db.Text)  # JSON list
-    nearby_nuisances = db.Column(db.Text)  # pollution, noise, etc
+    nearby_amenities = deferred(db.Column(db.Text), group='surroundings')  # JSON list
+    nearby_nuisances = deferred(db.Column(db.Text), group='surroundings')  # pollution, noise, etc
     
-    neighborhood_type = db.Column(db.String(100))  # posh, middle-class, developing
-    future_development_potential = db.Column(db.Text)
+    neighborhood_type = deferred(db.Column(db.String(100)), group='surroundings')  # posh, middle-class, developing
+    future_development_potential = deferred(db.Column(db.Text), group='surroundings')
     
     # ========== ENVIRONMENTAL (10 fields) ==========
-    flood_zone = db.Column(db.Boolean, default=False)
-    flood_history = db.Column(db.Text)
+    flood_zone = deferred(db.Column(db.Boolean, default=False), group='environment')
+    flood_history = deferred(db.Column(db.Text), group='environment')
     
-    earthquake_zone = db.Column(db.String(50))  # Zone I-V
-    cyclone_prone = db.Column(db.Boolean, default=False)
+    earthquake_zone = deferred(db.Column(db.String(50)), group='environment')  # Zone I-V
+    cyclone_prone = deferred(db.Column(db.Boolean, default=False), group='environment')
     
-    pollution_level = db.Column(db.String(100))  # low, medium, high
-    noise_level = db.Column(db.String(100))
+    pollution_level = deferred(db.Column(db.String(100)), group='environment')  # low, medium, high
+    noise_level = deferred(db.Column(db.String(100)), group='environment')
     
-    has_water_body_nearby = db.Column(db.Boolean, default=False)
-    water_body_type = db.Column(db.String(100))  # river, lake, pond
-    water_body_distance_m = db.Column(db.Float)
+    has_water_body_nearby = deferred(db.Column(db.Boolean, default=False), group='environment')
+    water_body_type = deferred(db.Column(db.String(100)), group='environment')  # river, lake, pond
+    water_body_distance_m = deferred(db.Column(db.Float), group='environment')
     
-    air_quality_index = db.Column(db.Integer)
+    air_quality_index = deferred(db.Column(db.Integer), group='environment')
     
     # ========== LEGAL & DOCUMENTATION (20 fields) ==========
-    deed_number = db.Column(db.String(100))
-    deed_type = db.Column(db.String(100))  # sale, gift, inheritance
-    deed_date = db.Column(db.Date)
+    deed_number = deferred(db.Column(db.String(100)), group='legal')
+    deed_type = deferred(db.Column(db.String(100)), group='legal')  # sale, gift, inheritance
+    deed_date = deferred(db.Column(db.Date), group='legal')
     
-    registration_number = db.Column(db.String(100))
-    registration_office = db.Column(db.String(200))
-    sro_location = db.Column(db.String(200))  # Sub-Registrar Office
+    registration_number = deferred(db.Column(db.String(100)), group='legal')
+    registration_office = deferred(db.Column(db.String(200)), group='legal')
+    sro_location = deferred(db.Column(db.String(200)), group='legal')  # Sub-Registrar Office
     
-    document_7_12 = db.Column(db.String(100))  # Maharashtra specific
-    document_8_a = db.Column(db.String(100))
-    property_card_number = db.Column(db.String(100))
+    document_7_12 = deferred(db.Column(db.String(100)), group='legal')  # Maharashtra specific
+    document_8_a = deferred(db.Column(db.String(100)), group='legal')
+    property_card_number = deferred(db.Column(db.String(100)), group='legal')
     
-    has_clear_title = db.Column(db.Boolean, default=True)
-    title_verification_date = db.Column(db.Date)
-    title_verification_report = db.Column(db.String(500))
+    has_clear_title = deferred(db.Column(db.Boolean, default=True), group='legal')
+    title_verification_date = deferred(db.Column(db.Date), group='legal')
+    title_verification_report = deferred(db.Column(db.String(500)), group='legal')
     
-    has_encumbrance = db.Column(db.Boolean, default=False)
-    encumbrance_details = db.Column(db.Text)
-    encumbrance_certificate_date = db.Column(db.Date)
+    has_encumbrance = deferred(db.Column(db.Boolean, default=False), group='legal')
+    encumbrance_details = deferred(db.Column(db.Text), group='legal')
+    encumbrance_certificate_date = deferred(db.Column(db.Date), group='legal')
     
-    mutation_status = db.Column(db.String(100))  # pending, completed
-    mutation_certificate_number = db.Column(db.String(100))
+    mutation_status = deferred(db.Column(db.String(100)), group='legal')  # pending, completed
+    mutation_certificate_number = deferred(db.Column(db.String(100)), group='legal')
     
-    legal_disputes = db.Column(db.Text)
-    court_cases = db.Column(db.Text)  # JSON
-    legal_heirs_count = db.Column(db.Integer)
+    legal_disputes = deferred(db.Column(db.Text), group='legal')
+    court_cases = deferred(db.Column(db.Text), group='legal')  # JSON
+    legal_heirs_count = deferred(db.Column(db.Integer), group='legal')
     
     # ========== PLANNING & APPROVALS (15 fields) ==========
-    building_plan_approved = db.Column(db.Boolean, default=False)
-    building_plan_number = db.Column(db.String(100))
-    building_plan_approval_date = db.Column(db.Date)
-    approving_authority = db.Column(db.String(200))
+    building_plan_approved = deferred(db.Column(db.Boolean, default=False), group='planning')
+    building_plan_number = deferred(db.Column(db.String(100)), group='planning')
+    building_plan_approval_date = deferred(db.Column(db.Date), group='planning')
+    approving_authority = deferred(db.Column(db.String(200)), group='planning')
     
-    occupancy_certificate = db.Column(db.String(100))
-    occupancy_certificate_date = db.Column(db.Date)
+    occupancy_certificate = deferred(db.Column(db.String(100)), group='planning')
+    occupancy_certificate_date = deferred(db.Column(db.Date), group='planning')
     
-    commencement_certificate = db.Column(db.String(100))
-    completion_certificate = db.Column(db.String(100))
+    commencement_certificate = deferred(db.Column(db.String(100)), group='planning')
+    completion_certificate = deferred(db.Column(db.String(100)), group='planning')
     
-    fsi_far = db.Column(db.Float)  # Floor Space Index / Floor Area Ratio
-    ground_coverage = db.Column(db.Float)
-    permissible_fsi = db.Column(db.Float)
-    utilized_fsi = db.Column(db.Float)
+    fsi_far = deferred(db.Column(db.Float), group='planning')  # Floor Space Index / Floor Area Ratio
+    ground_coverage = deferred(db.Column(db.Float), group='planning')
+    permissible_fsi = deferred(db.Column(db.Float), group='planning')
+    utilized_fsi = deferred(db.Column(db.Float), group='planning')
     
-    development_agreement = db.Column(db.String(500))
-    rera_registration = db.Column(db.String(100))
-    rera_approval_date = db.Column(db.Date)
+    development_agreement = deferred(db.Column(db.String(500)), group='planning')
+    rera_registration = deferred(db.Column(db.String(100)), group='planning')
+    rera_approval_date = deferred(db.Column(db.Date), group='planning')
     
     # ========== VALUATION (15 fields) ==========
     market_value = db.Column(db.Float)
-    registered_value = db.Column(db.Float)
-    govt_guidance_value = db.Column(db.Float)
-    stamp_duty_paid = db.Column(db.Float)
-    registration_charges_paid = db.Column(db.Float)
+    registered_value = deferred(db.Column(db.Float), group='valuation')
+    govt_guidance_value = deferred(db.Column(db.Float), group='valuation')
+    stamp_duty_paid = deferred(db.Column(db.Float), group='valuation')
+    registration_charges_paid = deferred(db.Column(db.Float), group='valuation')
     
-    last_transaction_value = db.Column(db.Float)
-    last_transaction_date = db.Column(db.Date)
+    last_transaction_value = deferred(db.Column(db.Float), group='valuation')
+    last_transaction_date = deferred(db.Column(db.Date), group='valuation')
     
-    current_rental_value = db.Column(db.Float)
-    expected_rental_yield = db.Column(db.Float)
+    current_rental_value = deferred(db.Column(db.Float), group='valuation')
+    expected_rental_yield = deferred(db.Column(db.Float), group='valuation')
     
-    appreciation_rate_annual = db.Column(db.Float)
-    depreciation_value = db.Column(db.Float)
+    appreciation_rate_annual = deferred(db.Column(db.Float), group='valuation')
+    depreciation_value = deferred(db.Column(db.Float), group='valuation')
     
-    property_tax_annual = db.Column(db.Float)
-    maintenance_charges_annual = db.Column(db.Float)
+    property_tax_annual = deferred(db.Column(db.Float), group='valuation')
+    maintenance_charges_annual = deferred(db.Column(db.Float), group='valuation')
     
-    insurance_value = db.Column(db.Float)
-    insurance_policy_number = db.Column(db.String(100))
+    insurance_value = deferred(db.Column(db.Float), group='valuation')
+    insurance_policy_number = deferred(db.Column(db.String(100)), group='valuation')
     
     # ========== PREVIOUS OWNERSHIP (10 fields) ==========
-    previous_owner_name = db.Column(db.String(200))
-    previous_owner_relationship = db.Column(db.String(100))  # father, seller, etc
-    purchase_date = db.Column(db.Date)
-    purchase_price = db.Column(db.Float)
+    previous_owner_name = deferred(db.Column(db.String(200)), group='history')
+    previous_owner_relationship = deferred(db.Column(db.String(100)), group='history')  # father, seller, etc
+    purchase_date = deferred(db.Column(db.Date), group='history')
+    purchase_price = deferred(db.Column(db.Float), group='history')
     
-    ownership_duration_years = db.Column(db.Integer)
-    ownership_chain = db.Column(db.Text)  # JSON - history
+    ownership_duration_years = deferred(db.Column(db.Integer), group='history')
+    ownership_chain = deferred(db.Column(db.Text), group='history')  # JSON - history
     
-    inheritance_details = db.Column(db.Text)
-    gift_deed_details = db.Column(db.Text)
-    exchange_details = db.Column(db.Text)
-    partition_details = db.Column(db.Text)
+    inheritance_details = deferred(db.Column(db.Text), group='history')
+    gift_deed_details = deferred(db.Column(db.Text), group='history')
+    exchange_details = deferred(db.Column(db.Text), group='history')
+    partition_details = deferred(db.Column(db.Text), group='history')
     
     # ========== PHOTOS & MEDIA (5 fields) ==========
-    featured_image = db.Column(db.String(500))
-    property_images = db.Column(db.Text)  # JSON array
-    property_videos = db.Column(db.Text)  # JSON array
-    drone_images = db.Column(db.Text)  # JSON array
-    documents_scanned = db.Column(db.Text)  # JSON array
+    featured_image = deferred(db.Column(db.String(500)), group='media')
+    property_images = deferred(db.Column(db.Text), group='media')  # JSON array
+    property_videos = deferred(db.Column(db.Text), group='media')  # JSON array
+    drone_images = deferred(db.Column(db.Text), group='media')  # JSON array
+    documents_scanned = deferred(db.Column(db.Text), group='media')  # JSON array
     
     # ========== STATUS & WORKFLOW (10 fields) ==========
     status = db.Column(db.Enum('pending', 'under_review', 'documents_verified', 
@@ -389,9 +400,9 @@ class Property(db.Model):
     # ========== ADDITIONAL INFORMATION (5 fields) ==========
     description = db.Column(db.Text)
     remarks = db.Column(db.Text)
-    special_features = db.Column(db.Text)  # JSON
-    advantages = db.Column(db.Text)
-    disadvantages = db.Column(db.Text)
+    special_features = deferred(db.Column(db.Text), group='notes')  # JSON
+    advantages = deferred(db.Column(db.Text), group='notes')
+    disadvantages = deferred(db.Column(db.Text), group='notes')
     
     # ========== TIMESTAMPS (2 fields) ==========
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -412,6 +423,22 @@ class Property(db.Model):
     disputes = db.relationship('PropertyDispute', back_populates='property', cascade='all, delete-orphan', lazy='dynamic')
     mortgages = db.relationship('PropertyMortgage', back_populates='property', cascade='all, delete-orphan', lazy='dynamic')
     
+    @classmethod
+    def load_groups(cls, *groups):
+        """
+        Query options that load deferred column groups together with the row.
+        
+        Args:
+            *groups: Names from COLUMN_GROUPS (all groups when none are given)
+            
+        Returns:
+            list: undefer_group options, e.g. Property.query.options(*Property.load_groups('legal'))
+        """
+        for group in groups:
+            if group not in cls.COLUMN_GROUPS:
+                raise ValueError(f'Unknown property column group: {group}')
+        return [undefer_group(group) for group in groups or cls.COLUMN_GROUPS]
+    
     def generate_ulpin(self):
         if self.ulpin:
             return self.ulpin
@@ -13,6 +13,7 @@ from app.models.mutation import Mutation
 from app.models.payment import Payment
 from app.models.audit_log import AuditLog
 from app.utils.decorators import admin_required
+from app.utils.analytics_cache import get_metrics
 from app.forms.user_forms import UserManagementForm
 
 bp = Blueprint('admin', __name__)
@@ -24,25 +25,24 @@ bp = Blueprint('admin', __name__)
 def dashboard():
     """Admin dashboard with system-wide statistics."""
     
-    # Get statistics
-    total_users = User.query.count()
-    total_properties = Property.query.count()
-    pending_registrations = Property.query.filter_by(status='pending').count()
-    pending_mutations = Mutation.query.filter_by(status='pending').count()
+    # Get statistics (precomputed, see app/utils/analytics_cache.py)
+    metrics = get_metrics('property_stats', 'mutation_by_status', 'user_by_role', 'revenue_stats')
+    property_stats = metrics['property_stats']
+    mutations_by_status = dict(metrics['mutation_by_status'])
+    
+    total_properties = property_stats['total']
+    pending_registrations = property_stats['pending']
+    pending_mutations = mutations_by_status.get('pending', 0)
     
     # Revenue statistics
-    total_revenue = db.session.query(func.sum(Payment.amount)).filter(
-        Payment.status == 'completed'
-    ).scalar() or 0
+    total_revenue = metrics['revenue_stats']['total_revenue']
     
     # Recent activities
     recent_logs = AuditLog.query.order_by(AuditLog.created_at.desc()).limit(10).all()
     
     # User distribution by role
-    user_stats = db.session.query(
-        User.role,
-        func.count(User.id)
-    ).group_by(User.role).all()
+    user_stats = [tuple(pair) for pair in metrics['user_by_role']]
+    total_users = sum(count for role, count in user_stats)
     
     return render_template('admin/dashboard.html',
                          total_users=total_users,
@@ -214,16 +214,10 @@ def properties():
         page=page, per_page=50, error_out=False
     )
     
-    # Get mutation counts for each property
-    property_mutations = {}
-    for prop in properties_pagination.items:
-        mutation_count = Mutation.query.filter_by(property_id=prop.id).count()
-        mutations = Mutation.query.filter_by(property_id=prop.id).order_by(Mutation.created_at.desc()).all()
-        property_mutations[prop.id] = {
-            'count': mutation_count,
-            'mutations': mutations
-        }
-    
+    # Mutation summary for the whole page in one grouped query
+    # (the full history is on the property detail page)
+    property_mutations = Mutation.summaries([prop.id for prop in properties_pagination.items])
+
     return render_template('admin/properties.html', 
                          properties=properties_pagination,
                          property_mutations=property_mutations)
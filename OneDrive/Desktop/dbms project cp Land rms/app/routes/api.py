@@ -1,5 +1,10 @@
 """
 API routes for RESTful endpoints.
+
+List endpoints select only the columns they return. Clients pick them with
+?fields=a,b,c from the endpoint's allowlist; without it each endpoint returns
+the columns its list page displays. Columns outside the allowlist (user ids,
+payment details, internal remarks and notes) are never returned.
 """
 
 from flask import Blueprint, jsonify, request
@@ -8,67 +13,97 @@ from app.models.user import User
 from app.models.property import Property
 from app.models.mutation import Mutation
 from app.models.payment import Payment
+from app.utils.projection import parse_fields, project, row_to_dict
 
 bp = Blueprint('api', __name__)
 
+# Columns returned when no fields= parameter is given
+PROPERTY_LIST_FIELDS = ('id', 'ulpin', 'village_city', 'district', 'property_type',
+                        'area', 'area_unit', 'market_value', 'status')
+MUTATION_LIST_FIELDS = ('id', 'mutation_number', 'property_id', 'mutation_type', 'status',
+                        'description', 'priority', 'payment_status', 'created_at', 'approval_date')
+PAYMENT_LIST_FIELDS = ('id', 'payment_reference', 'transaction_id', 'payment_type', 'amount',
+                       'status', 'payment_method', 'payment_date', 'receipt_number')
 
-@bp.route('/properties', methods=['GET'])
-@login_required
-def get_properties():
-    """Get list of properties."""
+# Columns a client may request with fields=; the property detail endpoint returns all of its list
+PROPERTY_FIELDS = PROPERTY_LIST_FIELDS + (
+    'state', 'taluka', 'locality', 'pincode', 'latitude', 'longitude', 'survey_number',
+    'plot_number', 'sub_property_type', 'built_up_area', 'registration_date', 'approval_date',
+    'description', 'created_at', 'updated_at')
+MUTATION_FIELDS = MUTATION_LIST_FIELDS + (
+    'processing_date', 'rejection_date', 'mutation_certificate_number', 'certificate_issued_date',
+    'mutation_fee', 'escalated', 'updated_at')
+PAYMENT_FIELDS = PAYMENT_LIST_FIELDS + (
+    'property_id', 'tax_year', 'completed_date', 'receipt_issued_date', 'created_at')
+
+
+def paginated_projection(key, model, allowed_fields, default_fields, query=None):
+    """
+    Paginated list of projected rows for a list endpoint.
+
+    Args:
+        key: Name of the list in the response
+        model: SQLAlchemy model class
+        allowed_fields: Columns the request may ask for
+        default_fields: Columns returned when the request has no fields= parameter
+        query: Base query (defaults to all rows ordered by id)
+
+    Returns:
+        Response: JSON page, or a 400 error for fields outside the allowlist
+    """
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
-    
-    properties = Property.query.paginate(page=page, per_page=per_page, error_out=False)
-    
+
+    try:
+        fields = parse_fields(request.args.get('fields'), allowed_fields, default_fields)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    if query is None:
+        query = model.query.order_by(model.id)
+    rows = project(query, model, fields).paginate(page=page, per_page=per_page, error_out=False)
+
     return jsonify({
-        'properties': [p.to_dict() for p in properties.items],
-        'total': properties.total,
-        'pages': properties.pages,
+        key: [row_to_dict(row) for row in rows.items],
+        'fields': fields,
+        'total': rows.total,
+        'pages': rows.pages,
         'current_page': page
     })
 
 
+@bp.route('/properties', methods=['GET'])
+@login_required
+def get_properties():
+    """Get list of properties."""
+    return paginated_projection('properties', Property, PROPERTY_FIELDS, PROPERTY_LIST_FIELDS)
+
+
 @bp.route('/properties/<int:property_id>', methods=['GET'])
 @login_required
 def get_property(property_id):
-    """Get specific property details."""
-    property_obj = Property.query.get_or_404(property_id)
-    return jsonify(property_obj.to_dict())
+    """Get specific property details (every allowed column unless fields= is given)."""
+    try:
+        fields = parse_fields(request.args.get('fields'), PROPERTY_FIELDS, PROPERTY_FIELDS)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    property_obj = project(Property.query.filter_by(id=property_id), Property, fields).first_or_404()
+    return jsonify(row_to_dict(property_obj))
 
 
 @bp.route('/mutations', methods=['GET'])
 @login_required
 def get_mutations():
     """Get list of mutations."""
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int)
-    
-    mutations = Mutation.query.paginate(page=page, per_page=per_page, error_out=False)
-    
-    return jsonify({
-        'mutations': [m.to_dict() for m in mutations.items],
-        'total': mutations.total,
-        'pages': mutations.pages,
-        'current_page': page
-    })
+    return paginated_projection('mutations', Mutation, MUTATION_FIELDS, MUTATION_LIST_FIELDS)
 
 
 @bp.route('/payments', methods=['GET'])
 @login_required
 def get_payments():
     """Get list of payments."""
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 10, type=int)
-    
-    payments = Payment.query.paginate(page=page, per_page=per_page, error_out=False)
-    
-    return jsonify({
-        'payments': [p.to_dict() for p in payments.items],
-        'total': payments.total,
-        'pages': payments.pages,
-        'current_page': page
-    })
+    return paginated_projection('payments', Payment, PAYMENT_FIELDS, PAYMENT_LIST_FIELDS)
 
 
 @bp.route('/stats', methods=['GET'])
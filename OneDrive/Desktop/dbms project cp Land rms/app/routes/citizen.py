@@ -5,6 +5,7 @@ Citizen routes for property registration, mutations, and payments.
 from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_required, current_user
 from datetime import datetime, date
+from sqlalchemy.orm import joinedload
 from app.models import db
 from app.models.property import Property
 from app.models.owner import Owner
@@ -27,88 +28,19 @@ bp = Blueprint('citizen', __name__)
 @citizen_required
 def dashboard():
     """Citizen dashboard with advanced analytics."""
-    from sqlalchemy import func, extract
     from datetime import timedelta
+    from app.utils.citizen_summary import citizen_summaries
+    from app.utils.notification_cache import notification_cache
     
-    # Get user's properties
-    owner = Owner.query.filter_by(user_id=current_user.id).first()
-    my_properties_count = 0
-    approved_properties = 0
-    rejected_properties = 0
-    
-    if owner:
-        my_properties_count = owner.ownerships.filter_by(is_active=True).count()
-        approved_properties = Property.query.join(Ownership).join(Owner).filter(
-            Owner.user_id == current_user.id,
-            Property.status == 'approved'
-        ).count()
-        rejected_properties = Property.query.join(Ownership).join(Owner).filter(
-            Owner.user_id == current_user.id,
-            Property.status == 'rejected'
-        ).count()
-    
-    # Get pending applications
-    pending_properties = Property.query.join(Ownership).join(Owner).filter(
-        Owner.user_id == current_user.id,
-        Property.status.in_(['pending', 'under_review'])
-    ).count()
-    
-    # Mutation statistics
-    pending_mutations = Mutation.query.filter_by(
-        requester_id=current_user.id,
-        status='pending'
-    ).count()
-    
-    approved_mutations = Mutation.query.filter_by(
-        requester_id=current_user.id,
-        status='approved'
-    ).count()
-    
-    rejected_mutations = Mutation.query.filter_by(
-        requester_id=current_user.id,
-        status='rejected'
-    ).count()
-    
-    # Payment statistics
-    total_payments = Payment.query.filter_by(user_id=current_user.id).count()
-    total_amount_paid = db.session.query(func.sum(Payment.amount)).filter(
-        Payment.user_id == current_user.id,
-        Payment.status == 'completed'
-    ).scalar() or 0
-    
-    pending_payments = Payment.query.filter_by(
-        user_id=current_user.id,
-        status='pending'
-    ).count()
+    # Counts and totals, maintained on every change (see app/utils/citizen_summary.py)
+    summary = citizen_summaries.get(current_user.id)
     
     # Last 6 months payment trend
     six_months_ago = datetime.now() - timedelta(days=180)
-    monthly_payments = db.session.query(
-        extract('year', Payment.payment_date).label('year'),
-        extract('month', Payment.payment_date).label('month'),
-        func.sum(Payment.amount).label('total'),
-        func.count(Payment.id).label('count')
-    ).filter(
-        Payment.user_id == current_user.id,
-        Payment.payment_date >= six_months_ago
-    ).group_by('year', 'month').order_by('year', 'month').all()
-    
-    # Property by type breakdown
-    if owner:
-        property_by_type = db.session.query(
-            Property.property_type,
-            func.count(Property.id).label('count')
-        ).join(Ownership).join(Owner).filter(
-            Owner.user_id == current_user.id,
-            Ownership.is_active == True
-        ).group_by(Property.property_type).all()
-    else:
-        property_by_type = []
+    monthly_payments = summary.get_monthly_payments(six_months_ago)
     
-    # Recent notifications
-    recent_notifications = Notification.query.filter_by(
-        user_id=current_user.id
-    ).order_by(Notification.created_at.desc()).limit(5).all()
+    # Recent notifications (shared with the navbar)
+    recent_notifications = notification_cache.get(current_user.id)[1]
     
     # Payment history
     recent_payments = Payment.query.filter_by(
@@ -116,18 +48,19 @@ def dashboard():
     ).order_by(Payment.payment_date.desc()).limit(10).all()
     
     return render_template('citizen/dashboard.html',
-                         my_properties_count=my_properties_count,
-                         approved_properties=approved_properties,
-                         rejected_properties=rejected_properties,
-                         pending_properties=pending_properties,
-                         pending_mutations=pending_mutations,
-                         approved_mutations=approved_mutations,
-                         rejected_mutations=rejected_mutations,
-                         total_payments=total_payments,
-                         total_amount_paid=total_amount_paid,
-                         pending_payments=pending_payments,
+                         my_properties_count=summary.properties_count,
+                         approved_properties=summary.approved_properties,
+                         rejected_properties=summary.rejected_properties,
+                         pending_properties=summary.pending_properties,
+                         pending_mutations=summary.pending_mutations,
+                         approved_mutations=summary.approved_mutations,
+                         rejected_mutations=summary.rejected_mutations,
+                         total_payments=summary.total_payments,
+                         total_amount_paid=summary.total_amount_paid,
+                         pending_payments=summary.pending_payments,
+                         tax_due=summary.tax_due,
                          monthly_payments=monthly_payments,
-                         property_by_type=property_by_type,
+                         property_by_type=summary.get_property_types(),
                          recent_notifications=recent_notifications,
                          recent_payments=recent_payments,
                          current_date=datetime.now())
@@ -441,7 +374,10 @@ def my_mutations():
 @citizen_required
 def mutation_detail(mutation_id):
     """View detailed mutation information."""
-    mutation = Mutation.query.get_or_404(mutation_id)
+    # The page shows deferred property details (measurements, registered value)
+    mutation = Mutation.query.options(
+        joinedload(Mutation.property).options(*Property.load_groups('measurements', 'valuation'))
+    ).get_or_404(mutation_id)
     
     # Verify that this mutation belongs to the current user
     if mutation.requester_id != current_user.id:
@@ -5,42 +5,50 @@ Officer routes for mutation requests and ownership updates.
 from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_required, current_user
 from datetime import datetime
+from sqlalchemy.orm import joinedload
 from app.models import db
 from app.models.mutation import Mutation
+from app.models.property import Property
 from app.models.audit_log import AuditLog
 from app.utils.decorators import officer_required
 from app.utils.notification_utils import notify_mutation_status_change
+from app.utils.mutation_queue import mutation_queue, OPEN_STATUSES
 from app.forms.mutation_forms import MutationApprovalForm
 
 bp = Blueprint('officer', __name__)
 
 
+def _paginate(query, page, total):
+    """Paginate a mutation list whose total comes from the queue counters."""
+    pagination = query.paginate(page=page, per_page=50, error_out=False, count=False)
+    pagination.total = total
+    return pagination
+
+
 @bp.route('/dashboard')
 @login_required
 @officer_required
 def dashboard():
     """Officer dashboard."""
     
-    # Statistics - match the counts shown in pending_mutations page
+    # Work-queue counts from one read (see app/utils/mutation_queue.py)
+    queue = mutation_queue.summary()
+    
     # Pending includes: pending, under_review, and documents_verified statuses
-    pending_mutations = Mutation.query.filter(
-        Mutation.status.in_(['pending', 'under_review', 'documents_verified'])
-    ).count()
+    pending_mutations = queue.count(OPEN_STATUSES)
     
     # Under review count (subset of pending)
-    under_review = Mutation.query.filter_by(status='under_review').count()
+    under_review = queue.count('under_review')
     
     # My approvals - mutations approved by current officer
-    my_approvals = Mutation.query.filter_by(
-        processed_by=current_user.id, 
-        status='approved'
-    ).count()
+    my_approvals = queue.count('approved', officer_id=current_user.id)
     
     # Rejected - mutations rejected by current officer
-    rejected_count = Mutation.query.filter_by(
-        processed_by=current_user.id, 
-        status='rejected'
-    ).count()
+    rejected_count = queue.count('rejected', officer_id=current_user.id)
+    
+    # Pending queue by type and by age
+    pending_by_type = queue.by_type()
+    pending_by_age = queue.ages()
     
     # Recent mutations (last 5 for dashboard)
     recent_mutations = Mutation.query.order_by(Mutation.created_at.desc()).limit(5).all()
@@ -50,6 +58,8 @@ def dashboard():
                          under_review=under_review,
                          my_approvals=my_approvals,
                          rejected_count=rejected_count,
+                         pending_by_type=pending_by_type,
+                         pending_by_age=pending_by_age,
                          recent_mutations=recent_mutations)
 
 
@@ -60,11 +70,9 @@ def pending_mutations():
     """View pending mutation requests."""
     page = request.args.get('page', 1, type=int)
     
-    mutations_pagination = Mutation.query.filter(
-        Mutation.status.in_(['pending', 'under_review', 'documents_verified'])
-    ).order_by(Mutation.created_at.desc()).paginate(
-        page=page, per_page=50, error_out=False
-    )
+    mutations_pagination = _paginate(Mutation.query.filter(
+        Mutation.status.in_(OPEN_STATUSES)
+    ).order_by(Mutation.created_at.desc()), page, mutation_queue.summary().count(OPEN_STATUSES))
     
     return render_template('officer/pending_mutations.html', 
                          mutations=mutations_pagination)
@@ -75,7 +83,10 @@ def pending_mutations():
 @officer_required
 def view_mutation(mutation_id):
     """View mutation details."""
-    mutation = Mutation.query.get_or_404(mutation_id)
+    # The page shows the property's measurements and registration values, which are deferred
+    mutation = Mutation.query.options(
+        joinedload(Mutation.property).options(*Property.load_groups('measurements', 'valuation'))
+    ).get_or_404(mutation_id)
     form = MutationApprovalForm()
     
     return render_template('officer/mutation_detail.html', 
@@ -212,11 +223,9 @@ def under_review_mutations():
     """View mutations that are under review."""
     page = request.args.get('page', 1, type=int)
     
-    mutations_pagination = Mutation.query.filter_by(
+    mutations_pagination = _paginate(Mutation.query.filter_by(
         status='under_review'
-    ).order_by(Mutation.created_at.desc()).paginate(
-        page=page, per_page=50, error_out=False
-    )
+    ).order_by(Mutation.created_at.desc()), page, mutation_queue.summary().count('under_review'))
     
     return render_template('officer/under_review_mutations.html', 
                          mutations=mutations_pagination)
@@ -229,12 +238,11 @@ def rejected_mutations():
     """View mutations rejected by current officer."""
     page = request.args.get('page', 1, type=int)
     
-    mutations_pagination = Mutation.query.filter_by(
+    mutations_pagination = _paginate(Mutation.query.filter_by(
         processed_by=current_user.id,
         status='rejected'
-    ).order_by(Mutation.rejection_date.desc()).paginate(
-        page=page, per_page=50, error_out=False
-    )
+    ).order_by(Mutation.rejection_date.desc()), page,
+        mutation_queue.summary().count('rejected', officer_id=current_user.id))
     
     return render_template('officer/rejected_mutations.html', 
                          mutations=mutations_pagination)
@@ -247,11 +255,9 @@ def my_approvals():
     """View mutations approved by current officer."""
     page = request.args.get('page', 1, type=int)
     
-    mutations_pagination = Mutation.query.filter_by(
+    mutations_pagination = _paginate(Mutation.query.filter_by(
         processed_by=current_user.id
-    ).order_by(Mutation.approval_date.desc()).paginate(
-        page=page, per_page=50, error_out=False
-    )
+    ).order_by(Mutation.approval_date.desc()), page, mutation_queue.summary().count(officer_id=current_user.id))
     
     return render_template('officer/my_approvals.html', 
                          mutations=mutations_pagination)
@@ -12,6 +12,8 @@ from app.models.audit_log import AuditLog
 from app.models.user import User
 from app.utils.decorators import registrar_required
 from app.utils.notification_utils import notify_property_status_change
+from app.utils.analytics_cache import get_metrics
+from app.utils.mutation_queue import mutation_queue, OPEN_STATUSES
 from app.forms.property_forms import PropertyApprovalForm
 from sqlalchemy import func, or_
 
@@ -27,20 +29,26 @@ def dashboard():
     from app.models.user import User
     from sqlalchemy import func, and_, or_
     
+    # System-wide counts (precomputed, see app/utils/analytics_cache.py)
+    metrics = get_metrics('property_stats', 'property_by_status', 'property_by_type', 'user_by_role')
+    properties_by_status = dict(metrics['property_by_status'])
+    users_by_role = dict(metrics['user_by_role'])
+    
     # Property Statistics
-    pending_registrations = Property.query.filter_by(status='pending').count()
-    under_review = Property.query.filter_by(status='under_review').count()
-    approved_properties = Property.query.filter_by(status='approved').count()
-    rejected_properties = Property.query.filter_by(status='rejected').count()
+    pending_registrations = properties_by_status.get('pending', 0)
+    under_review = properties_by_status.get('under_review', 0)
+    approved_properties = properties_by_status.get('approved', 0)
+    rejected_properties = properties_by_status.get('rejected', 0)
     my_approvals = Property.query.filter_by(approved_by=current_user.id).count()
-    total_properties = Property.query.count()
+    total_properties = metrics['property_stats']['total']
     
-    # Mutation Statistics
-    pending_mutations = Mutation.query.filter(
-        Mutation.status.in_(['pending', 'under_review', 'documents_verified'])
-    ).count()
-    approved_mutations = Mutation.query.filter_by(status='approved').count()
-    rejected_mutations = Mutation.query.filter_by(status='rejected').count()
+    # Mutation Statistics (maintained work-queue counters, see app/utils/mutation_queue.py)
+    queue = mutation_queue.summary()
+    pending_mutations = queue.count(OPEN_STATUSES)
+    approved_mutations = queue.count('approved')
+    rejected_mutations = queue.count('rejected')
+    mutation_queue_by_type = queue.by_type()
+    mutation_queue_by_age = queue.ages()
     
     # Recent Activities - Properties
     recent_properties = Property.query.order_by(Property.created_at.desc()).limit(5).all()
@@ -48,15 +56,9 @@ def dashboard():
     # Recent Activities - Mutations
     recent_mutations = Mutation.query.order_by(Mutation.created_at.desc()).limit(5).all()
     
-    # Properties by type
-    property_by_type = db.session.query(
-        Property.property_type, func.count(Property.id).label('count')
-    ).group_by(Property.property_type).all()
-    
-    # Properties by status
-    property_by_status = db.session.query(
-        Property.status, func.count(Property.id).label('count')
-    ).group_by(Property.status).all()
+    # Properties by type and status
+    property_by_type = [tuple(pair) for pair in metrics['property_by_type']]
+    property_by_status = [tuple(pair) for pair in metrics['property_by_status']]
     
     # Recent approvals by current registrar
     my_recent_approvals = Property.query.filter_by(
@@ -64,8 +66,8 @@ def dashboard():
     ).order_by(Property.approval_date.desc()).limit(5).all()
     
     # Users statistics
-    total_citizens = User.query.filter_by(role='citizen').count()
-    total_officers = User.query.filter_by(role='officer').count()
+    total_citizens = users_by_role.get('citizen', 0)
+    total_officers = users_by_role.get('officer', 0)
     
     return render_template('registrar/dashboard.html',
                          pending_registrations=pending_registrations,
@@ -77,6 +79,8 @@ def dashboard():
                          pending_mutations=pending_mutations,
                          approved_mutations=approved_mutations,
                          rejected_mutations=rejected_mutations,
+                         mutation_queue_by_type=mutation_queue_by_type,
+                         mutation_queue_by_age=mutation_queue_by_age,
                          recent_properties=recent_properties,
                          recent_mutations=recent_mutations,
                          property_by_type=property_by_type,
@@ -323,11 +327,10 @@ def reports_summary():
     pending_properties = Property.query.filter_by(status='pending').count()
     under_review = Property.query.filter_by(status='under_review').count()
 
-    total_mutations = Mutation.query.count()
-    approved_mutations = Mutation.query.filter_by(status='approved').count()
-    pending_mutations = Mutation.query.filter(
-        Mutation.status.in_(['pending', 'under_review', 'documents_verified'])
-    ).count()
+    queue = mutation_queue.summary()
+    total_mutations = queue.count()
+    approved_mutations = queue.count('approved')
+    pending_mutations = queue.count(OPEN_STATUSES)
 
     return jsonify({
         'properties': {
@@ -0,0 +1,159 @@
+"""
+Dashboard metrics served from the analytics_cache table.
+`flask refresh-analytics` recomputes every metric with portable SQLAlchemy
+queries and upserts one JSON row per metric (run it from cron or a
+scheduler). Dashboards read their metrics in one query and use them while they
+are younger than ANALYTICS_CACHE_MAX_AGE seconds; a missing or stale metric is
+computed live and written back, so only the first view after expiry pays for it.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import case, func
+from sqlalchemy.exc import SQLAlchemyError
+from app.models import db
+from app.models.analytics_cache import AnalyticsCache
+from app.models.property import Property
+from app.models.mutation import Mutation
+from app.models.payment import Payment
+from app.models.user import User
+from app.utils.upsert import upsert_statement
+
+
+def _count_if(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _pairs(rows):
+    """Group-by rows as JSON-friendly [key, count] pairs (keys may be NULL)."""
+    return [[key, int(count)] for key, count in rows]
+
+
+def _property_stats():
+    row = db.session.query(
+        func.count(Property.id),
+        _count_if(Property.status == 'approved'),
+        _count_if(Property.status == 'pending'),
+        _count_if(Property.status == 'rejected'),
+        func.sum(func.coalesce(Property.market_value, 0))
+    ).one()
+    return {
+        'total': int(row[0]),
+        'approved': int(row[1] or 0),
+        'pending': int(row[2] or 0),
+        'rejected': int(row[3] or 0),
+        'total_value': float(row[4] or 0)
+    }
+
+
+def _property_by_status():
+    return _pairs(db.session.query(Property.status, func.count(Property.id)).group_by(Property.status))
+
+
+def _property_by_type():
+    return _pairs(db.session.query(Property.property_type, func.count(Property.id)).group_by(Property.property_type))
+
+
+def _mutation_by_status():
+    return _pairs(db.session.query(Mutation.status, func.count(Mutation.id)).group_by(Mutation.status))
+
+
+def _user_by_role():
+    return _pairs(db.session.query(User.role, func.count(User.id)).group_by(User.role))
+
+
+def _revenue_stats():
+    now = datetime.utcnow()
+    month_start = datetime(now.year, now.month, 1)
+    year_start = datetime(now.year, 1, 1)
+    completed = Payment.status == 'completed'
+    row = db.session.query(
+        func.sum(case((completed, Payment.amount), else_=0)),
+        func.sum(case((Payment.status == 'pending', Payment.amount), else_=0)),
+        func.sum(case((completed & (Payment.payment_date >= month_start), Payment.amount), else_=0)),
+        func.sum(case((completed & (Payment.payment_date >= year_start), Payment.amount), else_=0))
+    ).one()
+    return {
+        'total_revenue': float(row[0] or 0),
+        'pending_revenue': float(row[1] or 0),
+        'this_month': float(row[2] or 0),
+        'this_year': float(row[3] or 0)
+    }
+
+
+# Metric key -> live computation (property_stats and revenue_stats have the
+# same shape as the rows written by the MySQL procedure)
+METRICS = {
+    'property_stats': _property_stats,
+    'property_by_status': _property_by_status,
+    'property_by_type': _property_by_type,
+    'mutation_by_status': _mutation_by_status,
+    'user_by_role': _user_by_role,
+    'revenue_stats': _revenue_stats
+}
+
+
+def _store(values):
+    """Upsert computed metrics and commit."""
+    now = datetime.utcnow()
+    rows = [{'cache_key': key, 'cache_value': json.dumps(value), 'last_updated': now}
+            for key, value in sorted(values.items())]
+    statement = upsert_statement(AnalyticsCache.__table__, ['cache_key'], db.session.get_bind().dialect.name)
+    db.session.execute(statement, rows)
+    db.session.commit()
+
+
+def refresh_analytics_cache(keys=None):
+    """
+    Recompute metrics and write them to analytics_cache (creating the table if needed).
+
+    Args:
+        keys: Metric keys to refresh (all of METRICS when None)
+
+    Returns:
+        tuple: (dict of key -> value, seconds taken)
+    """
+    started = time.perf_counter()
+    AnalyticsCache.__table__.create(bind=db.engine, checkfirst=True)
+    values = {key: METRICS[key]() for key in (keys or METRICS)}
+    _store(values)
+    return values, time.perf_counter() - started
+
+
+def get_metrics(*keys):
+    """
+    Dashboard metrics, from the cache when fresh enough.
+
+    Args:
+        *keys: Metric keys from METRICS
+
+    Returns:
+        dict: key -> metric value (dict, or list of [key, count] pairs)
+    """
+    max_age = current_app.config.get('ANALYTICS_CACHE_MAX_AGE', 0)
+    use_cache = max_age > 0
+    cached = {}
+    if use_cache:
+        cutoff = datetime.utcnow() - timedelta(seconds=max_age)
+        try:
+            rows = db.session.query(AnalyticsCache.cache_key, AnalyticsCache.cache_value).filter(
+                AnalyticsCache.cache_key.in_(keys),
+                AnalyticsCache.last_updated >= cutoff
+            ).all()
+            cached = {row.cache_key: json.loads(row.cache_value) for row in rows}
+        except SQLAlchemyError:
+            # Table not created yet (`flask refresh-analytics` creates it): compute live
+            db.session.rollback()
+            use_cache = False
+
+    cold = {key: METRICS[key]() for key in keys if key not in cached}
+    if cold and use_cache:
+        try:
+            _store(cold)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            current_app.logger.warning(f'Analytics cache not updated: {e}')
+
+    return {**cached, **cold}
@@ -0,0 +1,447 @@
+"""
+Maintenance of the per-user citizen dashboard summary.
+A flush listener turns every change to mutations, payments, ownerships,
+owners, tax assessments and property status/type into per-user deltas,
+computed from the changed rows' values before and after the flush. In the
+same transaction it locks the affected citizen_summaries rows in user id
+order, adds the counters and totals with increment upserts and merges the
+JSON breakdowns on the locked row. Concurrent changes for one user queue on
+the row instead of overwriting each other. The citizen dashboard then reads
+one row by primary key instead of running a dozen aggregates.
+
+On MySQL, approving a mutation closes the property's active ownerships in a
+database trigger (trg_update_mutation_ownership). The listener notes those
+ownerships before the flush and counts the ones the flush closed.
+
+Writes that bypass the ORM must delete the affected users' rows, which get()
+rebuilds on the next visit, as sp_auto_approve_simple_mutations in
+database/advanced_mysql_features.sql does, or be followed by rebuild()
+(flask rebuild-citizen-summaries).
+"""
+
+import json
+from collections import Counter, defaultdict
+from datetime import datetime
+from sqlalchemy import case, event, extract, func, inspect, select
+from sqlalchemy.orm import Session
+from app.models import db
+from app.models.citizen_summary import CitizenSummary
+from app.models.owner import Owner
+from app.models.ownership import Ownership
+from app.models.property import Property
+from app.models.mutation import Mutation
+from app.models.payment import Payment
+from app.models.tax_assessment import TaxAssessment
+from app.utils.upsert import upsert_statement
+
+# Counter and total columns, moved with increment upserts
+COUNTER_COLUMNS = ('properties_count', 'approved_properties', 'rejected_properties', 'pending_properties',
+                   'pending_mutations', 'approved_mutations', 'rejected_mutations',
+                   'total_payments', 'total_amount_paid', 'pending_payments', 'tax_due')
+
+MUTATION_COUNTERS = {'pending': 'pending_mutations', 'approved': 'approved_mutations',
+                     'rejected': 'rejected_mutations'}
+
+# Property columns shown in the summary
+PROPERTY_FIELDS = ('status', 'property_type')
+
+# Attributes whose values before the flush the deltas are computed from
+FIELDS = {
+    Mutation: ('requester_id', 'status'),
+    Payment: ('user_id', 'status', 'amount', 'payment_date'),
+    Ownership: ('owner_id', 'property_id', 'is_active'),
+    Owner: ('user_id',),
+    TaxAssessment: ('property_id', 'status', 'tax_due', 'annual_tax', 'tax_paid'),
+    Property: PROPERTY_FIELDS,
+}
+
+# session.info key: active ownerships of properties whose mutation the flush approves
+CLOSING_KEY = 'citizen_summary_closing_ownerships'
+
+
+def _values(instance, names, current):
+    """Attribute values after the flush (current=True) or before it."""
+    attrs = inspect(instance).attrs
+    values = []
+    for name in names:
+        history = attrs[name].history
+        if not current and history.deleted:
+            values.append(history.deleted[0])
+        else:
+            values.append(attrs[name].value)
+    return values
+
+
+def _states(instance, names, created, removed):
+    """(values, sign) pairs: the values before the flush count -1, the values after it +1."""
+    states = []
+    if not created:
+        states.append((_values(instance, names, False), -1))
+    if not removed:
+        states.append((_values(instance, names, True), 1))
+    return states
+
+
+def _load_replaced_value(target, value, oldvalue, initiator):
+    """No-op 'set' listener; registering it with active_history loads the replaced value into the history."""
+
+
+def _sum_if(condition, value=1):
+    return func.coalesce(func.sum(case((condition, value), else_=0)), 0)
+
+
+def _outstanding():
+    """Unpaid amount of one tax assessment row (SQL expression)."""
+    return func.coalesce(TaxAssessment.tax_due,
+                         TaxAssessment.annual_tax - func.coalesce(TaxAssessment.tax_paid, 0))
+
+
+def _unpaid(status, tax_due, annual_tax, tax_paid):
+    """Unpaid amount of one tax assessment, as _outstanding() counts it."""
+    if status == 'paid':
+        return 0.0
+    return tax_due if tax_due is not None else (annual_tax or 0) - (tax_paid or 0)
+
+
+def _mutation_terms(status):
+    column = MUTATION_COUNTERS.get(status)
+    return {column: 1} if column else {}
+
+
+def _payment_terms(status, amount, payment_date):
+    amount = amount or 0
+    terms = {'total_payments': 1,
+             'total_amount_paid': amount if status == 'completed' else 0,
+             'pending_payments': int(status == 'pending')}
+    if payment_date is not None:
+        terms[('monthly_total', payment_date.year, payment_date.month)] = amount
+        terms[('monthly_count', payment_date.year, payment_date.month)] = 1
+    return terms
+
+
+def _ownership_terms(is_active, measures):
+    """Contribution of one ownership record, given its property's (status, property_type, unpaid tax)."""
+    status, property_type, unpaid = measures
+    terms = {'approved_properties': int(status == 'approved'),
+             'rejected_properties': int(status == 'rejected'),
+             'pending_properties': int(status in ('pending', 'under_review'))}
+    if is_active:
+        terms.update({'properties_count': 1, ('property_types', property_type): 1, 'tax_due': unpaid})
+    return terms
+
+
+def _add(deltas, user_id, terms, sign):
+    if user_id is None:
+        return
+    for key, value in terms.items():
+        deltas[user_id][key] += sign * value
+
+
+class CitizenSummaries:
+    """Keeps citizen_summaries rows current with the data they summarize."""
+
+    def __init__(self):
+        self._listening = False
+
+    def setup_listeners(self):
+        """Register the flush listeners that move the affected users' rows."""
+        if self._listening:
+            return
+        event.listen(Session, 'before_flush', self._before_flush)
+        event.listen(Session, 'after_flush', self._after_flush)
+        for model, names in FIELDS.items():
+            for name in names:
+                event.listen(getattr(model, name), 'set', _load_replaced_value, active_history=True)
+        self._listening = True
+
+    @staticmethod
+    def _before_flush(session, flush_context, instances):
+        """Note the active ownerships that an approval in this flush may close in the database."""
+        session.info.pop(CLOSING_KEY, None)
+        property_ids = set()
+        for instance in session.dirty:
+            if isinstance(instance, Mutation) and instance.status == 'approved':
+                history = inspect(instance).attrs.status.history
+                if history.deleted and history.deleted[0] != 'approved':
+                    property_ids.add(instance.property_id)
+        if property_ids:
+            session.info[CLOSING_KEY] = set(session.connection().execute(
+                select(Ownership.id).where(Ownership.property_id.in_(property_ids), Ownership.is_active == True)
+            ).scalars())
+
+    def _after_flush(self, session, flush_context):
+        # session.new/dirty/deleted and attribute history still describe the flushed changes here
+        closing = session.info.pop(CLOSING_KEY, set())
+        deltas = defaultdict(Counter)
+        holdings = []   # (ownership_id, (owner_id, property_id, is_active) before, same after); None when absent
+        moved = {}      # property_id: [(status, property_type) before or None, unpaid tax delta]
+        recount = set()
+
+        def property_change(property_id):
+            return moved.setdefault(property_id, [None, 0.0])
+
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+            if instance in session.dirty and not session.is_modified(instance):
+                continue
+            created, removed = instance in session.new, instance in session.deleted
+            if isinstance(instance, Mutation):
+                for (requester_id, status), sign in _states(instance, FIELDS[Mutation], created, removed):
+                    _add(deltas, requester_id, _mutation_terms(status), sign)
+            elif isinstance(instance, Payment):
+                for (user_id, *payment), sign in _states(instance, FIELDS[Payment], created, removed):
+                    _add(deltas, user_id, _payment_terms(*payment), sign)
+            elif isinstance(instance, Ownership):
+                before = None if created else tuple(_values(instance, FIELDS[Ownership], False))
+                after = None if removed else tuple(_values(instance, FIELDS[Ownership], True))
+                if before != after:
+                    holdings.append((instance.id, before, after))
+            elif isinstance(instance, TaxAssessment):
+                for (property_id, *tax), sign in _states(instance, FIELDS[TaxAssessment], created, removed):
+                    property_change(property_id)[1] += sign * _unpaid(*tax)
+            elif isinstance(instance, Owner) and not created:
+                # Every ownership of the owner changes user: recount both users
+                before, = _values(instance, FIELDS[Owner], False)
+                after, = _values(instance, FIELDS[Owner], True)
+                if removed or before != after:
+                    recount.update((before, after))
+            elif isinstance(instance, Property) and not created and not removed:
+                state = inspect(instance)
+                if any(state.attrs[field].history.has_changes() for field in PROPERTY_FIELDS):
+                    property_change(instance.id)[0] = tuple(_values(instance, PROPERTY_FIELDS, False))
+
+        moved = {property_id: change for property_id, change in moved.items()
+                 if property_id is not None and (change[0] is not None or change[1])}
+        if not (deltas or holdings or moved or recount or closing):
+            return
+        connection = session.connection()
+
+        touched = {ownership_id for ownership_id, _, _ in holdings}
+        closing -= touched
+        if closing:
+            for ownership_id, owner_id, property_id in connection.execute(
+                select(Ownership.id, Ownership.owner_id, Ownership.property_id)
+                .where(Ownership.id.in_(closing), Ownership.is_active == False)
+            ):
+                holdings.append((ownership_id, (owner_id, property_id, True), (owner_id, property_id, False)))
+                touched.add(ownership_id)
+
+        property_ids = set(moved)
+        for _, before, after in holdings:
+            property_ids.update(state[1] for state in (before, after) if state)
+        current = {}
+        if property_ids:
+            unpaid = select(func.coalesce(func.sum(case((TaxAssessment.status != 'paid', _outstanding()), else_=0)), 0)
+                            ).where(TaxAssessment.property_id == Property.id).scalar_subquery()
+            for property_id, status, property_type, tax in connection.execute(
+                select(Property.id, Property.status, Property.property_type, unpaid).where(Property.id.in_(property_ids))
+            ):
+                current[property_id] = (status, property_type, float(tax or 0))
+        previous = {}
+        for property_id, (status, property_type, tax) in current.items():
+            fields_before, unpaid_delta = moved.get(property_id, (None, 0.0))
+            previous[property_id] = tuple(fields_before or (status, property_type)) + (tax - unpaid_delta,)
+
+        # Holders whose ownership did not change still see their property's status, type or tax move
+        changed = sorted(property_id for property_id in moved
+                         if property_id in current and current[property_id] != previous[property_id])
+        if changed:
+            holders = select(Ownership.id, Ownership.owner_id, Ownership.property_id, Ownership.is_active).where(
+                Ownership.property_id.in_(changed))
+            if touched:
+                holders = holders.where(Ownership.id.notin_(touched))
+            for ownership_id, owner_id, property_id, is_active in connection.execute(holders):
+                holdings.append((ownership_id, (owner_id, property_id, is_active), (owner_id, property_id, is_active)))
+
+        owner_ids = {state[0] for _, before, after in holdings for state in (before, after) if state}
+        users = {}
+        if owner_ids:
+            users = dict(connection.execute(select(Owner.id, Owner.user_id).where(Owner.id.in_(owner_ids))).all())
+        for _, before, after in holdings:
+            for state, measures, sign in ((before, previous, -1), (after, current, 1)):
+                if state is None:
+                    continue
+                owner_id, property_id, is_active = state
+                user_id = users.get(owner_id)
+                if user_id is None:
+                    continue
+                if property_id not in measures:
+                    # Property deleted in the same transaction: its old figures are gone
+                    recount.add(user_id)
+                    continue
+                _add(deltas, user_id, _ownership_terms(is_active, measures[property_id]), sign)
+
+        self.apply(connection, deltas, recount)
+
+    @staticmethod
+    def compute(connection, user_ids):
+        """
+        Summary rows for the given users, computed from the source tables.
+
+        Args:
+            connection: Connection to read from (sees the current transaction)
+            user_ids: IDs of the users to summarize
+
+        Returns:
+            list: Row dictionaries for citizen_summaries
+        """
+        user_ids = sorted(user_ids)
+        rows = {user_id: {'user_id': user_id, 'properties_count': 0, 'approved_properties': 0,
+                          'rejected_properties': 0, 'pending_properties': 0, 'property_types': [],
+                          'pending_mutations': 0, 'approved_mutations': 0, 'rejected_mutations': 0,
+                          'total_payments': 0, 'total_amount_paid': 0.0, 'pending_payments': 0,
+                          'monthly_payments': [], 'tax_due': 0.0}
+                for user_id in user_ids}
+
+        owned = select(Owner.user_id).join(Ownership, Ownership.owner_id == Owner.id).join(
+            Property, Property.id == Ownership.property_id
+        ).where(Owner.user_id.in_(user_ids)).group_by(Owner.user_id)
+        active = Ownership.is_active == True
+
+        # Property status counts cover every ownership record (as the dashboard always did),
+        # the property count only active ones
+        for row in connection.execute(owned.add_columns(
+            _sum_if(active),
+            _sum_if(Property.status == 'approved'),
+            _sum_if(Property.status == 'rejected'),
+            _sum_if(Property.status.in_(['pending', 'under_review']))
+        )):
+            rows[row[0]].update(properties_count=int(row[1]), approved_properties=int(row[2]),
+                                rejected_properties=int(row[3]), pending_properties=int(row[4]))
+
+        for user_id, property_type, count in connection.execute(
+            owned.where(active).add_columns(Property.property_type, func.count(Ownership.id))
+            .group_by(Property.property_type)
+        ):
+            rows[user_id]['property_types'].append([property_type, int(count)])
+
+        for user_id, tax_due in connection.execute(
+            owned.where(active, TaxAssessment.status != 'paid')
+            .join(TaxAssessment, TaxAssessment.property_id == Property.id)
+            .add_columns(func.sum(_outstanding()))
+        ):
+            rows[user_id]['tax_due'] = float(tax_due or 0)
+
+        for row in connection.execute(
+            select(Mutation.requester_id, _sum_if(Mutation.status == 'pending'),
+                   _sum_if(Mutation.status == 'approved'), _sum_if(Mutation.status == 'rejected'))
+            .where(Mutation.requester_id.in_(user_ids)).group_by(Mutation.requester_id)
+        ):
+            rows[row[0]].update(pending_mutations=int(row[1]), approved_mutations=int(row[2]),
+                                rejected_mutations=int(row[3]))
+
+        for row in connection.execute(
+            select(Payment.user_id, func.count(Payment.id),
+                   _sum_if(Payment.status == 'completed', Payment.amount), _sum_if(Payment.status == 'pending'))
+            .where(Payment.user_id.in_(user_ids)).group_by(Payment.user_id)
+        ):
+            rows[row[0]].update(total_payments=int(row[1]), total_amount_paid=float(row[2]),
+                                pending_payments=int(row[3]))
+
+        year = extract('year', Payment.payment_date)
+        month = extract('month', Payment.payment_date)
+        for user_id, payment_year, payment_month, total, count in connection.execute(
+            select(Payment.user_id, year, month, func.sum(Payment.amount), func.count(Payment.id))
+            .where(Payment.user_id.in_(user_ids)).group_by(Payment.user_id, year, month).order_by(year, month)
+        ):
+            rows[user_id]['monthly_payments'].append([int(payment_year), int(payment_month),
+                                                      float(total or 0), int(count)])
+
+        now = datetime.utcnow()
+        for row in rows.values():
+            row['property_types'] = json.dumps(row['property_types'])
+            row['monthly_payments'] = json.dumps(row['monthly_payments'])
+            row['updated_at'] = now
+        return list(rows.values())
+
+    def refresh(self, connection, user_ids):
+        """
+        Recompute and store the summary rows of the given users.
+        Also for bulk writes that bypass the ORM flush.
+        """
+        table = CitizenSummary.__table__
+        rows = self.compute(connection, user_ids)
+        connection.execute(upsert_statement(table, ['user_id'], connection.dialect.name), rows)
+
+    def apply(self, connection, deltas, recount=()):
+        """
+        Add per-user deltas to the stored rows, in the caller's transaction.
+        The rows are locked in user id order first, so concurrent changes for a
+        user queue instead of overwriting each other. Users in recount, and
+        users without a row yet, get their row recomputed instead.
+
+        Args:
+            connection: Connection of the current transaction
+            deltas: {user_id: {key: change}}, key being a counter column,
+                    ('property_types', property_type) or
+                    ('monthly_total' / 'monthly_count', year, month)
+            recount: IDs of users whose row is recomputed from the source tables
+        """
+        recount = {user_id for user_id in recount if user_id is not None}
+        deltas = {user_id: delta for user_id, delta in deltas.items()
+                  if user_id is not None and user_id not in recount and any(delta.values())}
+        user_ids = sorted(set(deltas) | recount)
+        if not user_ids:
+            return
+
+        table = CitizenSummary.__table__
+        stored = {row.user_id: row for row in connection.execute(
+            select(table).where(table.c.user_id.in_(user_ids)).order_by(table.c.user_id).with_for_update()
+        )}
+        rebuilt = sorted(recount | (set(deltas) - set(stored)))
+        if rebuilt:
+            self.refresh(connection, rebuilt)
+        rows = [self._moved_row(stored[user_id], deltas[user_id]) for user_id in sorted(deltas) if user_id in stored]
+        if rows:
+            connection.execute(upsert_statement(table, ['user_id'], connection.dialect.name,
+                                                increment=COUNTER_COLUMNS), rows)
+
+    @staticmethod
+    def _moved_row(row, delta):
+        """Upsert values for one locked row: counter changes plus the merged JSON breakdowns."""
+        values = dict.fromkeys(COUNTER_COLUMNS, 0)
+        types = Counter({property_type: count for property_type, count in json.loads(row.property_types or '[]')})
+        months = {(year, month): [total, count]
+                  for year, month, total, count in json.loads(row.monthly_payments or '[]')}
+        for key, change in delta.items():
+            if key in values:
+                values[key] += change
+            elif key[0] == 'property_types':
+                types[key[1]] += change
+            else:
+                month = months.setdefault(key[1:], [0.0, 0])
+                month[0 if key[0] == 'monthly_total' else 1] += change
+        values.update(
+            user_id=row.user_id,
+            property_types=json.dumps([[property_type, count] for property_type, count in types.items() if count > 0]),
+            monthly_payments=json.dumps([[year, month, total, count]
+                                         for (year, month), (total, count) in sorted(months.items()) if count > 0]),
+            updated_at=datetime.utcnow()
+        )
+        return values
+
+    def get(self, user_id):
+        """Summary row of a user, created on first use."""
+        summary = db.session.get(CitizenSummary, user_id)
+        if summary is None:
+            self.refresh(db.session.connection(), [user_id])
+            db.session.commit()
+            summary = db.session.get(CitizenSummary, user_id)
+        return summary
+
+    def rebuild(self, batch_size=500):
+        """
+        Recompute the rows of every user (after bulk imports or to check drift).
+
+        Returns:
+            int: Number of users refreshed
+        """
+        from app.models.user import User
+        user_ids = [row[0] for row in db.session.query(User.id).order_by(User.id)]
+        for offset in range(0, len(user_ids), batch_size):
+            self.refresh(db.session.connection(), user_ids[offset:offset + batch_size])
+            db.session.commit()
+        return len(user_ids)
+
+
+# Global citizen summaries instance
+citizen_summaries = CitizenSummaries()
@@ -0,0 +1,199 @@
+"""
+Maintained work-queue counters for mutations.
+A flush listener turns every mutation insert, delete, status transition,
+type change or reassignment into -1/+1 adjustments of
+mutation_queue_counters rows keyed by (status, mutation_type, officer,
+submission day). It applies them as atomic increments in the same
+transaction, so concurrent transitions cannot lose counts. Dashboards read
+the whole work-queue summary, including age buckets, in one grouped query
+over the counters whose size does not depend on the number of mutations.
+
+Writes that bypass the ORM must apply the same adjustments themselves, as
+sp_auto_approve_simple_mutations in database/advanced_mysql_features.sql does,
+or be followed by rebuild() (flask rebuild-mutation-queue).
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+from sqlalchemy import case, delete, event, func, inspect, insert, select
+from sqlalchemy.orm import Session
+from app.models import db
+from app.models.mutation import Mutation
+from app.models.mutation_queue import MutationQueueCounter
+from app.utils.upsert import upsert_statement
+
+# Statuses still waiting for an officer (the officer's "pending" queue)
+OPEN_STATUSES = ('pending', 'under_review', 'documents_verified')
+
+# Age buckets by days since submission: (label, oldest age in days or None)
+AGE_BUCKETS = (('0-7 days', 7), ('8-30 days', 30), ('31-90 days', 90), ('Over 90 days', None))
+
+# Mutation columns that decide a mutation's counter row
+KEY_FIELDS = ('status', 'mutation_type', 'processed_by')
+
+
+def _load_replaced_value(target, value, oldvalue, initiator):
+    """No-op 'set' listener; registering it with active_history loads the replaced value into the history."""
+
+
+def _key(values, created_at):
+    status, mutation_type, processed_by = values
+    return status, mutation_type, processed_by or 0, (created_at or datetime.utcnow()).date()
+
+
+def _old_values(instance):
+    """KEY_FIELDS values of an instance before the flush."""
+    state = inspect(instance)
+    values = []
+    for field in KEY_FIELDS:
+        history = state.attrs[field].history
+        if history.deleted:
+            values.append(history.deleted[0])
+        else:
+            values.append(getattr(instance, field))
+    return tuple(values)
+
+
+class QueueSummary:
+    """Mutation counts by status, type, officer and age bucket, from one read."""
+
+    def __init__(self, rows):
+        # rows: (status, mutation_type, officer_id, bucket index, count)
+        self.rows = rows
+
+    def count(self, statuses=None, mutation_type=None, officer_id=None):
+        """
+        Number of mutations matching the filters.
+
+        Args:
+            statuses: Status or tuple of statuses (all when None)
+            mutation_type: Mutation type (all when None)
+            officer_id: Processing officer ID (all when None)
+
+        Returns:
+            int: Matching mutations
+        """
+        if isinstance(statuses, str):
+            statuses = (statuses,)
+        return sum(row[4] for row in self.rows
+                   if (statuses is None or row[0] in statuses)
+                   and (mutation_type is None or row[1] == mutation_type)
+                   and (officer_id is None or row[2] == officer_id))
+
+    def by_type(self, statuses=OPEN_STATUSES):
+        """(mutation_type, count) tuples of the given statuses, largest first."""
+        counts = Counter()
+        for status, mutation_type, _, _, count in self.rows:
+            if status in statuses:
+                counts[mutation_type] += count
+        return counts.most_common()
+
+    def ages(self, statuses=OPEN_STATUSES, officer_id=None):
+        """(label, count) tuples for each of AGE_BUCKETS."""
+        counts = [0] * len(AGE_BUCKETS)
+        for status, _, officer, bucket, count in self.rows:
+            if status in statuses and (officer_id is None or officer == officer_id):
+                counts[bucket] += count
+        return [(label, counts[index]) for index, (label, _) in enumerate(AGE_BUCKETS)]
+
+
+class MutationQueue:
+    """Keeps mutation_queue_counters in step with the mutations table."""
+
+    def __init__(self):
+        self._listening = False
+
+    def setup_listeners(self):
+        """Register the flush listener that adjusts the counters."""
+        if self._listening:
+            return
+        event.listen(Session, 'after_flush', self._after_flush)
+        for field in KEY_FIELDS:
+            event.listen(getattr(Mutation, field), 'set', _load_replaced_value, active_history=True)
+        self._listening = True
+
+    def _after_flush(self, session, flush_context):
+        deltas = Counter()
+        for instance in session.new:
+            if isinstance(instance, Mutation):
+                deltas[_key([getattr(instance, field) for field in KEY_FIELDS], instance.created_at)] += 1
+        for instance in session.deleted:
+            if isinstance(instance, Mutation):
+                deltas[_key(_old_values(instance), instance.created_at)] -= 1
+        for instance in session.dirty:
+            if isinstance(instance, Mutation) and instance not in session.deleted:
+                state = inspect(instance)
+                if not any(state.attrs[field].history.has_changes() for field in KEY_FIELDS):
+                    continue
+                deltas[_key(_old_values(instance), instance.created_at)] -= 1
+                deltas[_key([getattr(instance, field) for field in KEY_FIELDS], instance.created_at)] += 1
+
+        rows = [{'status': key[0], 'mutation_type': key[1], 'officer_id': key[2],
+                 'created_on': key[3], 'mutation_count': delta}
+                for key, delta in sorted(deltas.items()) if delta]
+        if rows:
+            connection = session.connection()
+            statement = upsert_statement(MutationQueueCounter.__table__,
+                                         ['status', 'mutation_type', 'officer_id', 'created_on'],
+                                         connection.dialect.name, increment=['mutation_count'])
+            connection.execute(statement, rows)
+
+    @staticmethod
+    def summary():
+        """
+        Work-queue summary of all mutations.
+
+        Returns:
+            QueueSummary: Counts by status, type, officer and age bucket
+        """
+        today = datetime.utcnow().date()
+        bucket = case(*[(MutationQueueCounter.created_on >= today - timedelta(days=days), index)
+                        for index, (_, days) in enumerate(AGE_BUCKETS) if days is not None],
+                      else_=len(AGE_BUCKETS) - 1)
+        columns = (MutationQueueCounter.status, MutationQueueCounter.mutation_type,
+                   MutationQueueCounter.officer_id, bucket)
+        rows = db.session.execute(
+            select(*columns, func.sum(MutationQueueCounter.mutation_count))
+            .where(MutationQueueCounter.mutation_count != 0)
+            .group_by(*columns)
+        ).all()
+        return QueueSummary([(row[0], row[1], row[2], int(row[3]), int(row[4])) for row in rows])
+
+    def ensure_seeded(self):
+        """
+        Fill the counters once for databases that already hold mutations.
+        Also creates a missing counter table, which every mutation flush writes to.
+        """
+        tables = inspect(db.engine)
+        if not tables.has_table(Mutation.__tablename__):
+            return
+        if not tables.has_table(MutationQueueCounter.__tablename__):
+            MutationQueueCounter.__table__.create(bind=db.engine, checkfirst=True)
+        elif db.session.query(MutationQueueCounter.status).first() is not None:
+            return
+        if db.session.query(Mutation.id).first() is not None:
+            self.rebuild()
+
+    @staticmethod
+    def rebuild():
+        """
+        Recount every counter from the mutations table.
+
+        Returns:
+            int: Number of counter rows written
+        """
+        table = MutationQueueCounter.__table__
+        table.create(bind=db.engine, checkfirst=True)
+        created_on = func.date(Mutation.created_at)
+        columns = (Mutation.status, Mutation.mutation_type, func.coalesce(Mutation.processed_by, 0), created_on)
+        db.session.execute(delete(table))
+        result = db.session.execute(insert(table).from_select(
+            ['status', 'mutation_type', 'officer_id', 'created_on', 'mutation_count'],
+            select(*columns, func.count(Mutation.id)).group_by(*columns)
+        ))
+        db.session.commit()
+        return result.rowcount
+
+
+# Global mutation queue instance
+mutation_queue = MutationQueue()
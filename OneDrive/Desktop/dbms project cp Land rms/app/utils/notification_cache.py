@@ -0,0 +1,149 @@
+"""
+Per-user notification summary cache.
+The navbar on every page shows the unread count and the latest notifications.
+They are kept in process memory per user and dropped when a transaction that
+creates, reads or deletes one of the user's notifications commits, so page
+renders normally run no notification queries.
+
+On MySQL, database triggers also write notifications when a mutation is
+submitted or approved, an ownership is closed or a property changes status
+(trg_auto_send_mutation_notification, trg_detect_suspicious_mutations,
+trg_ownership_change_alert, after_property_status_update). Their recipients
+(owners, officers, admins) are chosen in SQL, so a commit that flushes such a
+change drops every entry of this process.
+
+Notifications written outside this process are only picked up when entries
+expire after NOTIFICATION_CACHE_TTL seconds. That covers other workers and
+the procedures run by MySQL events (sp_generate_tax_reminders,
+sp_auto_approve_simple_mutations).
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from flask import current_app
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.models import db
+from app.models.notification import Notification
+from app.models.mutation import Mutation
+from app.models.ownership import Ownership
+from app.models.property import Property
+
+# Detached copy of the notification fields the navbar shows
+NotificationSummary = namedtuple('NotificationSummary',
+                                 ['id', 'title', 'message', 'notification_type', 'priority',
+                                  'is_read', 'created_at'])
+
+RECENT_LIMIT = 5
+
+
+def _fires_notification_trigger(session, instance):
+    """Whether a flushed row fires one of the MySQL triggers that insert notifications."""
+    if isinstance(instance, Mutation):
+        return instance in session.new or inspect(instance).attrs.status.history.has_changes()
+    if isinstance(instance, Ownership):
+        return inspect(instance).attrs.is_active.history.has_changes()
+    if isinstance(instance, Property):
+        return instance not in session.new and inspect(instance).attrs.status.history.has_changes()
+    return False
+
+
+class NotificationCache:
+    """Unread count and recent notifications per user, invalidated on commit."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._listening = False
+
+    def setup_listeners(self):
+        """Register the session listeners that invalidate changed users."""
+        if self._listening:
+            return
+        event.listen(Session, 'after_flush', self._after_flush)
+        event.listen(Session, 'after_commit', self._after_commit)
+        event.listen(Session, 'after_rollback', self._after_rollback)
+        self._listening = True
+
+    def _after_flush(self, session, flush_context):
+        # None stands for every user: a database trigger may have notified anyone
+        user_ids = session.info.setdefault('notification_users', set())
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+            if isinstance(instance, Notification):
+                user_ids.add(instance.user_id)
+            elif None not in user_ids and _fires_notification_trigger(session, instance):
+                user_ids.add(None)
+
+    def _after_commit(self, session):
+        user_ids = session.info.pop('notification_users', None)
+        if None in (user_ids or ()):
+            self.invalidate()
+        elif user_ids:
+            self.invalidate(*user_ids)
+
+    def _after_rollback(self, session):
+        session.info.pop('notification_users', None)
+
+    def get(self, user_id):
+        """
+        Unread count and recent notifications of a user.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            tuple: (unread count, list of NotificationSummary, newest first)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                return entry[1], entry[2]
+            generation = self._generation
+
+        unread_count, recent = self._load(user_id)
+        self._store(user_id, now, generation, unread_count, recent)
+        return unread_count, recent
+
+    @staticmethod
+    def _load(user_id):
+        unread_count = Notification.query.filter_by(user_id=user_id, is_read=False).count()
+        rows = db.session.query(*[getattr(Notification, field) for field in NotificationSummary._fields]).filter(
+            Notification.user_id == user_id
+        ).order_by(Notification.created_at.desc()).limit(RECENT_LIMIT).all()
+        return unread_count, [NotificationSummary(*row) for row in rows]
+
+    def _store(self, user_id, now, generation, unread_count, recent):
+        ttl = current_app.config.get('NOTIFICATION_CACHE_TTL', 0)
+        size = current_app.config.get('NOTIFICATION_CACHE_SIZE', 0)
+        if ttl <= 0 or size <= 0:
+            return
+        with self._lock:
+            # An invalidation while loading means the rows read may already be stale
+            if generation != self._generation:
+                return
+            self._entries[user_id] = (now + ttl, unread_count, recent)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *user_ids):
+        """
+        Drop cached entries, e.g. after bulk writes that bypass the ORM session.
+
+        Args:
+            *user_ids: Users whose notifications changed (all users when none are given)
+        """
+        with self._lock:
+            self._generation += 1
+            if not user_ids:
+                self._entries.clear()
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+
+# Global notification cache instance
+notification_cache = NotificationCache()
@@ -0,0 +1,57 @@
+"""
+Column projection helpers for JSON list endpoints.
+Lets a client choose the columns it displays (?fields=ulpin,district,status)
+so list queries select only those columns and skip ORM object hydration.
+Each endpoint names the columns it may return; anything else is refused.
+"""
+
+from datetime import date, datetime
+
+
+def parse_fields(requested, allowed, default):
+    """
+    Resolve a comma-separated fields parameter against an endpoint's allowlist.
+
+    Args:
+        requested: Raw ?fields= value (None or empty for the default set)
+        allowed: Column names the endpoint may return
+        default: Field names used when nothing is requested
+
+    Returns:
+        list: Column names, primary key first
+
+    Raises:
+        ValueError: If a requested name is not in the allowlist (including 'all')
+    """
+    if not requested:
+        fields = list(default)
+    else:
+        fields = [name.strip() for name in requested.split(',') if name.strip()]
+        unknown = [name for name in fields if name not in allowed]
+        if unknown:
+            raise ValueError(f"Fields not available: {', '.join(unknown)} (available: {', '.join(allowed)})")
+
+    # Rows are always identified by their primary key
+    fields = ['id'] + [name for name in dict.fromkeys(fields) if name != 'id']
+    return fields
+
+
+def project(query, model, fields):
+    """
+    Restrict a model query to the given columns.
+
+    Args:
+        query: Query on the model (filters and ordering already applied)
+        model: SQLAlchemy model class
+        fields: Column names from parse_fields()
+
+    Returns:
+        Query returning plain rows instead of model instances
+    """
+    return query.with_entities(*[getattr(model, name) for name in fields])
+
+
+def row_to_dict(row):
+    """Convert a projected row to a JSON-serializable dictionary."""
+    return {key: (value.isoformat() if isinstance(value, (date, datetime)) else value)
+            for key, value in row._mapping.items()}
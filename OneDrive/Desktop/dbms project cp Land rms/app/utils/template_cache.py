@@ -0,0 +1,52 @@
+"""
+Jinja bytecode cache utilities.
+Shares compiled templates between worker processes through the filesystem,
+so a newly started worker does not recompile every template on first hit.
+"""
+
+import os
+import time
+from jinja2 import FileSystemBytecodeCache
+from jinja2.exceptions import TemplateSyntaxError
+
+
+def init_template_cache(app):
+    """
+    Attach a filesystem bytecode cache to the app's Jinja environment.
+    
+    Args:
+        app: Flask application instance (reads TEMPLATE_CACHE_DIR)
+        
+    Returns:
+        str: Cache directory, or None when TEMPLATE_CACHE_DIR is empty
+    """
+    directory = app.config.get('TEMPLATE_CACHE_DIR')
+    if not directory:
+        return None
+    
+    os.makedirs(directory, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+    return directory
+
+
+def precompile_templates(app):
+    """
+    Compile every loadable template (app and blueprints) into the bytecode cache.
+    
+    Args:
+        app: Flask application instance
+        
+    Returns:
+        tuple: (templates compiled, list of (template name, error), seconds taken)
+    """
+    started = time.perf_counter()
+    compiled, failed = 0, []
+    
+    for name in app.jinja_env.list_templates():
+        try:
+            app.jinja_env.get_template(name)
+            compiled += 1
+        except TemplateSyntaxError as e:
+            failed.append((name, f'line {e.lineno}: {e.message}'))
+    
+    return compiled, failed, time.perf_counter() - started
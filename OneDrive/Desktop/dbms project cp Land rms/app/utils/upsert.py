@@ -0,0 +1,36 @@
+"""
+Portable INSERT ... ON CONFLICT UPDATE for maintained summary tables.
+"""
+
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+
+def upsert_statement(table, key_columns, dialect_name, increment=()):
+    """
+    Insert statement that updates the existing row when the key already exists.
+
+    Args:
+        table: Table to write
+        key_columns: Names of the primary key (or unique) columns
+        dialect_name: 'mysql', 'postgresql' or 'sqlite'
+        increment: Names of columns to add to instead of overwrite (counters)
+
+    Returns:
+        Insert statement to execute with a list of row dictionaries
+    """
+    update_columns = [column.name for column in table.columns if column.name not in key_columns]
+    if dialect_name == 'mysql':
+        statement = mysql.insert(table)
+        return statement.on_duplicate_key_update(_new_values(table, update_columns, statement.inserted, increment))
+
+    dialect = postgresql if dialect_name == 'postgresql' else sqlite
+    statement = dialect.insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=list(key_columns),
+        set_=_new_values(table, update_columns, statement.excluded, increment)
+    )
+
+
+def _new_values(table, update_columns, proposed, increment):
+    return {name: table.c[name] + proposed[name] if name in increment else proposed[name]
+            for name in update_columns}
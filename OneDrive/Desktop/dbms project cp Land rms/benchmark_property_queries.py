@@ -0,0 +1,161 @@
+"""
+Property list query benchmark
+Compares loading property list pages with every column (as before the
+deferred column groups) against the default lean row, and reports latency,
+columns and bytes fetched, and on MySQL the InnoDB buffer pool page requests.
+
+Usage:
+    python benchmark_property_queries.py --seed 20000   # add synthetic properties first
+    python benchmark_property_queries.py --iterations 50
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+from app import create_app
+from app.models import db
+from app.models.property import Property
+from sqlalchemy import event
+
+
+def print_section(title):
+    print("\n" + "="*80)
+    print(f"  {title}")
+    print("="*80)
+
+
+def synthetic_value(column, rng):
+    """Plausible value for a property column, sized like real form input."""
+    python_type = column.type.python_type
+    if column.name == 'ulpin':
+        return None
+    if python_type is bool:
+        return rng.random() < 0.5
+    if python_type is int:
+        return rng.randint(1, 50)
+    if python_type is float:
+        return round(rng.uniform(1, 5000), 2)
+    if python_type is date:
+        return date(2015, 1, 1) + timedelta(days=rng.randint(0, 3500))
+    if python_type is datetime:
+        return datetime(2015, 1, 1) + timedelta(days=rng.randint(0, 3500))
+    if hasattr(column.type, 'enums'):
+        return rng.choice(column.type.enums)
+    if isinstance(column.type, db.Text):
+        # JSON arrays / free text: a few hundred bytes each
+        return json.dumps([f'{column.name} entry {n} ' + 'x' * rng.randint(20, 60) for n in range(rng.randint(2, 8))])
+    return f'{column.name[:20]} {rng.randint(1, 99999)}'[:column.type.length or 50]
+
+
+def seed_properties(count, batch_size=500):
+    """Insert synthetic properties with every column group filled in."""
+    rng = random.Random(42)
+    columns = [column for column in Property.__table__.columns if column.name != 'id']
+    districts = ['Pune', 'Mumbai', 'Nagpur', 'Nashik', 'Thane', 'Kolhapur']
+    started = time.perf_counter()
+
+    for offset in range(0, count, batch_size):
+        rows = []
+        for _ in range(min(batch_size, count - offset)):
+            row = {column.name: synthetic_value(column, rng) for column in columns}
+            row.update(state='Maharashtra', district=rng.choice(districts), approved_by=None,
+                       land_category_id=None, usage_type_id=None,
+                       status=rng.choice(['pending', 'approved', 'active', 'under_review']))
+            rows.append(row)
+        db.session.execute(Property.__table__.insert(), rows)
+        db.session.commit()
+
+    print(f"Inserted {count} properties in {time.perf_counter() - started:.1f}s")
+
+
+def buffer_pool_requests():
+    """InnoDB logical page reads so far (None on other databases)."""
+    if db.engine.dialect.name != 'mysql':
+        return None
+    row = db.session.execute(db.text("SHOW GLOBAL STATUS LIKE 'Innodb_buffer_pool_read_requests'")).first()
+    return int(row[1])
+
+
+def measure(name, build_query, iterations):
+    """Time a list query in both loading modes."""
+    results = {}
+    for mode, options in (('all columns', Property.load_groups()), ('lean row', [])):
+        query = build_query().options(*options)
+
+        # Capture the SQL the ORM emits, then read its raw result once to size it
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        event.listen(db.engine, 'before_cursor_execute', capture)
+        try:
+            query.all()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', capture)
+        statement, parameters = captured[0]
+        result = db.session.connection().exec_driver_sql(statement, parameters)
+        columns = len(result.keys())
+        rows = result.all()
+        fetched = sum(len(str(value)) for row in rows for value in row if value is not None)
+
+        timings = []
+        pages_before = buffer_pool_requests()
+        for _ in range(iterations):
+            db.session.expunge_all()
+            started = time.perf_counter()
+            query.all()
+            timings.append((time.perf_counter() - started) * 1000)
+        pages_after = buffer_pool_requests()
+
+        results[mode] = {
+            'columns': columns,
+            'rows': len(rows),
+            'kb_per_page': fetched / 1024,
+            'median_ms': statistics.median(timings),
+            'buffer_pool_requests': (pages_after - pages_before) / iterations if pages_before is not None else None
+        }
+
+    print(f"\n{name}")
+    for mode, stats in results.items():
+        pool = f"{stats['buffer_pool_requests']:.0f}" if stats['buffer_pool_requests'] is not None else 'n/a'
+        print(f"  {mode:<12} {stats['columns']:>4} columns  {stats['rows']:>4} rows  "
+              f"{stats['kb_per_page']:>8.1f} KB  {stats['median_ms']:>8.2f} ms  buffer pool reads/page: {pool}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Property list query benchmark')
+    parser.add_argument('--seed', type=int, default=0, help='insert this many synthetic properties first')
+    parser.add_argument('--iterations', type=int, default=30)
+    parser.add_argument('--per-page', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app(os.getenv('FLASK_ENV') or 'default')
+    with app.app_context():
+        db.engine.echo = False
+        if args.seed:
+            seed_properties(args.seed)
+
+        print_section(f"PROPERTY LIST QUERIES ({Property.query.count()} properties)")
+        per_page = args.per_page
+        measure(f'Admin properties page ({per_page} newest)',
+                lambda: Property.query.order_by(Property.created_at.desc()).limit(per_page), args.iterations)
+        measure(f'Registrar pending registrations ({per_page})',
+                lambda: Property.query.filter_by(status='pending').order_by(Property.created_at.desc()).limit(per_page),
+                args.iterations)
+        measure('Search by district (100 rows)',
+                lambda: Property.query.filter(Property.district == 'Pune').limit(100), args.iterations)
+
+
+if __name__ == '__main__':
+    main()
@@ -65,6 +65,19 @@ class Config:
     # Request escalation settings (in days)
     ESCALATION_THRESHOLD_DAYS = 7
     
+    # Compiled template cache shared by all workers (empty string disables)
+    # Fill it at build time with: flask precompile-templates
+    TEMPLATE_CACHE_DIR = os.environ.get('TEMPLATE_CACHE_DIR', os.path.join(basedir, 'instance', 'jinja_cache'))
+    
+    # Navbar notification summaries kept in memory per user (0 disables)
+    # Commits invalidate them in the same worker; the TTL bounds staleness across workers
+    NOTIFICATION_CACHE_TTL = int(os.environ.get('NOTIFICATION_CACHE_TTL', 30))
+    NOTIFICATION_CACHE_SIZE = 5000
+    
+    # Dashboard metrics older than this are recomputed live (0 always computes live)
+    # Keep it above the interval of the `flask refresh-analytics` job
+    ANALYTICS_CACHE_MAX_AGE = int(os.environ.get('ANALYTICS_CACHE_MAX_AGE', 900))
+    
     # Logging configuration
     LOG_FILE = os.path.join(basedir, 'logs', 'lrms.log')
     LOG_LEVEL = 'INFO'
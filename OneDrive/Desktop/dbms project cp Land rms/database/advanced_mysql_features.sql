@@ -243,9 +243,15 @@ BEGIN
     DECLARE v_mutation_id INT;
     DECLARE v_property_id INT;
     DECLARE v_transaction_amount DECIMAL(15,2);
+    DECLARE v_requester_id INT;
+    DECLARE v_mutation_type VARCHAR(30);
+    DECLARE v_officer_id INT;
+    DECLARE v_created_on DATE;
+    DECLARE v_approved INT DEFAULT 0;
     
     DECLARE mutation_cursor CURSOR FOR
-        SELECT m.id, m.property_id, m.transaction_amount
+        SELECT m.id, m.property_id, m.transaction_amount, m.requester_id, m.mutation_type,
+               COALESCE(m.processed_by, 0), DATE(m.created_at)
         FROM mutations m
         INNER JOIN properties p ON m.property_id = p.id
         WHERE m.status = 'pending'
@@ -263,17 +269,40 @@ BEGIN
     OPEN mutation_cursor;
     
     read_loop: LOOP
-        FETCH mutation_cursor INTO v_mutation_id, v_property_id, v_transaction_amount;
+        FETCH mutation_cursor INTO v_mutation_id, v_property_id, v_transaction_amount,
+                                   v_requester_id, v_mutation_type, v_officer_id, v_created_on;
         IF done THEN
             LEAVE read_loop;
         END IF;
         
-        -- Auto-approve the mutation
+        -- The application's flush listeners never see this UPDATE, so the summaries
+        -- they maintain (mutation_queue_counters, citizen_summaries) are adjusted here.
+        -- Citizen summaries of the requester and of the owners whose ownerships
+        -- trg_update_mutation_ownership closes: drop the rows, they are rebuilt
+        -- on the user's next dashboard visit
+        DELETE FROM citizen_summaries
+        WHERE user_id = v_requester_id
+           OR user_id IN (SELECT o.user_id
+                          FROM owners o
+                          INNER JOIN ownerships ow ON o.id = ow.owner_id
+                          WHERE ow.property_id = v_property_id AND ow.is_active = TRUE);
+        
+        -- Auto-approve the mutation (unless it left 'pending' since the cursor read it)
         UPDATE mutations 
         SET status = 'approved',
             approval_date = CURDATE(),
             officer_comments = 'Auto-approved: Simple mutation with no disputes'
-        WHERE id = v_mutation_id;
+        WHERE id = v_mutation_id AND status = 'pending';
+        
+        IF ROW_COUNT() > 0 THEN
+            SET v_approved = v_approved + 1;
+            
+            -- Work-queue counters: the same -1/+1 the application applies to a status transition
+            INSERT INTO mutation_queue_counters (status, mutation_type, officer_id, created_on, mutation_count)
+            VALUES ('pending', v_mutation_type, v_officer_id, v_created_on, -1),
+                   ('approved', v_mutation_type, v_officer_id, v_created_on, 1)
+            ON DUPLICATE KEY UPDATE mutation_count = mutation_count + VALUES(mutation_count);
+        END IF;
         
         -- Create notification
         INSERT INTO notifications (user_id, title, message, notification_type, is_read)
@@ -293,7 +322,7 @@ BEGIN
     CLOSE mutation_cursor;
     
     -- Return count of auto-approved mutations
-    SELECT ROW_COUNT() AS mutations_auto_approved;
+    SELECT v_approved AS mutations_auto_approved;
 END$$
 
 -- =====================================================
@@ -335,35 +364,35 @@ END$$
 -- =====================================================
 CREATE PROCEDURE sp_update_analytics_cache()
 BEGIN
-    -- Create temporary cache table if not exists
+    -- Same table and row format as `flask refresh-analytics` (last_updated in UTC)
     CREATE TABLE IF NOT EXISTS analytics_cache (
         cache_key VARCHAR(100) PRIMARY KEY,
         cache_value TEXT,
-        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        last_updated DATETIME NOT NULL
     );
     
     -- Update property statistics
-    INSERT INTO analytics_cache (cache_key, cache_value)
+    INSERT INTO analytics_cache (cache_key, cache_value, last_updated)
     SELECT 'property_stats', JSON_OBJECT(
         'total', COUNT(*),
-        'approved', SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END),
-        'pending', SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END),
-        'rejected', SUM(CASE WHEN status = 'rejected' THEN 1 ELSE 0 END),
-        'total_value', SUM(COALESCE(market_value, 0))
-    )
+        'approved', COALESCE(SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END), 0),
+        'pending', COALESCE(SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END), 0),
+        'rejected', COALESCE(SUM(CASE WHEN status = 'rejected' THEN 1 ELSE 0 END), 0),
+        'total_value', COALESCE(SUM(market_value), 0)
+    ), UTC_TIMESTAMP()
     FROM properties
-    ON DUPLICATE KEY UPDATE cache_value = VALUES(cache_value);
+    ON DUPLICATE KEY UPDATE cache_value = VALUES(cache_value), last_updated = VALUES(last_updated);
     
     -- Update revenue statistics
-    INSERT INTO analytics_cache (cache_key, cache_value)
+    INSERT INTO analytics_cache (cache_key, cache_value, last_updated)
     SELECT 'revenue_stats', JSON_OBJECT(
-        'total_revenue', SUM(CASE WHEN status = 'completed' THEN amount ELSE 0 END),
-        'pending_revenue', SUM(CASE WHEN status = 'pending' THEN amount ELSE 0 END),
-        'this_month', SUM(CASE WHEN status = 'completed' AND MONTH(payment_date) = MONTH(CURDATE()) THEN amount ELSE 0 END),
-        'this_year', SUM(CASE WHEN status = 'completed' AND YEAR(payment_date) = YEAR(CURDATE()) THEN amount ELSE 0 END)
-    )
+        'total_revenue', COALESCE(SUM(CASE WHEN status = 'completed' THEN amount ELSE 0 END), 0),
+        'pending_revenue', COALESCE(SUM(CASE WHEN status = 'pending' THEN amount ELSE 0 END), 0),
+        'this_month', COALESCE(SUM(CASE WHEN status = 'completed' AND payment_date >= DATE_FORMAT(UTC_TIMESTAMP(), '%Y-%m-01') THEN amount ELSE 0 END), 0),
+        'this_year', COALESCE(SUM(CASE WHEN status = 'completed' AND payment_date >= DATE_FORMAT(UTC_TIMESTAMP(), '%Y-01-01') THEN amount ELSE 0 END), 0)
+    ), UTC_TIMESTAMP()
     FROM payments
-    ON DUPLICATE KEY UPDATE cache_value = VALUES(cache_value);
+    ON DUPLICATE KEY UPDATE cache_value = VALUES(cache_value), last_updated = VALUES(last_updated);
     
     SELECT 'Analytics cache updated successfully' AS message;
 END$$
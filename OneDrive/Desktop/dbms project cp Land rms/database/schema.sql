@@ -462,6 +462,61 @@ CREATE TABLE IF NOT EXISTS property_status_history (
     INDEX idx_changed_at (changed_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- =====================================================
+-- TABLE: analytics_cache
+-- Description: Precomputed dashboard metrics (JSON per key)
+-- Refreshed by `flask refresh-analytics` or sp_update_analytics_cache
+-- =====================================================
+CREATE TABLE IF NOT EXISTS analytics_cache (
+    cache_key VARCHAR(100) PRIMARY KEY,
+    cache_value TEXT,
+    last_updated DATETIME NOT NULL  -- UTC
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- TABLE: citizen_summaries
+-- Description: Citizen dashboard counts per user, maintained by the application
+-- Raw SQL writes must delete the affected users' rows (rebuilt on next visit)
+-- Rebuild with `flask rebuild-citizen-summaries`
+-- =====================================================
+CREATE TABLE IF NOT EXISTS citizen_summaries (
+    user_id INT PRIMARY KEY,
+    properties_count INT NOT NULL DEFAULT 0,
+    approved_properties INT NOT NULL DEFAULT 0,
+    rejected_properties INT NOT NULL DEFAULT 0,
+    pending_properties INT NOT NULL DEFAULT 0,
+    property_types TEXT,
+    pending_mutations INT NOT NULL DEFAULT 0,
+    approved_mutations INT NOT NULL DEFAULT 0,
+    rejected_mutations INT NOT NULL DEFAULT 0,
+    total_payments INT NOT NULL DEFAULT 0,
+    total_amount_paid DOUBLE NOT NULL DEFAULT 0,
+    pending_payments INT NOT NULL DEFAULT 0,
+    monthly_payments TEXT,
+    tax_due DOUBLE NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL,
+    
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- TABLE: mutation_queue_counters
+-- Description: Mutation counts per status, type, officer and submission day,
+-- maintained by the application
+-- Raw SQL status/type/officer changes must apply the same -1/+1 upserts
+-- (see sp_auto_approve_simple_mutations)
+-- Rebuild with `flask rebuild-mutation-queue`
+-- =====================================================
+CREATE TABLE IF NOT EXISTS mutation_queue_counters (
+    status VARCHAR(30) NOT NULL,
+    mutation_type VARCHAR(30) NOT NULL,
+    officer_id INT NOT NULL DEFAULT 0,  -- processed_by, 0 when unassigned
+    created_on DATE NOT NULL,
+    mutation_count INT NOT NULL DEFAULT 0,
+    
+    PRIMARY KEY (status, mutation_type, officer_id, created_on)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- =====================================================
 -- END OF SCHEMA
 -- =====================================================
@@ -61,5 +61,49 @@ def seed_db():
     print('Database seeded successfully!')
 
 
+@app.cli.command('precompile-templates')
+def precompile_templates():
+    """Compile all templates into the bytecode cache (run at build time)."""
+    import click
+    from app.utils.template_cache import precompile_templates as compile_all
+    
+    if app.jinja_env.bytecode_cache is None:
+        raise click.ClickException('Template cache is disabled (set TEMPLATE_CACHE_DIR).')
+    
+    compiled, failed, elapsed = compile_all(app)
+    print(f'{compiled} templates compiled into {app.config["TEMPLATE_CACHE_DIR"]} in {elapsed:.2f}s')
+    for name, error in failed:
+        print(f'  {name}: {error}')
+    if failed:
+        raise click.ClickException(f'{len(failed)} templates failed to compile.')
+
+
+@app.cli.command('refresh-analytics')
+def refresh_analytics():
+    """Recompute the dashboard metrics in analytics_cache (schedule with cron)."""
+    from app.utils.analytics_cache import refresh_analytics_cache
+    
+    values, elapsed = refresh_analytics_cache()
+    print(f'{len(values)} metrics refreshed in {elapsed:.2f}s')
+
+
+@app.cli.command('rebuild-citizen-summaries')
+def rebuild_citizen_summaries():
+    """Recompute every citizen dashboard summary (after bulk SQL imports)."""
+    from app.utils.citizen_summary import citizen_summaries
+    
+    count = citizen_summaries.rebuild()
+    print(f'{count} citizen summaries rebuilt')
+
+
+@app.cli.command('rebuild-mutation-queue')
+def rebuild_mutation_queue():
+    """Recount the mutation work-queue counters (after bulk SQL imports)."""
+    from app.utils.mutation_queue import mutation_queue
+    
+    count = mutation_queue.rebuild()
+    print(f'{count} mutation queue counters rebuilt')
+
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
@@ -0,0 +1,118 @@
+"""
+Test Admin Properties Page - Verify the number of SQL statements is constant
+Renders the admin properties page for a page of properties without mutations
+and for a full page where every property has several mutations, and checks
+both run the same, pinned number of statements (no query per property).
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+from sqlalchemy import event
+from app import create_app
+from app.models import db
+from app.models.property import Property
+from app.models.mutation import Mutation
+from app.models.user import User
+
+# user load, property count, property page, mutation summaries
+EXPECTED_STATEMENTS = 4
+MARKER = 'QCTEST'
+
+def print_section(title):
+    print("\n" + "="*80)
+    print(f"  {title}")
+    print("="*80)
+
+def create_test_data(admin_id):
+    """A few properties without mutations and a full page with three mutations each"""
+    for district, count, mutations in ((f'{MARKER}-A', 5, 0), (f'{MARKER}-B', 50, 3)):
+        for n in range(count):
+            prop = Property(state='Maharashtra', district=district, village_city='Pune City',
+                            area=1000 + n, area_unit='sqft', status='approved')
+            db.session.add(prop)
+            db.session.flush()
+            for m in range(mutations):
+                db.session.add(Mutation(property_id=prop.id, requester_id=admin_id, mutation_type='sale',
+                                        description=f'{MARKER} mutation {m}',
+                                        status='approved' if m < mutations - 1 else 'pending'))
+    db.session.commit()
+
+def delete_test_data():
+    """Delete through the session so the flush listeners take the rows out of the maintained counters"""
+    properties = Property.query.filter(Property.district.like(f'{MARKER}-%')).all()
+    if properties:
+        for mutation in Mutation.query.filter(Mutation.property_id.in_([prop.id for prop in properties])):
+            db.session.delete(mutation)
+        db.session.flush()
+        for prop in properties:
+            db.session.delete(prop)
+    db.session.commit()
+
+def count_page_statements(app, engine, admin_id):
+    """Statements per render of each test page, each request in its own app context"""
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(admin_id)
+        session['_fresh'] = True
+
+    # Warm the per-user navbar notification cache
+    client.get(f'/admin/properties?search={MARKER}-A')
+
+    results = {}
+    event.listen(engine, 'before_cursor_execute', count_statement)
+    try:
+        for district, mutations in ((f'{MARKER}-A', 0), (f'{MARKER}-B', 150)):
+            statements.clear()
+            response = client.get(f'/admin/properties?search={district}')
+            results[district] = len(statements)
+            print(f"\n  {district}: HTTP {response.status_code}, {mutations} mutations on page, "
+                  f"{len(statements)} statements")
+            assert response.status_code == 200, f"{district} page returned {response.status_code}"
+            if district.endswith('B'):
+                assert b'3 Mutation(s)' in response.data, "Mutation summary missing from page"
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_statement)
+    return results
+
+def test_admin_properties_queries():
+    """Count statements per page render for both pages"""
+
+    print_section("ADMIN PROPERTIES QUERY COUNT TEST")
+
+    app = create_app(os.getenv('FLASK_ENV') or 'default')
+
+    with app.app_context():
+        db.engine.echo = False
+        engine = db.engine
+        admin = User.query.filter_by(role='admin').first()
+        assert admin, "No admin user found in database"
+        admin_id = admin.id
+        delete_test_data()
+        create_test_data(admin_id)
+
+    try:
+        results = count_page_statements(app, engine, admin_id)
+    finally:
+        with app.app_context():
+            delete_test_data()
+
+    assert set(results.values()) == {EXPECTED_STATEMENTS}, \
+        f"Expected {EXPECTED_STATEMENTS} statements per page, got {results}"
+    print(f"\n  ✓ Both pages ran {EXPECTED_STATEMENTS} statements")
+
+if __name__ == '__main__':
+    try:
+        test_admin_properties_queries()
+    except AssertionError as e:
+        print(f"\n✗ {e}")
+        sys.exit(1)
+    sys.exit(0)
@@ -0,0 +1,206 @@
+"""
+Test Maintained Summaries - Verify the flush listeners against a recount
+Makes every kind of change the listeners turn into deltas and checks after
+each commit that the mutation work-queue counters equal a fresh rebuild()
+and that the stored citizen_summaries rows equal citizen_summaries.compute().
+Runs against any database, e.g. DATABASE_URL=sqlite:///test.db.
+"""
+
+import json
+import os
+import sys
+from datetime import date, datetime
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+from sqlalchemy import func
+from app import create_app
+from app.models import db
+from app.models.citizen_summary import CitizenSummary
+from app.models.mutation import Mutation
+from app.models.mutation_queue import MutationQueueCounter
+from app.models.owner import Owner
+from app.models.ownership import Ownership
+from app.models.payment import Payment
+from app.models.property import Property
+from app.models.tax_assessment import TaxAssessment
+from app.models.user import User
+from app.utils.citizen_summary import citizen_summaries
+from app.utils.mutation_queue import mutation_queue
+
+MARKER = 'MSTEST'
+
+def print_section(title):
+    print("\n" + "="*80)
+    print(f"  {title}")
+    print("="*80)
+
+def queue_counters():
+    """Non-zero counters summed by status, type and officer"""
+    columns = (MutationQueueCounter.status, MutationQueueCounter.mutation_type, MutationQueueCounter.officer_id)
+    rows = db.session.query(*columns, func.sum(MutationQueueCounter.mutation_count)).group_by(*columns)
+    return {tuple(row[:3]): row[3] for row in rows if row[3]}
+
+def check_queue(step):
+    db.session.commit()
+    maintained = queue_counters()
+    mutation_queue.rebuild()
+    assert maintained == queue_counters(), f"Counters drifted after {step}"
+
+def _comparable(row):
+    values = {key: value for key, value in row.items() if key not in ('updated_at', 'user_id')}
+    for key in ('total_amount_paid', 'tax_due'):
+        values[key] = round(values[key], 2)
+    values['property_types'] = sorted(map(tuple, json.loads(values['property_types'] or '[]')))
+    values['monthly_payments'] = [(year, month, round(total, 2), count)
+                                  for year, month, total, count in json.loads(values['monthly_payments'] or '[]')]
+    return values
+
+def check_summaries(step, user_ids):
+    db.session.commit()
+    db.session.expire_all()
+    table = CitizenSummary.__table__
+    stored = {row.user_id: _comparable(row._asdict())
+              for row in db.session.execute(table.select().where(table.c.user_id.in_(user_ids)))}
+    expected = {row['user_id']: _comparable(row) for row in citizen_summaries.compute(db.session.connection(), user_ids)}
+    for user_id in user_ids:
+        assert user_id in stored, f"No summary row for user {user_id} after {step}"
+        assert stored[user_id] == expected[user_id], \
+            f"Summary of user {user_id} drifted after {step}: {stored[user_id]} != {expected[user_id]}"
+
+def delete_test_data():
+    """Delete through the session so the flush listeners take the rows out of both maintained tables"""
+    properties = Property.query.filter(Property.district == MARKER).all()
+    property_ids = [prop.id for prop in properties]
+    users = User.query.filter(User.email.like(f'{MARKER.lower()}%')).all()
+    user_ids = [user.id for user in users]
+    for model, column in ((Mutation, Mutation.property_id), (Ownership, Ownership.property_id),
+                          (TaxAssessment, TaxAssessment.property_id), (Payment, Payment.user_id)):
+        ids = user_ids if model is Payment else property_ids
+        for row in model.query.filter(column.in_(ids)):
+            db.session.delete(row)
+    db.session.flush()
+    for row in Owner.query.filter(Owner.full_name.like(f'{MARKER}%')).all() + properties:
+        db.session.delete(row)
+    db.session.flush()
+    CitizenSummary.query.filter(CitizenSummary.user_id.in_(user_ids)).delete(synchronize_session=False)
+    for user in users:
+        db.session.delete(user)
+    db.session.commit()
+
+def create_test_data():
+    """Two citizens with an owner record each, two properties and an officer"""
+    users = [User(email=f'{MARKER.lower()}{n}@example.com', full_name=f'{MARKER} User {n}',
+                  role='officer' if n == 2 else 'citizen') for n in range(3)]
+    for user in users:
+        user.set_password('pw')
+    db.session.add_all(users)
+    db.session.flush()
+    owners = [Owner(full_name=f'{MARKER} Owner {n}', user_id=users[n].id) for n in range(2)]
+    properties = [Property(state='Maharashtra', district=MARKER, village_city='Pune City', area=1000 + n,
+                           area_unit='sqft', status='approved', property_type=kind)
+                  for n, kind in enumerate(('residential', 'commercial'))]
+    db.session.add_all(owners + properties)
+    db.session.commit()
+    return users, owners, properties
+
+def exercise_mutations(users, properties):
+    citizen, officer = users[0], users[2]
+    mutations = [Mutation(property_id=properties[0].id, requester_id=citizen.id, mutation_type=kind,
+                          description=f'{MARKER} mutation') for kind in ('sale', 'gift', 'inheritance')]
+    db.session.add_all(mutations)
+    check_queue("mutation insert")
+
+    mutations[0].status = 'under_review'
+    mutations[0].processed_by = officer.id
+    check_queue("status change and assignment")
+    mutations[0].status = 'approved'
+    mutations[1].status = 'rejected'
+    check_queue("approval and rejection")
+
+    mutations[2].processed_by = officer.id
+    mutations[2].mutation_type = 'partition'
+    check_queue("reassignment")
+    mutations[2].requester_id = users[1].id
+    check_summaries("mutation requester change", [users[0].id, users[1].id])
+
+    db.session.delete(mutations[1])
+    check_queue("mutation delete")
+    check_summaries("mutations", [citizen.id, users[1].id])
+
+def exercise_summaries(users, owners, properties):
+    user_ids = [users[0].id, users[1].id]
+    first, second = properties
+    db.session.add_all([Ownership(property_id=first.id, owner_id=owners[0].id, acquisition_date=date(2024, 1, 1)),
+                        Ownership(property_id=second.id, owner_id=owners[0].id, acquisition_date=date(2024, 1, 1))])
+    check_summaries("ownership insert", user_ids)
+
+    payments = [Payment(payment_reference=f'{MARKER}-{n}', user_id=users[0].id, payment_type='property_tax',
+                        amount=amount, payment_date=datetime(2025, month, 5))
+                for n, (amount, month) in enumerate(((1200.5, 3), (300.0, 3), (99.25, 4)))]
+    db.session.add_all(payments)
+    check_summaries("payment insert", user_ids)
+    payments[0].status = 'completed'
+    payments[1].amount = 350.0
+    payments[2].payment_date = datetime(2025, 6, 1)
+    check_summaries("payment status, amount and date change", user_ids)
+    payments[1].user_id = users[1].id
+    check_summaries("payment user change", user_ids)
+    db.session.delete(payments[2])
+    check_summaries("payment delete", user_ids)
+
+    tax = TaxAssessment(property_id=first.id, assessment_year=2025, assessment_date=date(2025, 4, 1),
+                        assessed_value=100000, tax_rate=1.5, annual_tax=1500.0)
+    db.session.add(tax)
+    check_summaries("tax assessment insert", user_ids)
+    tax.tax_paid, tax.tax_due, tax.status = 500.0, 1000.0, 'partially_paid'
+    check_summaries("partial tax payment", user_ids)
+
+    first.status = 'under_review'
+    second.property_type = 'agricultural'
+    check_summaries("property status and type change", user_ids)
+
+    # Transfer: owner 0 hands the first property to owner 1 while its tax is paid in the same flush
+    held = Ownership.query.filter_by(property_id=first.id, owner_id=owners[0].id).one()
+    held.is_active, held.end_date = False, date(2025, 5, 1)
+    db.session.add(Ownership(property_id=first.id, owner_id=owners[1].id, acquisition_date=date(2025, 5, 1)))
+    tax.status = 'paid'
+    check_summaries("ownership transfer", user_ids)
+
+    Ownership.query.filter_by(property_id=second.id, owner_id=owners[0].id).one().owner_id = owners[1].id
+    check_summaries("ownership owner change", user_ids)
+    owners[0].user_id, owners[1].user_id = owners[1].user_id, owners[0].user_id
+    check_summaries("owner user change", user_ids)
+    db.session.delete(Ownership.query.filter_by(property_id=second.id).one())
+    check_summaries("ownership delete", user_ids)
+
+def test_maintained_summaries():
+    """Compare both maintained tables with a recount after every change"""
+
+    print_section("MAINTAINED SUMMARIES TEST")
+
+    app = create_app(os.getenv('FLASK_ENV') or 'default')
+
+    with app.app_context():
+        db.engine.echo = False
+        db.create_all()
+        delete_test_data()
+        try:
+            users, owners, properties = create_test_data()
+            exercise_mutations(users, properties)
+            print("\n  ✓ Mutation queue counters match rebuild()")
+            exercise_summaries(users, owners, properties)
+            print("\n  ✓ Citizen summaries match compute()")
+        finally:
+            db.session.rollback()
+            delete_test_data()
+            check_queue("cleanup")
+
+if __name__ == '__main__':
+    try:
+        test_maintained_summaries()
+    except AssertionError as e:
+        print(f"\n✗ {e}")
+        sys.exit(1)
+    sys.exit(0)
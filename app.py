@@ -20,7 +20,18 @@ from routes.tax_simple import tax_simple_bp
 from routes.admin_routes import admin_bp
 from routes.document_routes import document_bp
 from utils.audit import setup_audit_listeners
+from utils.document_search import document_search
+from utils.table_stats import table_stats
+from utils.audit_facets import audit_facets
+from utils.share_totals import share_totals
+from utils.owner_portfolios import owner_portfolios
+from utils.parcel_revisions import parcel_revisions
+from utils.sqlite_profile import init_sqlite_profile
+from utils.replica_routing import init_replica_routing
+from utils.sql_profiler import sql_profiler
+from utils.template_cache import init_template_cache
 from utils.decorators import role_required
+from commands import register_commands
 from datetime import datetime
 import os
 
@@ -30,6 +41,10 @@ def create_app():
     
     # Initialize extensions
     db.init_app(app)
+    init_sqlite_profile(app, db)
+    init_replica_routing(app)
+    sql_profiler.init_app(app)
+    init_template_cache(app)
     migrate = Migrate(app, db)
     CORS(app)
     
@@ -62,6 +77,9 @@ def create_app():
     from routes.tenant_routes import tenant_bp
     app.register_blueprint(tenant_bp)
     
+    # CLI commands
+    register_commands(app)
+    
     # Main routes
     @app.route('/')
     def index():
@@ -105,10 +123,35 @@ def create_app():
     # Setup audit listeners - temporarily disabled to fix session issues
     # setup_audit_listeners()
     
+    # Keep table row counters in step with inserts/deletes
+    table_stats.setup_listeners()
+    
+    # Move per-parcel share totals with ownership changes (and refuse over-allocation)
+    share_totals.setup_listeners()
+    
+    # Re-aggregate owner portfolios touched by ownership/tax/encumbrance changes
+    owner_portfolios.setup_listeners()
+    
+    # Bump the parcel revision counter behind the parcel page ETags
+    parcel_revisions.setup_listeners()
+    
     # Create database tables
     with app.app_context():
         db.create_all()
         
+        # Add indexes declared on models to tables created before they existed
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
+        
+        document_search.ensure_index()
+        table_stats.ensure_seeded()
+        table_stats.ensure_triggers()
+        audit_facets.ensure_triggers()
+        share_totals.ensure_seeded()
+        owner_portfolios.ensure_seeded()
+        parcel_revisions.ensure_seeded()
+        
         # Create default admin user if it doesn't exist
         admin_user = UserAccount.query.filter_by(username='admin').first()
         if not admin_user:
@@ -0,0 +1,168 @@
+"""
+Endpoint benchmark for LRMS
+Drives the hot pages through the Flask test client against a generated data
+set and reports latency percentiles and SQL statement counts per endpoint:
+parcel search, both dashboards, mutation approval, the tax summary API and
+audit log paging (first page and deep keyset pages).
+
+Generate data first, then benchmark a copy of that database (mutation
+approval writes):
+    python benchmarks/generate_data.py --parcels 100000 --database-uri sqlite:///bench.db
+    python benchmarks/endpoint_benchmark.py --database-uri sqlite:///bench.db --iterations 50
+"""
+
+import argparse
+import html
+import json
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+OLDER_LINK = re.compile(r'href="([^"#]+)">Older<')
+
+
+class StatementCounter:
+    """Counts statements issued on any engine while active"""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(Engine, 'before_cursor_execute', self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Benchmark:
+    def __init__(self, app, args):
+        self.app = app
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.counter = StatementCounter()
+        self.client = app.test_client()
+        self.results = {}
+
+    def login(self):
+        response = self.client.post('/login', data={'username': self.args.username, 'password': self.args.password})
+        if response.status_code != 302:
+            raise SystemExit(f'Login as {self.args.username} failed')
+
+    def measure(self, name, method, url, **kwargs):
+        self.counter.count = 0
+        started = time.perf_counter()
+        response = self.client.open(url, method=method, **kwargs)
+        body = response.get_data(as_text=True)
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            raise SystemExit(f'{name}: {method} {url} returned {response.status_code}')
+        if not self.warming:
+            record = self.results.setdefault(name, {'latencies': [], 'queries': []})
+            record['latencies'].append(elapsed)
+            record['queries'].append(self.counter.count)
+        return body
+
+    def search_terms(self):
+        from models import db
+        from models.location import Location
+        from models.parcel import Parcel
+        with self.app.app_context():
+            villages = [row[0] for row in db.session.query(Location.village).limit(200).all()]
+            max_id = db.session.query(db.func.max(Parcel.parcel_id)).scalar() or 1
+        terms = villages + [f'UL{self.rng.randint(1, max_id):012d}'[:10] for _ in range(50)]
+        return terms or ['UL']
+
+    def pending_mutations(self):
+        from models import db
+        from models.mutation import Mutation
+        with self.app.app_context():
+            return [row[0] for row in db.session.query(Mutation.mutation_id)
+                    .filter_by(status='Pending').order_by(Mutation.mutation_id).limit(self.args.iterations * 2).all()]
+
+    def run_once(self, terms, pending):
+        self.measure('parcel search', 'GET', f'/parcel/?search={self.rng.choice(terms)}')
+        self.measure('dashboard', 'GET', '/dashboard')
+        self.measure('admin dashboard', 'GET', '/admin/')
+        self.measure('tax summary api', 'GET', '/tax/api/summary')
+
+        body = self.measure('audit logs page 1', 'GET', '/admin/audit-logs')
+        for _ in range(self.args.audit_pages):
+            match = OLDER_LINK.search(body)
+            if not match:
+                break
+            body = self.measure('audit logs next page', 'GET', html.unescape(match.group(1)))
+
+        if pending and not self.args.read_only:
+            self.measure('mutation approve', 'POST', f'/mutation/{pending.pop(0)}/approve')
+
+    def run(self):
+        self.login()
+        terms = self.search_terms()
+        pending = self.pending_mutations()
+
+        self.warming = True
+        for _ in range(self.args.warmup):
+            self.run_once(terms, pending)
+        self.warming = False
+        for _ in range(self.args.iterations):
+            self.run_once(terms, pending)
+
+        summary = {}
+        for name, record in self.results.items():
+            latencies, queries = record['latencies'], record['queries']
+            summary[name] = {
+                'requests': len(latencies),
+                'p50_ms': percentile(latencies, 0.50) * 1000,
+                'p95_ms': percentile(latencies, 0.95) * 1000,
+                'p99_ms': percentile(latencies, 0.99) * 1000,
+                'avg_queries': sum(queries) / len(queries),
+                'max_queries': max(queries),
+            }
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-uri', default=None, help='defaults to Config.SQLALCHEMY_DATABASE_URI')
+    parser.add_argument('--iterations', type=int, default=30)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--audit-pages', type=int, default=20, help='keyset pages to follow per iteration')
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='admin123')
+    parser.add_argument('--read-only', action='store_true', help='skip mutation approval (no writes)')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--json', dest='json_path', help='also write the summary to this file')
+    args = parser.parse_args()
+
+    from config import Config
+    if args.database_uri:
+        Config.SQLALCHEMY_DATABASE_URI = args.database_uri
+    from app import create_app
+
+    app = create_app()
+    summary = Benchmark(app, args).run()
+
+    print(f"{'endpoint':<22} {'requests':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'avg q':>7} {'max q':>6}")
+    for name, stats in summary.items():
+        print(f"{name:<22} {stats['requests']:>8} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} "
+              f"{stats['p99_ms']:>9.2f} {stats['avg_queries']:>7.1f} {stats['max_queries']:>6}")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as handle:
+            json.dump(summary, handle, indent=2)
+
+
+if __name__ == '__main__':
+    main()
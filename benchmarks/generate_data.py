@@ -0,0 +1,407 @@
+"""
+Synthetic data generator for LRMS
+Fills an empty database with a deterministic, production-shaped data set:
+locations skewed towards busy villages, parcels with log-normal areas and
+occasional re-surveys, owners holding Pareto-distributed portfolios,
+fractional co-ownership, mutations that move ownership, yearly tax
+assessments and the audit rows those writes would have produced.
+
+The same --seed and --as-of always produce the same rows.
+
+Usage:
+    python benchmarks/generate_data.py --parcels 100000 --database-uri sqlite:///bench.db
+    python benchmarks/generate_data.py --parcels 10000000 --tax-years 3 --batch-size 20000
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from sqlalchemy import bindparam
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STATES = {
+    'Maharashtra': ['Pune', 'Nashik', 'Nagpur', 'Thane', 'Satara', 'Kolhapur', 'Solapur', 'Aurangabad'],
+    'Karnataka': ['Bengaluru Urban', 'Mysuru', 'Belagavi', 'Tumakuru', 'Dharwad', 'Mandya'],
+    'Gujarat': ['Ahmedabad', 'Surat', 'Vadodara', 'Rajkot', 'Bhavnagar'],
+    'Rajasthan': ['Jaipur', 'Jodhpur', 'Udaipur', 'Kota', 'Ajmer', 'Bikaner'],
+    'Telangana': ['Hyderabad', 'Warangal', 'Nizamabad', 'Karimnagar'],
+}
+TALUKAS_PER_DISTRICT = 6
+PARCELS_PER_VILLAGE = 250
+
+LAND_CATEGORIES = [('Agricultural', 60), ('Residential', 25), ('Commercial', 8), ('Industrial', 4), ('State Owned', 3)]
+USE_TYPES = {
+    'Agricultural': ['Irrigated farmland', 'Dry farmland', 'Orchard', 'Fallow'],
+    'Residential': ['Independent house', 'Apartment plot', 'Row house'],
+    'Commercial': ['Shop', 'Office', 'Warehouse'],
+    'Industrial': ['Factory', 'Workshop'],
+    'State Owned': ['Forest', 'Road', 'Public utility'],
+}
+OWNER_TYPES = [('Individual', 85), ('Company', 10), ('Government', 5)]
+# Number of co-owners and their shares
+SHARE_PATTERNS = [
+    ((Decimal('1'),), 70),
+    ((Decimal('0.5'), Decimal('0.5')), 20),
+    ((Decimal('0.5'), Decimal('0.25'), Decimal('0.25')), 8),
+    ((Decimal('0.25'),) * 4, 2),
+]
+OWNERSHIP_TYPES = {1: 'Freehold', 2: 'Joint', 3: 'Joint', 4: 'Inherited'}
+MUTATION_TYPES = [('Sale', 55), ('Inheritance', 25), ('Gift', 12), ('Lease Transfer', 6), ('Government Acquisition', 2)]
+MUTATION_STATUSES = [('Approved', 80), ('Pending', 15), ('Rejected', 5)]
+TAX_STATUSES = [('Paid', 60), ('Partial', 15), ('Unpaid', 25)]
+TAX_RATE = {'Agricultural': Decimal('0.002'), 'Residential': Decimal('0.008'), 'Commercial': Decimal('0.015'),
+            'Industrial': Decimal('0.012'), 'State Owned': Decimal('0')}
+VALUE_PER_ACRE = {'Agricultural': 800000, 'Residential': 6000000, 'Commercial': 15000000,
+                  'Industrial': 5000000, 'State Owned': 1000000}
+
+FIRST_NAMES = ['Aarav', 'Vivaan', 'Aditya', 'Sai', 'Arjun', 'Reyansh', 'Krishna', 'Ishaan', 'Ananya', 'Diya',
+               'Saanvi', 'Aadhya', 'Kavya', 'Priya', 'Lakshmi', 'Meera', 'Rohan', 'Suresh', 'Ramesh', 'Sunita',
+               'Ganesh', 'Mahesh', 'Pooja', 'Neha', 'Vikram', 'Anil', 'Kiran', 'Deepa', 'Manoj', 'Geeta']
+LAST_NAMES = ['Patil', 'Sharma', 'Deshmukh', 'Kulkarni', 'Reddy', 'Shah', 'Patel', 'Joshi', 'Jadhav', 'Rao',
+              'Singh', 'Gowda', 'Naidu', 'Mehta', 'Pawar', 'Shinde', 'Iyer', 'Chavan', 'Desai', 'Bhat']
+COMPANY_SUFFIXES = ['Infra Pvt Ltd', 'Agro Industries', 'Developers LLP', 'Estates Pvt Ltd', 'Logistics Ltd']
+GOVERNMENT_BODIES = ['Public Works Department', 'Municipal Corporation', 'Forest Department', 'Irrigation Department']
+
+BENCH_USERS = [('bench_registrar_1', 'Registrar'), ('bench_registrar_2', 'Registrar'), ('bench_registrar_3', 'Registrar'),
+               ('bench_approver_1', 'Approver'), ('bench_approver_2', 'Approver')]
+BENCH_PASSWORD = 'bench123'
+
+
+def weighted(rng, choices):
+    """Pick from [(value, weight), ...]"""
+    total = sum(weight for _, weight in choices)
+    point = rng.uniform(0, total)
+    for value, weight in choices:
+        point -= weight
+        if point <= 0:
+            return value
+    return choices[-1][0]
+
+
+def skewed_index(rng, size, alpha=1.2):
+    """Index in [0, size) where low indexes are much more likely (Pareto tail)"""
+    return min(size - 1, int((rng.paretovariate(alpha) - 1) * size / 5))
+
+
+def money(value):
+    return Decimal(value).quantize(Decimal('0.01'))
+
+
+class Generator:
+    """Produces the data set batch by batch with explicit primary keys"""
+
+    def __init__(self, args, db):
+        self.args = args
+        self.db = db
+        self.rng = random.Random(args.seed)
+        self.as_of = args.as_of
+        self.history_start = self.as_of - timedelta(days=365 * args.history_years)
+        self.next_id = {'version': 1, 'ownership': 1, 'mutation': 1, 'tax': 1, 'audit': 1}
+        self.counts = {}
+
+    @staticmethod
+    def _datetime(value):
+        return value if isinstance(value, datetime) else datetime.combine(value, datetime.min.time())
+
+    def timestamp(self, start=None, end=None):
+        """Uniform moment between start and end (dates or datetimes)"""
+        start = self._datetime(start or self.history_start)
+        span = int((self._datetime(end or self.as_of) - start).total_seconds())
+        return start + timedelta(seconds=self.rng.randrange(span)) if span > 0 else start
+
+    def insert(self, model, rows):
+        if rows:
+            self.db.session.execute(model.__table__.insert(), rows)
+            self.counts[model.__tablename__] = self.counts.get(model.__tablename__, 0) + len(rows)
+
+    def audit(self, rows, table_name, pk, action, user_id, when, new_values=None, old_values=None):
+        rows.append({
+            'audit_id': self.next_id['audit'], 'table_name': table_name, 'record_pk_value': str(pk),
+            'action': action, 'user_id': user_id, 'timestamp': when,
+            'old_values': old_values, 'new_values': new_values
+        })
+        self.next_id['audit'] += 1
+
+    def users(self):
+        from models.user_account import UserAccount
+        from werkzeug.security import generate_password_hash
+        password_hash = generate_password_hash(BENCH_PASSWORD)
+        existing = {name for (name,) in self.db.session.query(UserAccount.username).all()}
+        self.insert(UserAccount, [
+            {'username': username, 'role': role, 'password_hash': password_hash, 'is_active': True,
+             'created_at': datetime.combine(self.history_start, datetime.min.time())}
+            for username, role in BENCH_USERS if username not in existing
+        ])
+        self.db.session.commit()
+        rows = self.db.session.query(UserAccount.user_id, UserAccount.role).all()
+        self.registrars = [user_id for user_id, role in rows if role in ('Registrar', 'Admin')]
+        self.approvers = [user_id for user_id, role in rows if role in ('Approver', 'Admin')]
+
+    def locations(self):
+        from models.location import Location
+        villages = max(1, math.ceil(self.args.parcels / PARCELS_PER_VILLAGE))
+        districts = [(state, district) for state, names in STATES.items() for district in names]
+        rows = []
+        for location_id in range(1, villages + 1):
+            state, district = districts[(location_id - 1) % len(districts)]
+            taluka_no = ((location_id - 1) // len(districts)) % TALUKAS_PER_DISTRICT + 1
+            rows.append({
+                'location_id': location_id,
+                'village': f'{district[:4]} Village {location_id}',
+                'taluka': f'{district} Taluka {taluka_no}',
+                'district': district,
+                'state': state,
+                'pincode': f'{400000 + (location_id * 37) % 99999:06d}'
+            })
+        for start in range(0, len(rows), self.args.batch_size):
+            self.insert(Location, rows[start:start + self.args.batch_size])
+        self.db.session.commit()
+        self.location_count = villages
+
+    def owners(self):
+        from models.owner import Owner
+        self.owner_count = max(2, int(self.args.parcels * self.args.owners_per_parcel))
+        for start in range(1, self.owner_count + 1, self.args.batch_size):
+            rows = []
+            for owner_id in range(start, min(start + self.args.batch_size, self.owner_count + 1)):
+                owner_type = weighted(self.rng, OWNER_TYPES)
+                first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+                if owner_type == 'Company':
+                    name = f'{last} {self.rng.choice(COMPANY_SUFFIXES)}'
+                elif owner_type == 'Government':
+                    name = f'{self.rng.choice(GOVERNMENT_BODIES)} {owner_id}'
+                else:
+                    name = f'{first} {last}'
+                pan_letters = ''.join(self.rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(5))
+                rows.append({
+                    'owner_id': owner_id, 'name': name, 'owner_type': owner_type,
+                    'pan': f'{pan_letters}{owner_id % 10000:04d}{self.rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}',
+                    'address': f'{self.rng.randint(1, 999)}, {last} Nagar',
+                    'contact_no': f'9{self.rng.randrange(10 ** 9):09d}',
+                    'created_at': self.timestamp()
+                })
+            self.insert(Owner, rows)
+            self.db.session.commit()
+
+    def parcels(self):
+        from models.parcel import Parcel
+        from models.parcel_version import ParcelVersion
+        from models.ownership import Ownership
+        from models.mutation import Mutation
+        from models.tax_assessment import TaxAssessment
+        from models.audit_log import AuditLog
+
+        started = time.perf_counter()
+        parcel_table = Parcel.__table__
+        for start in range(1, self.args.parcels + 1, self.args.batch_size):
+            end = min(start + self.args.batch_size, self.args.parcels + 1)
+            parcels, versions, current_versions = [], [], []
+            ownerships, mutations, taxes, audits = [], [], [], []
+
+            for parcel_id in range(start, end):
+                category = weighted(self.rng, LAND_CATEGORIES)
+                area = Decimal(str(round(min(5000.0, self.rng.lognormvariate(0.2, 1.0)), 4)))
+                created_at = self.timestamp()
+                registrar = self.rng.choice(self.registrars)
+                location_id = skewed_index(self.rng, self.location_count) + 1
+                parcels.append({
+                    'parcel_id': parcel_id, 'ulpin': f'UL{parcel_id:012d}',
+                    'survey_no': f'{self.rng.randint(1, 999)}/{self.rng.randint(1, 20)}',
+                    'total_area': area, 'land_category': category,
+                    'current_use_type': self.rng.choice(USE_TYPES[category]),
+                    'location_id': location_id,
+                    'centroid_lat': Decimal(str(round(self.rng.uniform(15.0, 24.0), 8))),
+                    'centroid_lon': Decimal(str(round(self.rng.uniform(72.0, 80.0), 8))),
+                    'current_version_id': None, 'created_at': created_at
+                })
+                self.audit(audits, 'parcel', parcel_id, 'INSERT', registrar, created_at,
+                           new_values={'ulpin': f'UL{parcel_id:012d}', 'land_category': category})
+
+                # Most parcels have one survey; some were re-surveyed since
+                valid_from = created_at
+                surveys = 1 + (self.rng.random() < 0.10) + (self.rng.random() < 0.02)
+                for survey in range(surveys):
+                    last = survey == surveys - 1
+                    valid_to = None if last else self.timestamp(valid_from, self.as_of)
+                    versions.append({
+                        'version_id': self.next_id['version'], 'parcel_id': parcel_id,
+                        'valid_from': valid_from, 'valid_to': valid_to, 'boundary_geometry': None,
+                        'area_at_version': area if last else Decimal(str(round(float(area) * self.rng.uniform(0.9, 1.1), 4))),
+                        'created_at': valid_from
+                    })
+                    if last:
+                        current_versions.append({'b_parcel_id': parcel_id, 'b_version_id': self.next_id['version']})
+                    self.next_id['version'] += 1
+                    valid_from = valid_to
+
+                # Co-owners; Pareto pick so a few owners hold large portfolios
+                shares = weighted(self.rng, SHARE_PATTERNS)
+                owners = []
+                while len(owners) < len(shares):
+                    owner_id = skewed_index(self.rng, self.owner_count, alpha=1.05) + 1 \
+                        if self.rng.random() < 0.3 else self.rng.randint(1, self.owner_count)
+                    if owner_id not in owners:
+                        owners.append(owner_id)
+                ownership_type = OWNERSHIP_TYPES[len(shares)]
+                date_from = created_at.date()
+                open_rows = []
+                for owner_id, share in zip(owners, shares):
+                    row = {
+                        'ownership_id': self.next_id['ownership'], 'parcel_id': parcel_id, 'owner_id': owner_id,
+                        'share_fraction': share, 'ownership_type': ownership_type,
+                        'date_from': date_from, 'date_to': None, 'created_at': created_at
+                    }
+                    ownerships.append(row)
+                    open_rows.append(row)
+                    self.next_id['ownership'] += 1
+
+                # Mutations: approved ones close the seller's ownership and open the buyer's
+                mutation_time = created_at
+                while self.rng.random() < self.args.mutation_rate:
+                    mutation_time = self.timestamp(mutation_time, self.as_of)
+                    seller_row = self.rng.choice(open_rows)
+                    buyer = self.rng.randint(1, self.owner_count)
+                    if buyer == seller_row['owner_id']:
+                        break
+                    status = weighted(self.rng, MUTATION_STATUSES)
+                    mutation_type = weighted(self.rng, MUTATION_TYPES)
+                    mutation_id = self.next_id['mutation']
+                    self.next_id['mutation'] += 1
+                    approver = self.rng.choice(self.approvers) if status != 'Pending' else None
+                    mutations.append({
+                        'mutation_id': mutation_id, 'parcel_id': parcel_id,
+                        'from_owner_id': seller_row['owner_id'], 'to_owner_id': buyer,
+                        'mutation_type': mutation_type, 'date_of_mutation': mutation_time.date(),
+                        'consideration_value': money(float(area) * VALUE_PER_ACRE[parcels[-1]['land_category']]
+                                                     * self.rng.uniform(0.6, 1.4)) if mutation_type == 'Sale' else None,
+                        'approved_by': approver, 'approved_on': mutation_time.date() if approver else None,
+                        'status': status, 'document_id': None, 'created_at': mutation_time
+                    })
+                    self.audit(audits, 'mutation', mutation_id, 'INSERT', self.rng.choice(self.registrars), mutation_time,
+                               new_values={'parcel_id': parcel_id, 'status': 'Pending'})
+                    if status == 'Pending':
+                        break
+                    self.audit(audits, 'mutation', mutation_id, 'UPDATE', approver, mutation_time,
+                               old_values={'status': 'Pending'}, new_values={'status': status})
+                    if status == 'Approved':
+                        seller_row['date_to'] = mutation_time.date()
+                        open_rows.remove(seller_row)
+                        row = dict(seller_row, ownership_id=self.next_id['ownership'], owner_id=buyer,
+                                   ownership_type='Freehold' if len(shares) == 1 else ownership_type,
+                                   date_from=mutation_time.date(), date_to=None, created_at=mutation_time)
+                        ownerships.append(row)
+                        open_rows.append(row)
+                        self.next_id['ownership'] += 1
+                        self.audit(audits, 'ownership', seller_row['ownership_id'], 'UPDATE', approver, mutation_time,
+                                   new_values={'date_to': mutation_time.date().isoformat()})
+
+                # One assessment per year, older years mostly settled
+                category_value = VALUE_PER_ACRE[category] * float(area)
+                for offset in range(self.args.tax_years):
+                    year = self.as_of.year - offset
+                    if year < created_at.year:
+                        break
+                    land_value = money(category_value * self.rng.uniform(0.8, 1.2))
+                    building_value = money(0 if category == 'Agricultural' else category_value * self.rng.uniform(0, 0.5))
+                    total_value = land_value + building_value
+                    tax_due = money(total_value * TAX_RATE[category])
+                    status = 'Paid' if offset and self.rng.random() < 0.7 else weighted(self.rng, TAX_STATUSES)
+                    if tax_due == 0:
+                        status = 'Paid'
+                    amount_paid = tax_due if status == 'Paid' else (
+                        money(tax_due * Decimal(str(round(self.rng.uniform(0.1, 0.9), 2)))) if status == 'Partial' else Decimal('0'))
+                    paid_on = None
+                    if amount_paid:
+                        paid_on = min(self.as_of, date(year, 4, 1) + timedelta(days=self.rng.randrange(300)))
+                    taxes.append({
+                        'tax_id': self.next_id['tax'], 'parcel_id': parcel_id, 'assessment_year': year,
+                        'land_value': land_value, 'building_value': building_value,
+                        'total_assessed_value': total_value, 'tax_due': tax_due, 'amount_paid': amount_paid,
+                        'paid_on': paid_on, 'status': status,
+                        'created_at': datetime(year, 4, 1) + timedelta(seconds=self.rng.randrange(86400 * 30))
+                    })
+                    self.next_id['tax'] += 1
+
+            # Parcels first, then versions, then point parcels at their current version
+            self.insert(Parcel, parcels)
+            self.insert(ParcelVersion, versions)
+            self.db.session.execute(
+                parcel_table.update()
+                .where(parcel_table.c.parcel_id == bindparam('b_parcel_id'))
+                .values(current_version_id=bindparam('b_version_id')),
+                current_versions
+            )
+            self.insert(Ownership, ownerships)
+            self.insert(Mutation, mutations)
+            self.insert(TaxAssessment, taxes)
+            self.insert(AuditLog, audits)
+            self.db.session.commit()
+
+            elapsed = time.perf_counter() - started
+            done = end - 1
+            print(f"  {done:>10,} / {self.args.parcels:,} parcels  ({done / elapsed:,.0f} parcels/s)")
+
+    def run(self):
+        from models.parcel import Parcel
+        if self.db.session.query(Parcel.parcel_id).first() is not None:
+            raise SystemExit('Target database already has parcels; generate into an empty database.')
+
+        started = time.perf_counter()
+        print(f"Generating {self.args.parcels:,} parcels (seed {self.args.seed}, as of {self.as_of})")
+        self.users()
+        self.locations()
+        print(f"  {self.location_count:,} locations")
+        self.owners()
+        print(f"  {self.owner_count:,} owners")
+        self.parcels()
+
+        # Derived tables the application maintains incrementally
+        from utils.table_stats import table_stats
+        from utils.audit_facets import audit_facets
+        from utils.share_totals import share_totals
+        from utils.owner_portfolios import owner_portfolios
+        from utils.parcel_revisions import parcel_revisions
+        table_stats.refresh()
+        audit_facets.rebuild()
+        share_totals.rebuild()
+        owner_portfolios.rebuild()
+        parcel_revisions.seed_missing()
+
+        print(f"Done in {time.perf_counter() - started:.1f}s")
+        for table_name, count in sorted(self.counts.items()):
+            print(f"  {table_name:<16} {count:>12,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parcels', type=int, default=10000, help='number of parcels (10k to 10M)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--as-of', type=date.fromisoformat, default=date(date.today().year, 1, 1),
+                        help='end of the generated history (default: 1 January this year)')
+    parser.add_argument('--history-years', type=int, default=10)
+    parser.add_argument('--tax-years', type=int, default=3, help='assessment years per parcel')
+    parser.add_argument('--owners-per-parcel', type=float, default=0.8)
+    parser.add_argument('--mutation-rate', type=float, default=0.3, help='chance of each further mutation per parcel')
+    parser.add_argument('--batch-size', type=int, default=10000, help='parcels per transaction')
+    parser.add_argument('--database-uri', default=None, help='defaults to Config.SQLALCHEMY_DATABASE_URI')
+    args = parser.parse_args()
+
+    from config import Config
+    if args.database_uri:
+        Config.SQLALCHEMY_DATABASE_URI = args.database_uri
+    from app import create_app
+    from models import db
+
+    app = create_app()
+    with app.app_context():
+        Generator(args, db).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""
+SQLite profile benchmark for LRMS
+Compares read and write throughput of the 'default' and 'production'
+SQLITE_PROFILES under concurrent worker processes, the way several
+gunicorn workers share one lrms.db file.
+
+Usage:
+    python benchmarks/sqlite_profile_benchmark.py --writers 4 --readers 4 --duration 10
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from utils.sqlite_profile import apply_pragmas
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS parcel (
+    parcel_id INTEGER PRIMARY KEY,
+    ulpin VARCHAR(50) UNIQUE NOT NULL,
+    survey_no VARCHAR(50) NOT NULL,
+    total_area NUMERIC(10, 4) NOT NULL,
+    land_category VARCHAR(20) NOT NULL,
+    location_id INTEGER NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_parcel_category ON parcel(land_category);
+"""
+
+CATEGORIES = ['Agricultural', 'Residential', 'Commercial', 'Industrial', 'State Owned']
+
+# Python's sqlite3 default lock wait, used by the app before SQLITE_PROFILES existed
+DEFAULT_DRIVER_TIMEOUT = 5.0
+
+
+def connect(db_path, profile):
+    pragmas = Config.SQLITE_PROFILES[profile]
+    timeout = Config.SQLALCHEMY_ENGINE_OPTIONS.get('connect_args', {}).get('timeout', DEFAULT_DRIVER_TIMEOUT) \
+        if pragmas else DEFAULT_DRIVER_TIMEOUT
+    connection = sqlite3.connect(db_path, timeout=timeout)
+    apply_pragmas(connection, pragmas)
+    return connection
+
+
+def seed(db_path, profile, rows):
+    connection = connect(db_path, profile)
+    connection.executescript(SCHEMA)
+    connection.executemany(
+        "INSERT INTO parcel (ulpin, survey_no, total_area, land_category, location_id) VALUES (?, ?, ?, ?, ?)",
+        ((f'SEED-{i}', f'{i}/1', round(random.uniform(0.1, 20), 4), random.choice(CATEGORIES), i % 500)
+         for i in range(rows))
+    )
+    connection.commit()
+    connection.close()
+
+
+def writer(db_path, profile, worker_id, deadline, results):
+    connection = connect(db_path, profile)
+    ops = errors = 0
+    latencies = []
+    sequence = 0
+    while time.time() < deadline:
+        started = time.perf_counter()
+        try:
+            # One small transaction per request, like a form submission
+            connection.execute(
+                "INSERT INTO parcel (ulpin, survey_no, total_area, land_category, location_id) VALUES (?, ?, ?, ?, ?)",
+                (f'W{worker_id}-{sequence}', f'{sequence}/2', 1.5, random.choice(CATEGORIES), sequence % 500)
+            )
+            connection.commit()
+            ops += 1
+            sequence += 1
+        except sqlite3.OperationalError:
+            connection.rollback()
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+    results.put(('write', ops, errors, latencies))
+
+
+def reader(db_path, profile, worker_id, deadline, results):
+    connection = connect(db_path, profile)
+    ops = errors = 0
+    latencies = []
+    while time.time() < deadline:
+        started = time.perf_counter()
+        try:
+            # A list page: one filtered page of rows plus an aggregate
+            category = random.choice(CATEGORIES)
+            connection.execute(
+                "SELECT parcel_id, ulpin, survey_no, total_area FROM parcel WHERE land_category = ? "
+                "ORDER BY parcel_id DESC LIMIT 20", (category,)
+            ).fetchall()
+            connection.execute("SELECT land_category, COUNT(*) FROM parcel GROUP BY land_category").fetchall()
+            ops += 1
+        except sqlite3.OperationalError:
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+    results.put(('read', ops, errors, latencies))
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_profile(profile, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        seed(db_path, profile, args.seed_rows)
+
+        results = multiprocessing.Queue()
+        deadline = time.time() + args.duration
+        workers = [multiprocessing.Process(target=writer, args=(db_path, profile, i, deadline, results))
+                   for i in range(args.writers)]
+        workers += [multiprocessing.Process(target=reader, args=(db_path, profile, i, deadline, results))
+                    for i in range(args.readers)]
+        for process in workers:
+            process.start()
+        collected = [results.get() for _ in workers]
+        for process in workers:
+            process.join()
+
+    summary = {}
+    for kind in ('write', 'read'):
+        rows = [row for row in collected if row[0] == kind]
+        latencies = [latency for row in rows for latency in row[3]]
+        summary[kind] = {
+            'ops_per_sec': sum(row[1] for row in rows) / args.duration,
+            'errors': sum(row[2] for row in rows),
+            'p50_ms': percentile(latencies, 0.50) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per profile')
+    parser.add_argument('--seed-rows', type=int, default=50000)
+    parser.add_argument('--profiles', nargs='+', default=['default', 'production'])
+    args = parser.parse_args()
+
+    print(f"{args.writers} writers, {args.readers} readers, {args.duration:.0f}s per profile, "
+          f"{args.seed_rows} seed rows")
+    print(f"{'profile':<12} {'kind':<6} {'ops/s':>10} {'errors':>8} {'p50 ms':>9} {'p99 ms':>9}")
+    for profile in args.profiles:
+        summary = run_profile(profile, args)
+        for kind, stats in summary.items():
+            print(f"{profile:<12} {kind:<6} {stats['ops_per_sec']:>10.1f} {stats['errors']:>8} "
+                  f"{stats['p50_ms']:>9.2f} {stats['p99_ms']:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+First-request latency benchmark for LRMS templates
+Every measurement runs in a fresh interpreter (like a newly started worker),
+logs in and times the first GET of one page. Each page is measured with
+Jinja compiling in memory (TEMPLATE_CACHE_DIR empty) and with a bytecode
+cache filled by `flask precompile-templates`, and later requests in the same
+process are timed for reference.
+
+    python benchmarks/generate_data.py --parcels 5000 --database-uri sqlite:///bench.db
+    python benchmarks/template_warmup.py --database-uri sqlite:///bench.db --runs 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+DEFAULT_PATHS = ['/dashboard', '/admin/', '/parcel/1', '/owner/1', '/tax/']
+
+
+def create_app(database_uri, cache_dir):
+    from config import Config
+    if database_uri:
+        Config.SQLALCHEMY_DATABASE_URI = database_uri
+    Config.TEMPLATE_CACHE_DIR = cache_dir
+    from app import create_app as factory
+    return factory()
+
+
+def child(args):
+    """Measure one page in this (fresh) process and print the timings as JSON"""
+    app = create_app(args.database_uri, args.cache_dir)
+    client = app.test_client()
+    response = client.post('/login', data={'username': args.username, 'password': args.password})
+    if response.status_code != 302:
+        raise SystemExit(f'login failed ({response.status_code})')
+
+    timings = []
+    for _ in range(1 + args.repeat):
+        started = time.perf_counter()
+        response = client.get(args.child)
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            raise SystemExit(f'{args.child} returned {response.status_code}')
+    print(json.dumps({'first_ms': timings[0], 'warm_ms': min(timings[1:]) if args.repeat else None}))
+
+
+def measure(args, path, cache_dir):
+    command = [sys.executable, os.path.abspath(__file__), '--child', path, '--cache-dir', cache_dir,
+               '--repeat', str(args.repeat), '--username', args.username, '--password', args.password]
+    if args.database_uri:
+        command += ['--database-uri', args.database_uri]
+    output = subprocess.run(command, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def precompile(args, cache_dir):
+    app = create_app(args.database_uri, cache_dir)
+    from utils.template_cache import precompile_templates
+    compiled, failed, elapsed = precompile_templates(app)
+    print(f'precompiled {compiled} templates in {elapsed:.2f}s ({len(failed)} failed)')
+
+
+def median(values):
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-uri', default=None, help='defaults to Config.SQLALCHEMY_DATABASE_URI')
+    parser.add_argument('--paths', nargs='+', default=DEFAULT_PATHS)
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes per page and mode')
+    parser.add_argument('--repeat', type=int, default=5, help='warm requests timed after the first one')
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='admin123')
+    parser.add_argument('--json', dest='json_path', help='also write the summary to this file')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--cache-dir', default='', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args)
+        return
+
+    with tempfile.TemporaryDirectory(prefix='jinja_cache_') as cache_dir:
+        precompile(args, cache_dir)
+        summary = {}
+        for path in args.paths:
+            cold = [measure(args, path, '') for _ in range(args.runs)]
+            cached = [measure(args, path, cache_dir) for _ in range(args.runs)]
+            summary[path] = {
+                'first_ms_compiled': median([run['first_ms'] for run in cold]),
+                'first_ms_cached': median([run['first_ms'] for run in cached]),
+                'warm_ms': median([run['warm_ms'] for run in cold + cached if run['warm_ms'] is not None] or [0.0])
+            }
+
+    print(f"{'page':<16} {'first (compile)':>16} {'first (cached)':>15} {'warm':>9}")
+    for path, stats in summary.items():
+        print(f"{path:<16} {stats['first_ms_compiled']:>13.1f} ms {stats['first_ms_cached']:>12.1f} ms "
+              f"{stats['warm_ms']:>6.1f} ms")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as handle:
+            json.dump(summary, handle, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Flask CLI commands for Government Property Management Portal
+Usage: flask --app app <command>
+"""
+
+import click
+from utils.document_search import document_search
+from utils.table_stats import table_stats
+from utils.audit_facets import audit_facets
+from utils.share_totals import share_totals
+from utils.owner_portfolios import owner_portfolios
+from utils.agreement_expiry import agreement_expiry
+from utils.replica_routing import sync_sqlite_replicas
+from utils.bulk_import import parcel_importer
+from utils.analytics_snapshot import analytics_snapshot
+from utils.template_cache import precompile_templates
+from models import db
+
+
+def register_commands(app):
+    """Attach maintenance commands to the application CLI"""
+
+    @app.cli.command('index-documents')
+    @click.option('--all', 'reindex_all', is_flag=True, help='Re-extract every document, not only unindexed ones.')
+    @click.option('--workers', default=None, type=int, help='Extraction processes (defaults to CPU count).')
+    @click.option('--batch-size', default=50, show_default=True, help='Documents per commit.')
+    def index_documents(reindex_all, workers, batch_size):
+        """Extract text from stored documents into the full-text index."""
+        document_search.ensure_index()
+        summary = document_search.reindex_all(
+            only_missing=not reindex_all,
+            workers=workers,
+            batch_size=batch_size
+        )
+        if not summary:
+            click.echo('No documents to index.')
+            return
+        for status, count in sorted(summary.items()):
+            click.echo(f'{status}: {count}')
+
+    @app.cli.command('refresh-table-stats')
+    @click.option('--estimated', is_flag=True, help='Use engine metadata instead of exact COUNT(*) scans.')
+    def refresh_table_stats(estimated):
+        """Recompute the row counters shown on /admin/system-info."""
+        table_stats.refresh(estimated=estimated)
+        for table_name, stat in table_stats.get_counts().items():
+            click.echo(f'{table_name}: {stat.row_count} ({stat.source})')
+
+    @app.cli.command('rebuild-audit-facets')
+    def rebuild_audit_facets():
+        """Recompute the audit log filter counts from audit_log."""
+        groups = audit_facets.rebuild()
+        click.echo(f'{groups} facet rows rebuilt.')
+
+    @app.cli.command('repair-share-totals')
+    def repair_share_totals():
+        """Recompute every parcel's active share total from the ownership table."""
+        parcels, over_allocated = share_totals.rebuild()
+        click.echo(f'{parcels} parcel share totals rebuilt.')
+        if over_allocated:
+            click.echo(f'{len(over_allocated)} parcels have active shares above 100%:')
+            for parcel_id, share_sum in over_allocated[:20]:
+                click.echo(f'  parcel {parcel_id}: {share_sum * 100:.2f}%')
+            if len(over_allocated) > 20:
+                click.echo(f'  ... {len(over_allocated) - 20} more')
+
+    @app.cli.command('rebuild-owner-portfolios')
+    def rebuild_owner_portfolios():
+        """Recompute every owner's portfolio row from ownerships, tax and encumbrances."""
+        owners = owner_portfolios.rebuild()
+        click.echo(f'{owners} owner portfolios rebuilt.')
+
+    @app.cli.command('scan-agreement-expiry')
+    @click.option('--days', default=30, show_default=True, help='Notify agreements ending within this many days.')
+    @click.option('--batch-size', default=1000, show_default=True, help='Agreements per batch (one commit each).')
+    @click.option('--rescan', is_flag=True, help='Restart from today instead of the saved watermark.')
+    def scan_agreement_expiry(days, batch_size, rescan):
+        """Write expiry notices for tenant agreements entering the notice window."""
+        summary = agreement_expiry.run(lead_days=days, batch_size=batch_size, rescan=rescan)
+        click.echo(f"{summary['notices']} notices from {summary['scanned']} agreements "
+                   f"in {summary['batches']} batches (window up to {summary['horizon']}).")
+
+    @app.cli.command('import-parcels')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--chunk-size', default=1000, show_default=True, help='Rows validated and committed per transaction.')
+    @click.option('--restart', is_flag=True, help='Ignore the saved checkpoint and start from the first row.')
+    @click.option('--errors', 'error_path', default=None, help='CSV file for rejected rows (defaults to <file>.errors.csv).')
+    def import_parcels(path, chunk_size, restart, error_path):
+        """Bulk import parcels, owners and ownerships from a CSV or XLSX file."""
+        error_path = error_path or f'{path}.errors.csv'
+
+        def report(progress):
+            click.echo(f"rows {progress['last_row']}: {progress['parcels']} parcels, "
+                       f"{progress['ownerships']} ownerships, {progress['rows_failed']} rejected "
+                       f"({progress['chunk_rows_per_second']:.0f} rows/s)")
+            for error in progress['errors'][:5]:
+                click.echo(f"  row {error['row']} {error['ulpin']}: {error['error']}")
+            if len(progress['errors']) > 5:
+                click.echo(f"  ... {len(progress['errors']) - 5} more in {error_path}")
+
+        try:
+            summary = parcel_importer.run(path, chunk_size=chunk_size, restart=restart,
+                                          error_path=error_path, on_chunk=report)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        except Exception as e:
+            raise click.ClickException(f'Import stopped: {e}. Re-run the same command to resume after the last committed chunk.')
+
+        if summary['completed_before']:
+            click.echo(f"Already imported ({summary['rows_committed']} rows). Use --restart to import again.")
+            return
+        if summary['resumed_from_row']:
+            click.echo(f"Resumed after row {summary['resumed_from_row']}.")
+        click.echo(f"Imported {summary['rows_imported']} of {summary['rows_read']} rows in {summary['seconds']:.1f}s "
+                   f"({summary['rows_per_second']:.0f} rows/s): {summary['parcels']} parcels, "
+                   f"{summary['owners']} owners, {summary['ownerships']} ownerships.")
+        if summary['rows_failed']:
+            click.echo(f"{summary['rows_failed']} rows rejected; see {error_path}")
+
+    @app.cli.command('snapshot-analytics')
+    @click.option('--format', 'fmt', type=click.Choice(['auto', 'parquet', 'npz']), default='auto', show_default=True,
+                  help='Parquet needs pyarrow; npz (compressed NumPy) is the fallback.')
+    @click.option('--batch-size', default=50000, show_default=True, help='Rows per row group / part file.')
+    @click.option('--table', 'tables', multiple=True, type=click.Choice(analytics_snapshot.TABLES),
+                  help='Limit the snapshot to these tables (repeatable).')
+    def snapshot_analytics(fmt, batch_size, tables):
+        """Write today's columnar analytics snapshot (run nightly)."""
+        try:
+            manifest = analytics_snapshot.run(fmt=fmt, batch_size=batch_size, tables=list(tables) or None)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Snapshot {manifest['snapshot']} ({manifest['format']}) in {analytics_snapshot.root()}")
+        for name, info in manifest['tables'].items():
+            click.echo(f"{name}: {info['rows']} rows, {len(info['partitions']) or 1} partition(s)")
+
+    @app.cli.command('sync-replicas')
+    def sync_replicas():
+        """Copy the primary SQLite database into the configured SQLite replicas."""
+        synced = sync_sqlite_replicas(db)
+        if not synced:
+            click.echo('No SQLite replicas configured (set REPLICA_DATABASE_URIS).')
+            return
+        for bind_key in synced:
+            click.echo(f'{bind_key}: synced')
+
+    @app.cli.command('precompile-templates')
+    def precompile_templates_command():
+        """Compile every template into the bytecode cache (run at build time, before workers start)."""
+        if app.jinja_env.bytecode_cache is None:
+            raise click.ClickException('Template bytecode cache is disabled (set TEMPLATE_CACHE_DIR).')
+        compiled, failed, elapsed = precompile_templates(app)
+        click.echo(f"{compiled} templates compiled into {app.config['TEMPLATE_CACHE_DIR']} in {elapsed:.2f}s.")
+        for name, error in failed:
+            click.echo(f'  {name}: {error}', err=True)
+        if failed:
+            raise click.ClickException(f'{len(failed)} templates failed to compile.')
@@ -6,7 +6,7 @@ class Config:
     # Use SQLite for development
     SQLALCHEMY_DATABASE_URI = "sqlite:///lrms.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    # Engine options for MySQL; for SQLite, use defaults
+    # Engine options for MySQL; for SQLite, only the driver lock timeout (pragmas come from SQLITE_PROFILES)
     if 'sqlite' not in SQLALCHEMY_DATABASE_URI:
         SQLALCHEMY_ENGINE_OPTIONS = {
             'pool_pre_ping': True,
@@ -18,7 +18,50 @@ class Config:
             }
         }
     else:
-        SQLALCHEMY_ENGINE_OPTIONS = {}
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'connect_args': {
+                'timeout': 30  # seconds the driver waits on a locked database
+            }
+        }
+    
+    # SQLite tuning profiles, applied to every new connection (see utils/sqlite_profile.py)
+    SQLITE_PROFILES = {
+        'default': {},
+        'production': {
+            'journal_mode': 'WAL',        # readers no longer block the single writer
+            'synchronous': 'NORMAL',      # fsync at checkpoints only; safe with WAL
+            'cache_size': -65536,         # negative = KiB, i.e. 64 MB page cache per connection
+            'mmap_size': 268435456,       # 256 MB memory-mapped I/O
+            'busy_timeout': 30000,        # milliseconds to wait for a write lock
+            'foreign_keys': 'ON',
+            'temp_store': 'MEMORY'
+        }
+    }
+    SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'production')
+    
+    # Read replicas: comma-separated URIs, e.g. "sqlite:///lrms_replica.db"
+    # Each becomes a 'replica_<n>' bind used for read-only GET requests
+    REPLICA_DATABASE_URIS = [uri.strip() for uri in os.environ.get('REPLICA_DATABASE_URIS', '').split(',') if uri.strip()]
+    SQLALCHEMY_BINDS = {f'replica_{n}': uri for n, uri in enumerate(REPLICA_DATABASE_URIS, start=1)}
+    # Seconds a client keeps reading from the primary after it writes
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 10))
+    
+    # Per-request SQL profiling shown at /admin/performance (opt-in)
+    SQL_PROFILER_ENABLED = os.environ.get('SQL_PROFILER', 'False').lower() == 'true'
+    SQL_PROFILER_BUFFER_SIZE = 500          # requests kept in the ring buffer
+    SQL_PROFILER_N_PLUS_ONE_THRESHOLD = 5   # repeats of one statement shape that flag an N+1
+    SQL_PROFILER_SLOW_STATEMENTS = 5        # slowest statements kept per request
+    
+    # Columnar analytics snapshots written by `flask snapshot-analytics`
+    ANALYTICS_SNAPSHOT_DIR = os.environ.get('ANALYTICS_SNAPSHOT_DIR', 'snapshots')
+    ANALYTICS_SNAPSHOT_RETENTION = int(os.environ.get('ANALYTICS_SNAPSHOT_RETENTION', 7))  # snapshots kept
+    
+    # Parcel page caching (see utils/parcel_revisions.py)
+    PARCEL_FRAGMENT_CACHE_SIZE = int(os.environ.get('PARCEL_FRAGMENT_CACHE_SIZE', 500))  # rendered bodies kept per process, 0 disables
+    RELEASE_ID = os.environ.get('RELEASE_ID', '')  # part of every ETag; change on deploy so browsers drop pages from old templates
+    
+    # Compiled Jinja templates shared by all workers (relative to the app directory, empty disables)
+    TEMPLATE_CACHE_DIR = os.environ.get('TEMPLATE_CACHE_DIR', '.jinja_cache')
     
     # Security Configuration
     SECRET_KEY = os.environ.get('SECRET_KEY') or "your_secret_key_here_change_in_production"
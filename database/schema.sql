@@ -217,6 +217,112 @@ CREATE TABLE audit_log (
     INDEX idx_user_id (user_id)
 );
 
+-- 13. Document Text Table (extracted contents for full-text search)
+CREATE TABLE document_text (
+    document_id INT PRIMARY KEY,
+    content MEDIUMTEXT NULL,
+    status ENUM('Indexed', 'Empty', 'Unsupported', 'Failed') NOT NULL DEFAULT 'Indexed',
+    error_message VARCHAR(500) NULL,
+    extracted_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (document_id) REFERENCES document(document_id) ON DELETE CASCADE,
+    INDEX idx_status (status),
+    FULLTEXT INDEX ft_document_text_content (content)
+);
+
+-- 14. Table Statistic Table (row counters maintained by the application)
+CREATE TABLE table_statistic (
+    table_name VARCHAR(100) PRIMARY KEY,
+    row_count BIGINT NOT NULL DEFAULT 0,
+    source ENUM('Exact', 'Estimated') NOT NULL DEFAULT 'Exact',
+    refreshed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 15. Audit Facet Daily Table (audit log filter counts, rolled up per day)
+CREATE TABLE audit_facet_daily (
+    day DATE NOT NULL,
+    table_name VARCHAR(100) NOT NULL,
+    action ENUM('INSERT', 'UPDATE', 'DELETE') NOT NULL,
+    user_id INT NOT NULL DEFAULT 0,
+    event_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, table_name, action, user_id)
+);
+
+-- 16. Import Checkpoint Table (progress of resumable bulk imports)
+CREATE TABLE import_checkpoint (
+    source_key CHAR(64) PRIMARY KEY,
+    source_path VARCHAR(500) NOT NULL,
+    file_size BIGINT NOT NULL,
+    rows_committed INT NOT NULL DEFAULT 0,
+    chunks_committed INT NOT NULL DEFAULT 0,
+    error_rows INT NOT NULL DEFAULT 0,
+    status ENUM('Running', 'Completed') NOT NULL DEFAULT 'Running',
+    started_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 17. Parcel Share Total Table (active share sum per parcel, maintained with ownership changes)
+CREATE TABLE parcel_share_total (
+    parcel_id INT PRIMARY KEY,
+    active_share_sum DECIMAL(7, 4) NOT NULL DEFAULT 0,
+    active_owner_count INT NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (parcel_id) REFERENCES parcel(parcel_id) ON DELETE CASCADE
+);
+
+-- 18. Owner Portfolio Table (current holdings per owner, maintained with ownership/tax/encumbrance changes)
+CREATE TABLE owner_portfolio (
+    owner_id INT PRIMARY KEY,
+    parcel_count INT NOT NULL DEFAULT 0,
+    effective_area DECIMAL(18, 4) NOT NULL DEFAULT 0,
+    outstanding_tax DECIMAL(15, 2) NOT NULL DEFAULT 0,
+    active_encumbrances INT NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (owner_id) REFERENCES owner(owner_id) ON DELETE CASCADE,
+    INDEX idx_owner_portfolio_area (effective_area, owner_id),
+    INDEX idx_owner_portfolio_parcels (parcel_count, owner_id),
+    INDEX idx_owner_portfolio_tax (outstanding_tax, owner_id),
+    INDEX idx_owner_portfolio_encumbrances (active_encumbrances, owner_id)
+);
+
+-- 19. Agreement Notice Table (expiry notices written by the scan-agreement-expiry job)
+CREATE TABLE agreement_notice (
+    notice_id INT AUTO_INCREMENT PRIMARY KEY,
+    agreement_id INT NOT NULL,
+    parcel_id INT NOT NULL,
+    owner_id INT NOT NULL,
+    tenant_id INT NOT NULL,
+    end_date DATE NOT NULL,
+    status ENUM('Pending', 'Acknowledged') NOT NULL DEFAULT 'Pending',
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    acknowledged_by INT NULL,
+    acknowledged_at DATETIME NULL,
+    FOREIGN KEY (agreement_id) REFERENCES tenant_agreement(agreement_id) ON DELETE CASCADE,
+    FOREIGN KEY (parcel_id) REFERENCES parcel(parcel_id),
+    FOREIGN KEY (owner_id) REFERENCES owner(owner_id),
+    FOREIGN KEY (tenant_id) REFERENCES owner(owner_id),
+    FOREIGN KEY (acknowledged_by) REFERENCES user_account(user_id) ON DELETE SET NULL,
+    UNIQUE KEY uq_agreement_notice_term (agreement_id, end_date),
+    INDEX idx_agreement_notice_status_created (status, created_at, notice_id)
+);
+
+-- 20. Scan Watermark Table (resume position of incremental scan jobs)
+CREATE TABLE scan_watermark (
+    job_name VARCHAR(100) PRIMARY KEY,
+    position_date DATE NULL,
+    position_id INT NULL,
+    last_run_at DATETIME NULL,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 21. Parcel Revision Table (change counter behind the parcel page ETag / Last-Modified)
+CREATE TABLE parcel_revision (
+    parcel_id INT PRIMARY KEY,
+    version INT NOT NULL DEFAULT 1,
+    changed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (parcel_id) REFERENCES parcel(parcel_id) ON DELETE CASCADE
+);
+
 -- Add foreign key constraint for current_version_id after parcel_version table is created
 ALTER TABLE parcel ADD CONSTRAINT fk_parcel_current_version 
     FOREIGN KEY (current_version_id) REFERENCES parcel_version(version_id) ON DELETE SET NULL;
@@ -230,6 +336,22 @@ CREATE INDEX idx_audit_log_composite ON audit_log(table_name, record_pk_value, t
 CREATE INDEX idx_ownership_active ON ownership(parcel_id, date_to);
 CREATE INDEX idx_mutation_pending ON mutation(status, created_at);
 CREATE INDEX idx_tax_unpaid ON tax_assessment(status, assessment_year);
+CREATE INDEX idx_mutation_created_id ON mutation(created_at, mutation_id);
+CREATE INDEX idx_mutation_status_created_id ON mutation(status, created_at, mutation_id);
+CREATE INDEX idx_audit_log_timestamp_id ON audit_log(timestamp, audit_id);
+CREATE INDEX idx_audit_log_table_timestamp_id ON audit_log(table_name, timestamp, audit_id);
+CREATE INDEX idx_audit_log_action_timestamp_id ON audit_log(action, timestamp, audit_id);
+CREATE INDEX idx_audit_log_user_timestamp_id ON audit_log(user_id, timestamp, audit_id);
+CREATE INDEX idx_tax_paid_on ON tax_assessment(paid_on);
+CREATE INDEX idx_mutation_chain_from ON mutation(parcel_id, from_owner_id, date_of_mutation);
+CREATE INDEX idx_mutation_chain_to ON mutation(parcel_id, to_owner_id, date_of_mutation);
+CREATE INDEX idx_ownership_chain ON ownership(parcel_id, owner_id, date_from);
+CREATE INDEX idx_ownership_owner_active ON ownership(owner_id, date_to);
+CREATE INDEX idx_tax_parcel_status ON tax_assessment(parcel_id, status);
+CREATE INDEX idx_encumbrance_parcel_status ON encumbrance(parcel_id, status);
+CREATE INDEX idx_tenant_agreement_end_date ON tenant_agreement(end_date, agreement_id);
+CREATE INDEX idx_tenant_agreement_created ON tenant_agreement(created_at, agreement_id);
+CREATE INDEX idx_tenant_agreement_renewal ON tenant_agreement(parcel_id, tenant_id, start_date);
 
 -- Views for common queries
 CREATE VIEW active_ownerships AS
@@ -19,6 +19,10 @@ DROP TRIGGER IF EXISTS mutation_audit_delete;
 DROP TRIGGER IF EXISTS tax_assessment_audit_insert;
 DROP TRIGGER IF EXISTS tax_assessment_audit_update;
 DROP TRIGGER IF EXISTS tax_assessment_audit_delete;
+DROP TRIGGER IF EXISTS audit_log_count_insert;
+DROP TRIGGER IF EXISTS audit_log_count_delete;
+DROP TRIGGER IF EXISTS audit_facet_insert;
+DROP TRIGGER IF EXISTS audit_facet_delete;
 
 -- OWNER TABLE TRIGGERS
 DELIMITER $$
@@ -457,6 +461,37 @@ END$$
 
 DELIMITER ;
 
+-- AUDIT LOG COUNTER TRIGGERS
+-- Every audit row comes from the triggers above, not from the application, so
+-- the audit_log row counter on /admin/system-info is moved here
+CREATE TRIGGER audit_log_count_insert
+AFTER INSERT ON audit_log
+FOR EACH ROW
+    UPDATE table_statistic SET row_count = row_count + 1, updated_at = UTC_TIMESTAMP()
+    WHERE table_name = 'audit_log';
+
+CREATE TRIGGER audit_log_count_delete
+AFTER DELETE ON audit_log
+FOR EACH ROW
+    UPDATE table_statistic SET row_count = row_count - 1, updated_at = UTC_TIMESTAMP()
+    WHERE table_name = 'audit_log';
+
+-- AUDIT LOG FILTER FACET TRIGGERS
+-- Per-day counts behind the audit log filter bar; rows without a user count under user_id 0
+CREATE TRIGGER audit_facet_insert
+AFTER INSERT ON audit_log
+FOR EACH ROW
+    INSERT INTO audit_facet_daily (day, table_name, action, user_id, event_count)
+    VALUES (DATE(NEW.timestamp), NEW.table_name, NEW.action, COALESCE(NEW.user_id, 0), 1)
+    ON DUPLICATE KEY UPDATE event_count = event_count + 1;
+
+CREATE TRIGGER audit_facet_delete
+AFTER DELETE ON audit_log
+FOR EACH ROW
+    UPDATE audit_facet_daily SET event_count = event_count - 1
+    WHERE day = DATE(OLD.timestamp) AND table_name = OLD.table_name AND action = OLD.action
+    AND user_id = COALESCE(OLD.user_id, 0);
+
 -- Procedure to set current user for audit logging
 DELIMITER $$
 CREATE PROCEDURE SetCurrentUser(IN user_id INT)
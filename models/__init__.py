@@ -1,6 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
+from utils.replica_routing import RoutingSession
 
-db = SQLAlchemy()
+# Reads in GET requests may be served by replica binds (see utils/replica_routing.py)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 # Import all models to ensure they are registered with SQLAlchemy
 from .owner import Owner
@@ -15,3 +17,12 @@ from .document import Document
 from .encumbrance import Encumbrance
 from .tax_assessment import TaxAssessment
 from .audit_log import AuditLog
+from .document_text import DocumentText
+from .table_statistic import TableStatistic
+from .audit_facet import AuditFacetDaily
+from .import_checkpoint import ImportCheckpoint
+from .parcel_share_total import ParcelShareTotal
+from .owner_portfolio import OwnerPortfolio
+from .agreement_notice import AgreementNotice
+from .scan_watermark import ScanWatermark
+from .parcel_revision import ParcelRevision
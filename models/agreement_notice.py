@@ -0,0 +1,26 @@
+from . import db
+from datetime import datetime
+
+class AgreementNotice(db.Model):
+    __tablename__ = 'agreement_notice'
+    __table_args__ = (
+        # One notice per agreement term; re-scans and overlapping runs cannot duplicate it
+        db.UniqueConstraint('agreement_id', 'end_date', name='uq_agreement_notice_term'),
+        db.Index('idx_agreement_notice_status_created', 'status', 'created_at', 'notice_id'),
+    )
+
+    notice_id = db.Column(db.Integer, primary_key=True)
+    agreement_id = db.Column(db.Integer, db.ForeignKey('tenant_agreement.agreement_id', ondelete='CASCADE'), nullable=False)
+    parcel_id = db.Column(db.Integer, db.ForeignKey('parcel.parcel_id'), nullable=False)
+    owner_id = db.Column(db.Integer, db.ForeignKey('owner.owner_id'), nullable=False)
+    tenant_id = db.Column(db.Integer, db.ForeignKey('owner.owner_id'), nullable=False)
+    end_date = db.Column(db.Date, nullable=False)
+    status = db.Column(db.Enum('Pending', 'Acknowledged', name='agreement_notice_status_enum'), nullable=False, default='Pending')
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    acknowledged_by = db.Column(db.Integer, db.ForeignKey('user_account.user_id'))
+    acknowledged_at = db.Column(db.DateTime)
+
+    agreement = db.relationship('TenantAgreement', backref=db.backref('notices', lazy=True), lazy=True)
+
+    def __repr__(self):
+        return f'<AgreementNotice {self.notice_id} - Agreement {self.agreement_id} ends {self.end_date}>'
@@ -0,0 +1,13 @@
+from . import db
+
+class AuditFacetDaily(db.Model):
+    __tablename__ = 'audit_facet_daily'
+    
+    day = db.Column(db.Date, primary_key=True)
+    table_name = db.Column(db.String(100), primary_key=True)
+    action = db.Column(db.String(10), primary_key=True)
+    user_id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # 0 = system (no user)
+    event_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<AuditFacetDaily {self.day} {self.table_name} {self.action} user={self.user_id}: {self.event_count}>'
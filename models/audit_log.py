@@ -3,6 +3,13 @@ from datetime import datetime
 
 class AuditLog(db.Model):
     __tablename__ = 'audit_log'
+    __table_args__ = (
+        # Keyset pagination: newest-first on (timestamp, audit_id), optionally filtered
+        db.Index('idx_audit_log_timestamp_id', 'timestamp', 'audit_id'),
+        db.Index('idx_audit_log_table_timestamp_id', 'table_name', 'timestamp', 'audit_id'),
+        db.Index('idx_audit_log_action_timestamp_id', 'action', 'timestamp', 'audit_id'),
+        db.Index('idx_audit_log_user_timestamp_id', 'user_id', 'timestamp', 'audit_id'),
+    )
     
     audit_id = db.Column(db.Integer, primary_key=True)
     table_name = db.Column(db.String(100), nullable=False)
@@ -0,0 +1,17 @@
+from . import db
+from datetime import datetime
+
+class DocumentText(db.Model):
+    __tablename__ = 'document_text'
+
+    document_id = db.Column(db.Integer, db.ForeignKey('document.document_id', ondelete='CASCADE'), primary_key=True)
+    content = db.Column(db.Text)
+    status = db.Column(db.Enum('Indexed', 'Empty', 'Unsupported', 'Failed', name='document_text_status_enum'), nullable=False, default='Indexed')
+    error_message = db.Column(db.String(500))
+    extracted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    document = db.relationship('Document', backref=db.backref('text_index', uselist=False, cascade='all, delete-orphan'))
+
+    def __repr__(self):
+        return f'<DocumentText {self.document_id} - {self.status}>'
@@ -3,6 +3,9 @@ from datetime import datetime
 
 class Encumbrance(db.Model):
     __tablename__ = 'encumbrance'
+    __table_args__ = (
+        db.Index('idx_encumbrance_parcel_status', 'parcel_id', 'status'),
+    )
     
     encumbrance_id = db.Column(db.Integer, primary_key=True)
     parcel_id = db.Column(db.Integer, db.ForeignKey('parcel.parcel_id'), nullable=False)
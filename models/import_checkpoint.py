@@ -0,0 +1,18 @@
+from . import db
+from datetime import datetime
+
+class ImportCheckpoint(db.Model):
+    __tablename__ = 'import_checkpoint'
+    
+    source_key = db.Column(db.String(64), primary_key=True)  # sha256 of the absolute source path
+    source_path = db.Column(db.String(500), nullable=False)
+    file_size = db.Column(db.BigInteger, nullable=False)
+    rows_committed = db.Column(db.Integer, nullable=False, default=0)
+    chunks_committed = db.Column(db.Integer, nullable=False, default=0)
+    error_rows = db.Column(db.Integer, nullable=False, default=0)
+    status = db.Column(db.Enum('Running', 'Completed', name='import_checkpoint_status_enum'), nullable=False, default='Running')
+    started_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<ImportCheckpoint {self.source_path}: {self.rows_committed} rows ({self.status})>'
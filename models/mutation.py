@@ -3,6 +3,14 @@ from datetime import datetime
 
 class Mutation(db.Model):
     __tablename__ = 'mutation'
+    __table_args__ = (
+        # Keyset pagination: newest-first on (created_at, mutation_id), optionally by status
+        db.Index('idx_mutation_created_id', 'created_at', 'mutation_id'),
+        db.Index('idx_mutation_status_created_id', 'status', 'created_at', 'mutation_id'),
+        # Chain of title: seller side of each hop, and the "not created by a mutation" root test
+        db.Index('idx_mutation_chain_from', 'parcel_id', 'from_owner_id', 'date_of_mutation'),
+        db.Index('idx_mutation_chain_to', 'parcel_id', 'to_owner_id', 'date_of_mutation'),
+    )
     
     mutation_id = db.Column(db.Integer, primary_key=True)
     parcel_id = db.Column(db.Integer, db.ForeignKey('parcel.parcel_id'), nullable=False)
@@ -0,0 +1,24 @@
+from . import db
+from datetime import datetime
+
+class OwnerPortfolio(db.Model):
+    __tablename__ = 'owner_portfolio'
+    __table_args__ = (
+        # Top landholder reports: keyset pages, largest first, on each sortable measure
+        db.Index('idx_owner_portfolio_area', 'effective_area', 'owner_id'),
+        db.Index('idx_owner_portfolio_parcels', 'parcel_count', 'owner_id'),
+        db.Index('idx_owner_portfolio_tax', 'outstanding_tax', 'owner_id'),
+        db.Index('idx_owner_portfolio_encumbrances', 'active_encumbrances', 'owner_id'),
+    )
+
+    owner_id = db.Column(db.Integer, db.ForeignKey('owner.owner_id', ondelete='CASCADE'), primary_key=True, autoincrement=False)
+    parcel_count = db.Column(db.Integer, nullable=False, default=0)  # active ownerships (one per parcel held)
+    effective_area = db.Column(db.Numeric(18, 4), nullable=False, default=0)  # sum of total_area x share_fraction
+    outstanding_tax = db.Column(db.Numeric(15, 2), nullable=False, default=0)  # unpaid tax x share_fraction
+    active_encumbrances = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    owner = db.relationship('Owner', backref=db.backref('portfolio', uselist=False, lazy=True), lazy=True)
+
+    def __repr__(self):
+        return f'<OwnerPortfolio {self.owner_id}: {self.parcel_count} parcels, {self.effective_area} acres>'
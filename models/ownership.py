@@ -3,6 +3,12 @@ from datetime import datetime
 
 class Ownership(db.Model):
     __tablename__ = 'ownership'
+    __table_args__ = (
+        # Chain of title: the buyer's ownership opened by a mutation
+        db.Index('idx_ownership_chain', 'parcel_id', 'owner_id', 'date_from'),
+        # Owner portfolios: an owner's active holdings
+        db.Index('idx_ownership_owner_active', 'owner_id', 'date_to'),
+    )
     
     ownership_id = db.Column(db.Integer, primary_key=True)
     parcel_id = db.Column(db.Integer, db.ForeignKey('parcel.parcel_id'), nullable=False)
@@ -0,0 +1,12 @@
+from . import db
+from datetime import datetime
+
+class ParcelRevision(db.Model):
+    __tablename__ = 'parcel_revision'
+
+    parcel_id = db.Column(db.Integer, db.ForeignKey('parcel.parcel_id', ondelete='CASCADE'), primary_key=True, autoincrement=False)
+    version = db.Column(db.Integer, nullable=False, default=1)  # bumped by every change shown on the parcel page
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<ParcelRevision {self.parcel_id} v{self.version}>'
@@ -0,0 +1,13 @@
+from . import db
+from datetime import datetime
+
+class ParcelShareTotal(db.Model):
+    __tablename__ = 'parcel_share_total'
+
+    parcel_id = db.Column(db.Integer, db.ForeignKey('parcel.parcel_id', ondelete='CASCADE'), primary_key=True, autoincrement=False)
+    active_share_sum = db.Column(db.Numeric(7, 4), nullable=False, default=0)  # sum of share_fraction where date_to IS NULL
+    active_owner_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<ParcelShareTotal {self.parcel_id}: {self.active_share_sum} across {self.active_owner_count} owners>'
@@ -0,0 +1,14 @@
+from . import db
+from datetime import datetime
+
+class ScanWatermark(db.Model):
+    __tablename__ = 'scan_watermark'
+
+    job_name = db.Column(db.String(100), primary_key=True)
+    position_date = db.Column(db.Date)        # sort key of the last row processed
+    position_id = db.Column(db.Integer)       # tie-breaker id of the last row processed
+    last_run_at = db.Column(db.DateTime)      # start of the last completed run
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<ScanWatermark {self.job_name} at ({self.position_date}, {self.position_id})>'
@@ -0,0 +1,14 @@
+from . import db
+from datetime import datetime
+
+class TableStatistic(db.Model):
+    __tablename__ = 'table_statistic'
+    
+    table_name = db.Column(db.String(100), primary_key=True)
+    row_count = db.Column(db.BigInteger, nullable=False, default=0)
+    source = db.Column(db.Enum('Exact', 'Estimated', name='table_statistic_source_enum'), nullable=False, default='Exact')
+    refreshed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<TableStatistic {self.table_name}: {self.row_count}>'
@@ -3,6 +3,10 @@ from datetime import datetime
 
 class TaxAssessment(db.Model):
     __tablename__ = 'tax_assessment'
+    __table_args__ = (
+        db.Index('idx_tax_paid_on', 'paid_on'),
+        db.Index('idx_tax_parcel_status', 'parcel_id', 'status'),
+    )
     
     tax_id = db.Column(db.Integer, primary_key=True)
     parcel_id = db.Column(db.Integer, db.ForeignKey('parcel.parcel_id'), nullable=False)
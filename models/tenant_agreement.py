@@ -3,6 +3,14 @@ from datetime import datetime
 
 class TenantAgreement(db.Model):
     __tablename__ = 'tenant_agreement'
+    __table_args__ = (
+        # Expiry scanner and "expiring soon": range scans on end date
+        db.Index('idx_tenant_agreement_end_date', 'end_date', 'agreement_id'),
+        # Agreements added since the last scan, whatever their end date
+        db.Index('idx_tenant_agreement_created', 'created_at', 'agreement_id'),
+        # Renewal check: a later agreement for the same parcel and tenant
+        db.Index('idx_tenant_agreement_renewal', 'parcel_id', 'tenant_id', 'start_date'),
+    )
     
     agreement_id = db.Column(db.Integer, primary_key=True)
     parcel_id = db.Column(db.Integer, db.ForeignKey('parcel.parcel_id'), nullable=False)
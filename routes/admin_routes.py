@@ -15,7 +15,12 @@ from models.mutation import Mutation
 from models.tax_assessment import TaxAssessment
 from models.audit_log import AuditLog
 from models.location import Location
-from sqlalchemy import func, text
+from utils.table_stats import table_stats
+from utils.audit_facets import audit_facets, SYSTEM_USER_ID
+from utils.sql_profiler import sql_profiler
+from utils.keyset import keyset_paginate, estimate_total
+from utils.exports import export_response, AUDIT_LOG_COLUMNS
+from sqlalchemy import func
 from datetime import datetime, timedelta
 import json
 
@@ -82,7 +87,7 @@ def dashboard():
         'total_users': total_users,
         'pending_mutations': pending_mutations,
         'location_stats': location_stats,
-        'category_stats': category_stats,
+        'category_stats': [[stat.land_category, stat.count] for stat in category_stats],
         'tax_stats': tax_stats,
         'recent_mutations': recent_mutations,
         'recent_audit_logs': recent_audit_logs,
@@ -154,45 +159,74 @@ def edit_user(user_id):
     
     return render_template('admin/user_form.html', user=user)
 
-@admin_bp.route('/audit-logs')
-@admin_required
-def audit_logs():
-    """View audit logs with filtering"""
-    page = request.args.get('page', 1, type=int)
-    table_filter = request.args.get('table', '')
-    action_filter = request.args.get('action', '')
-    user_filter = request.args.get('user', '')
+def _filtered_audit_logs(args):
+    """
+    Audit log query with the filter bar applied; shared by the page and the export
+    Returns: (query, filters) with an invalid day dropped from filters
+    """
+    filters = {
+        'table': args.get('table', ''),
+        'action': args.get('action', ''),
+        'user': args.get('user', ''),
+        'day': args.get('day', '')
+    }
     
     query = AuditLog.query
     
-    if table_filter:
-        query = query.filter_by(table_name=table_filter)
+    if filters['table']:
+        query = query.filter_by(table_name=filters['table'])
     
-    if action_filter:
-        query = query.filter_by(action=action_filter)
+    if filters['action']:
+        query = query.filter_by(action=filters['action'])
     
-    if user_filter:
-        query = query.filter_by(user_id=user_filter)
+    if filters['user'] == str(SYSTEM_USER_ID):
+        # The facet rollup files rows without a user under SYSTEM_USER_ID; in audit_log they are NULL
+        query = query.filter(AuditLog.user_id.is_(None))
+    elif filters['user']:
+        query = query.filter_by(user_id=filters['user'])
     
-    audit_logs = query.order_by(AuditLog.timestamp.desc()).paginate(
-        page=page, per_page=50, error_out=False
-    )
+    if filters['day']:
+        try:
+            day_start = datetime.strptime(filters['day'], '%Y-%m-%d')
+            query = query.filter(AuditLog.timestamp >= day_start,
+                                 AuditLog.timestamp < day_start + timedelta(days=1))
+        except ValueError:
+            filters['day'] = ''
+    
+    return query, filters
+
+@admin_bp.route('/audit-logs')
+@admin_required
+def audit_logs():
+    """View audit logs with filtering (keyset pagination on timestamp, audit_id)"""
+    cursor = request.args.get('cursor', '')
+    query, filters = _filtered_audit_logs(request.args)
+    
+    audit_logs = keyset_paginate(query, AuditLog.timestamp, AuditLog.audit_id, cursor=cursor, per_page=50)
     
-    # Get filter options
-    tables = db.session.query(AuditLog.table_name).distinct().all()
-    actions = db.session.query(AuditLog.action).distinct().all()
-    users = UserAccount.query.all()
+    # Maintained counter when unfiltered, capped count otherwise
+    if any(filters.values()):
+        audit_logs.total, audit_logs.total_is_estimate = estimate_total(query)
+    else:
+        counter = table_stats.get_count('audit_log')
+        audit_logs.total = counter.row_count if counter else None
+        audit_logs.total_is_estimate = True
+    
+    # Filter options with counts from the daily rollup, not DISTINCT scans of audit_log
+    facets = audit_facets.get_facets(filters)
     
     return render_template('admin/audit_logs.html', 
                          audit_logs=audit_logs,
-                         tables=[t[0] for t in tables],
-                         actions=[a[0] for a in actions],
-                         users=users,
-                         filters={
-                             'table': table_filter,
-                             'action': action_filter,
-                             'user': user_filter
-                         })
+                         facets=facets,
+                         filters=filters)
+
+@admin_bp.route('/audit-logs/export')
+@admin_required
+def export_audit_logs():
+    """Stream audit logs (same filters as the audit log page) as CSV/NDJSON"""
+    query, _ = _filtered_audit_logs(request.args)
+    query = query.order_by(AuditLog.timestamp.desc(), AuditLog.audit_id.desc())
+    return export_response(query, AUDIT_LOG_COLUMNS, 'audit_logs')
 
 @admin_bp.route('/analytics')
 @admin_required
@@ -258,28 +292,21 @@ def analytics():
 def system_info():
     """System information and health check"""
     
-    # Database statistics
-    db_stats = {}
-    tables = ['owner', 'parcel', 'ownership', 'mutation', 'tax_assessment', 'audit_log', 'user_account']
+    # Database statistics from maintained counters (no COUNT(*) scans)
+    db_stats = table_stats.get_counts()
     
-    for table in tables:
-        try:
-            result = db.session.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
-            db_stats[table] = result
-        except Exception as e:
-            db_stats[table] = f"Error: {str(e)}"
-    
-    # Recent activity summary
+    # Recent activity summary (index range scans over the last 7 days)
+    week_ago = datetime.now() - timedelta(days=7)
     activity_summary = {
         'recent_logins': UserAccount.query.filter(
-            UserAccount.last_login >= datetime.now() - timedelta(days=7)
+            UserAccount.last_login >= week_ago
         ).count(),
         'recent_mutations': Mutation.query.filter(
-            Mutation.created_at >= datetime.now() - timedelta(days=7)
+            Mutation.created_at >= week_ago
         ).count(),
         'recent_tax_payments': TaxAssessment.query.filter(
-            TaxAssessment.paid_on >= datetime.now() - timedelta(days=7)
-        ).count() if TaxAssessment.query.filter(TaxAssessment.paid_on.isnot(None)).first() else 0
+            TaxAssessment.paid_on >= week_ago.date()
+        ).count()
     }
     
     system_data = {
@@ -292,6 +319,34 @@ def system_info():
     
     return render_template('admin/system_info.html', data=system_data)
 
+@admin_bp.route('/performance')
+@admin_required
+def performance():
+    """Per-endpoint latency and SQL statistics from the request profiler"""
+    return render_template('admin/performance.html',
+                         enabled=sql_profiler.enabled,
+                         endpoints=sql_profiler.endpoint_summary(),
+                         recent_requests=sql_profiler.recent(limit=50),
+                         n_plus_one_threshold=sql_profiler.n_plus_one_threshold)
+
+@admin_bp.route('/performance/clear', methods=['POST'])
+@admin_required
+def clear_performance():
+    """Reset the profiler ring buffer"""
+    sql_profiler.clear()
+    flash('Performance data cleared.', 'success')
+    return redirect(url_for('admin.performance'))
+
+@admin_bp.route('/api/performance')
+@admin_required
+def performance_api():
+    """API endpoint for profiler data"""
+    return jsonify({
+        'enabled': sql_profiler.enabled,
+        'endpoints': sql_profiler.endpoint_summary(),
+        'recent': sql_profiler.recent(limit=request.args.get('limit', 50, type=int))
+    })
+
 @admin_bp.route('/api/analytics/charts')
 @admin_required
 def analytics_charts_api():
@@ -7,16 +7,21 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash,
 from flask_login import login_required, current_user
 from utils.decorators import role_required, registrar_required
 from utils.file_handler import file_handler
+from utils.document_search import document_search
 from models import db
 from models.document import Document
 from models.mutation import Mutation
 from models.encumbrance import Encumbrance
 from models.tenant_agreement import TenantAgreement
+from sqlalchemy import or_
 from datetime import datetime
 import os
 
 document_bp = Blueprint('document', __name__, url_prefix='/document')
 
+# Upper bound on content matches merged into the document list page
+CONTENT_HIT_LIMIT = 200
+
 @document_bp.route('/')
 @login_required
 def list_documents():
@@ -26,12 +31,19 @@ def list_documents():
     search = request.args.get('search', '')
     
     query = Document.query
+    snippets = {}
     
     if doc_type_filter:
         query = query.filter_by(doc_type=doc_type_filter)
     
     if search:
-        query = query.filter(Document.file_name.contains(search))
+        # Match on file name or on text extracted from the document itself
+        content_hits = document_search.search(search, doc_type=doc_type_filter or None, limit=CONTENT_HIT_LIMIT)
+        snippets = {hit['document_id']: hit['snippet'] for hit in content_hits}
+        query = query.filter(or_(
+            Document.file_name.contains(search),
+            Document.document_id.in_(list(snippets))
+        ))
     
     documents = query.order_by(Document.created_at.desc()).paginate(
         page=page, per_page=20, error_out=False
@@ -44,7 +56,8 @@ def list_documents():
                          documents=documents,
                          doc_types=doc_types,
                          doc_type_filter=doc_type_filter,
-                         search=search)
+                         search=search,
+                         snippets=snippets)
 
 @document_bp.route('/<int:document_id>')
 @login_required
@@ -103,6 +116,9 @@ def upload_document():
             db.session.add(document)
             db.session.commit()
             
+            # Extract text for full-text search in the background
+            document_search.submit(document.document_id)
+            
             flash('Document uploaded successfully!', 'success')
             return redirect(url_for('document.view_document', document_id=document.document_id))
         
@@ -159,27 +175,46 @@ def delete_document(document_id):
 @document_bp.route('/api/search')
 @login_required
 def search_documents_api():
-    """API endpoint for document search"""
+    """API endpoint for ranked document search over file names and contents"""
     query = request.args.get('q', '')
     doc_type = request.args.get('type', '')
+    limit = min(request.args.get('limit', 10, type=int), 50)
     
     if len(query) < 2:
         return jsonify([])
     
-    search_query = Document.query.filter(Document.file_name.contains(query))
-    
-    if doc_type:
-        search_query = search_query.filter_by(doc_type=doc_type)
-    
-    documents = search_query.limit(10).all()
-    
-    return jsonify([{
-        'id': doc.document_id,
-        'file_name': doc.file_name,
-        'doc_type': doc.doc_type,
-        'registered_at': doc.registered_at.strftime('%Y-%m-%d') if doc.registered_at else None,
-        'registration_office': doc.registration_office
-    } for doc in documents])
+    # Content matches come first, ordered by relevance
+    content_hits = document_search.search(query, doc_type=doc_type or None, limit=limit)
+    hits = {hit['document_id']: hit for hit in content_hits}
+    
+    # Fill remaining slots with file name matches
+    if len(hits) < limit:
+        name_query = Document.query.filter(Document.file_name.contains(query))
+        if doc_type:
+            name_query = name_query.filter_by(doc_type=doc_type)
+        if hits:
+            name_query = name_query.filter(Document.document_id.notin_(list(hits)))
+        for doc in name_query.limit(limit - len(hits)).all():
+            hits[doc.document_id] = {'document_id': doc.document_id, 'score': 0.0, 'snippet': None}
+    
+    documents = {doc.document_id: doc for doc in Document.query.filter(Document.document_id.in_(list(hits))).all()}
+    
+    results = []
+    for document_id, hit in hits.items():
+        doc = documents.get(document_id)
+        if not doc:
+            continue
+        results.append({
+            'id': doc.document_id,
+            'file_name': doc.file_name,
+            'doc_type': doc.doc_type,
+            'registered_at': doc.registered_at.strftime('%Y-%m-%d') if doc.registered_at else None,
+            'registration_office': doc.registration_office,
+            'score': hit['score'],
+            'snippet': str(hit['snippet']) if hit['snippet'] else None
+        })
+    
+    return jsonify(results)
 
 @document_bp.route('/api/stats')
 @login_required
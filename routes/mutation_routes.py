@@ -4,26 +4,55 @@ from models import db
 from models.mutation import Mutation
 from models.parcel import Parcel
 from models.owner import Owner
+from models.ownership import Ownership
+from utils.decorators import query_budget
+from utils.eager_loading import mutation_list_options
+from utils.keyset import keyset_paginate, estimate_total
+from utils.table_stats import table_stats
+from utils.exports import export_response, MUTATION_COLUMNS, FromOwner, ToOwner
 from datetime import datetime, date
 
 mutation_bp = Blueprint('mutation', __name__, url_prefix='/mutation')
 
+def _filter_mutations(query, status_filter):
+    """Status filter shared by the list page and the export"""
+    if status_filter:
+        query = query.filter_by(status=status_filter)
+    return query
+
 @mutation_bp.route('/')
 @login_required
+@query_budget(4)
 def list_mutations():
-    page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor', '')
+    per_page = min(max(request.args.get('per_page', 20, type=int), 1), 100)
     status_filter = request.args.get('status', '')
     
-    query = Mutation.query
+    query = _filter_mutations(Mutation.query, status_filter)
     
-    if status_filter:
-        query = query.filter_by(status=status_filter)
+    # Keyset pagination on (created_at, mutation_id); deep pages cost the same as page 1
+    mutations = keyset_paginate(query.options(*mutation_list_options()), Mutation.created_at, Mutation.mutation_id,
+                                cursor=cursor, per_page=per_page)
     
-    mutations = query.order_by(Mutation.created_at.desc()).paginate(
-        page=page, per_page=20, error_out=False
-    )
+    if status_filter:
+        mutations.total, mutations.total_is_estimate = estimate_total(query)
+    else:
+        counter = table_stats.get_count('mutation')
+        mutations.total = counter.row_count if counter else None
+        mutations.total_is_estimate = True
     return render_template('mutation_list.html', mutations=mutations, status_filter=status_filter)
 
+@mutation_bp.route('/export')
+@login_required
+def export_mutations():
+    """Stream the mutation list (same status filter as the list page) as CSV/NDJSON"""
+    query = _filter_mutations(Mutation.query, request.args.get('status', ''))
+    query = query.join(Parcel, Mutation.parcel_id == Parcel.parcel_id)
+    query = query.join(FromOwner, Mutation.from_owner_id == FromOwner.owner_id)
+    query = query.join(ToOwner, Mutation.to_owner_id == ToOwner.owner_id)
+    query = query.order_by(Mutation.created_at.desc(), Mutation.mutation_id.desc())
+    return export_response(query, MUTATION_COLUMNS, 'mutations')
+
 @mutation_bp.route('/<int:mutation_id>')
 @login_required
 def view_mutation(mutation_id):
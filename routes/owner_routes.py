@@ -1,15 +1,22 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
-from utils.decorators import role_required, registrar_required
+from utils.decorators import role_required, registrar_required, query_budget
+from utils.eager_loading import owner_ownership_options, owner_agreement_options
 from models import db
 from models.owner import Owner
 from models.ownership import Ownership
+from models.parcel import Parcel
+from utils.exports import export_response, OWNERSHIP_COLUMNS
+from utils.share_totals import share_totals
+from utils.owner_portfolios import owner_portfolios
 from datetime import datetime
+from decimal import Decimal
 
 owner_bp = Blueprint('owner', __name__, url_prefix='/owner')
 
 @owner_bp.route('/')
 @login_required
+@query_budget(4)
 def list_owners():
     print(f"DEBUG: list_owners route called by user {current_user.username}")
     page = request.args.get('page', 1, type=int)
@@ -21,27 +28,83 @@ def list_owners():
 
 @owner_bp.route('/<int:owner_id>')
 @login_required
+@query_budget(7)
 def view_owner(owner_id):
     from models.tenant_agreement import TenantAgreement
     
     owner = Owner.query.get_or_404(owner_id)
-    ownerships = Ownership.query.filter_by(owner_id=owner_id).all()
+    ownerships = Ownership.query.options(*owner_ownership_options()).filter_by(owner_id=owner_id).all()
     
     # Get tenant agreements where this owner is the property owner
-    agreements_as_owner = TenantAgreement.query.filter_by(owner_id=owner_id).all()
+    agreements_as_owner = TenantAgreement.query.options(*owner_agreement_options()).filter_by(owner_id=owner_id).all()
     
     # Get tenant agreements where this owner is the tenant
-    agreements_as_tenant = TenantAgreement.query.filter_by(tenant_id=owner_id).all()
+    agreements_as_tenant = TenantAgreement.query.options(*owner_agreement_options()).filter_by(tenant_id=owner_id).all()
     
     from datetime import date
     
     return render_template('owner_details.html', 
                          owner=owner, 
                          ownerships=ownerships,
+                         portfolio=owner_portfolios.get(owner_id),
                          agreements_as_owner=agreements_as_owner,
                          agreements_as_tenant=agreements_as_tenant,
                          today=date.today())
 
+@owner_bp.route('/portfolios')
+@login_required
+@query_budget(2)
+def top_landholders():
+    """Owners ranked by current holdings, from the maintained portfolio table"""
+    sort = request.args.get('sort', 'area')
+    if sort not in owner_portfolios.SORTS:
+        sort = 'area'
+    portfolios = owner_portfolios.top(sort=sort, cursor=request.args.get('cursor', ''), per_page=25)
+    return render_template('owner_portfolios.html', portfolios=portfolios, sort=sort)
+
+@owner_bp.route('/api/portfolios')
+@login_required
+@query_budget(2)
+def portfolios_api():
+    sort = request.args.get('sort', 'area')
+    if sort not in owner_portfolios.SORTS:
+        return jsonify({'error': f"sort must be one of {', '.join(owner_portfolios.SORTS)}"}), 400
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
+    portfolios = owner_portfolios.top(sort=sort, cursor=request.args.get('cursor', ''), per_page=per_page)
+    
+    return jsonify({
+        'items': [{
+            'owner_id': portfolio.owner_id,
+            'name': portfolio.owner.name,
+            'owner_type': portfolio.owner.owner_type,
+            'parcel_count': portfolio.parcel_count,
+            'effective_area': float(portfolio.effective_area),
+            'outstanding_tax': float(portfolio.outstanding_tax),
+            'active_encumbrances': portfolio.active_encumbrances
+        } for portfolio in portfolios.items],
+        'next_cursor': portfolios.next_cursor,
+        'prev_cursor': portfolios.prev_cursor
+    })
+
+@owner_bp.route('/ownerships/export')
+@login_required
+def export_ownerships():
+    """Stream ownership records as CSV/NDJSON; filter with owner_id, parcel_id, current=1"""
+    query = Ownership.query.join(Owner, Ownership.owner_id == Owner.owner_id)
+    query = query.join(Parcel, Ownership.parcel_id == Parcel.parcel_id)
+    
+    owner_id = request.args.get('owner_id', type=int)
+    parcel_id = request.args.get('parcel_id', type=int)
+    if owner_id:
+        query = query.filter(Ownership.owner_id == owner_id)
+    if parcel_id:
+        query = query.filter(Ownership.parcel_id == parcel_id)
+    if request.args.get('current') == '1':
+        query = query.filter(Ownership.date_to.is_(None))
+    
+    query = query.order_by(Ownership.ownership_id)
+    return export_response(query, OWNERSHIP_COLUMNS, 'ownerships')
+
 @owner_bp.route('/create', methods=['GET', 'POST'])
 @registrar_required
 def create_owner():
@@ -155,6 +218,13 @@ def add_ownership(owner_id):
                 flash('This owner already has active ownership of this parcel.', 'error')
                 return redirect(url_for('owner.add_ownership', owner_id=owner_id))
             
+            # Locks the parcel's share total until commit, so concurrent additions queue here
+            available = share_totals.available(parcel_id, lock=True)
+            if Decimal(str(share_fraction)) > available:
+                db.session.rollback()
+                flash(f'Only {available * 100:.2f}% of parcel {parcel.survey_no} is unallocated.', 'error')
+                return redirect(url_for('owner.add_ownership', owner_id=owner_id))
+            
             # Create new ownership
             ownership = Ownership(
                 owner_id=owner_id,
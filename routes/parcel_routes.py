@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, make_response
 from flask_login import login_required, current_user
 from models import db
 from models.parcel import Parcel
@@ -6,18 +6,21 @@ from models.location import Location
 from models.ownership import Ownership
 from models.encumbrance import Encumbrance
 from models.tax_assessment import TaxAssessment
+from utils.decorators import query_budget
+from utils.eager_loading import (
+    parcel_list_options, parcel_detail_options,
+    parcel_ownership_options, parcel_encumbrance_options
+)
+from utils.exports import export_response, PARCEL_COLUMNS
+from utils.chain_of_title import chain_of_title
+from utils.parcel_revisions import parcel_revisions
+from markupsafe import Markup
 from sqlalchemy import or_
 
 parcel_bp = Blueprint('parcel', __name__, url_prefix='/parcel')
 
-@parcel_bp.route('/')
-@login_required
-def list_parcels():
-    page = request.args.get('page', 1, type=int)
-    search = request.args.get('search', '')
-    
-    query = Parcel.query.join(Location)
-    
+def _filter_parcels(query, search):
+    """Search filter shared by the list page and the export (query must join Location)"""
     if search:
         query = query.filter(
             or_(
@@ -27,25 +30,83 @@ def list_parcels():
                 Location.district.contains(search)
             )
         )
+    return query
+
+@parcel_bp.route('/')
+@login_required
+@query_budget(4)
+def list_parcels():
+    page = request.args.get('page', 1, type=int)
+    per_page = min(max(request.args.get('per_page', 20, type=int), 1), 100)
+    search = request.args.get('search', '')
+    
+    query = _filter_parcels(Parcel.query.join(Location).options(*parcel_list_options(location_joined=True)), search)
     
     parcels = query.paginate(
-        page=page, per_page=20, error_out=False
+        page=page, per_page=per_page, error_out=False
     )
     return render_template('parcel_list.html', parcels=parcels, search=search)
 
+@parcel_bp.route('/export')
+@login_required
+def export_parcels():
+    """Stream the parcel list (same search as the list page) as CSV/NDJSON"""
+    search = request.args.get('search', '')
+    query = _filter_parcels(Parcel.query.join(Location), search).order_by(Parcel.parcel_id)
+    return export_response(query, PARCEL_COLUMNS, 'parcels')
+
 @parcel_bp.route('/<int:parcel_id>')
 @login_required
+@query_budget(8)
 def view_parcel(parcel_id):
-    parcel = Parcel.query.get_or_404(parcel_id)
-    ownerships = Ownership.query.filter_by(parcel_id=parcel_id, date_to=None).all()
-    encumbrances = Encumbrance.query.filter_by(parcel_id=parcel_id, status='Active').all()
-    tax_assessments = TaxAssessment.query.filter_by(parcel_id=parcel_id).order_by(TaxAssessment.assessment_year.desc()).limit(5).all()
+    # The revision counter moves with every change shown on the page, so it validates both caches
+    version, changed_at = parcel_revisions.get(parcel_id)
+    etag = parcel_revisions.etag(parcel_id, version, f'page-{current_user.user_id}')
+    validate = parcel_revisions.can_validate()
+    if validate and parcel_revisions.not_modified(etag, changed_at):
+        return parcel_revisions.add_validators(make_response('', 304), etag, changed_at)
+
+    # The body depends on the parcel and the viewer's role only (the layout adds the user and flashes)
+    fragment_key = (parcel_id, version, current_user.role)
+    fragment = parcel_revisions.get_fragment(fragment_key)
+    if fragment is None:
+        parcel = Parcel.query.options(*parcel_detail_options()).get_or_404(parcel_id)
+        ownerships = Ownership.query.options(*parcel_ownership_options()).filter_by(parcel_id=parcel_id, date_to=None).all()
+        encumbrances = Encumbrance.query.options(*parcel_encumbrance_options()).filter_by(parcel_id=parcel_id, status='Active').all()
+        tax_assessments = TaxAssessment.query.filter_by(parcel_id=parcel_id).order_by(TaxAssessment.assessment_year.desc()).limit(5).all()
+        chain = chain_of_title.get_chain(parcel_id)
+        
+        fragment = (parcel.ulpin, render_template('parcel_details_body.html', 
+                                                  parcel=parcel, 
+                                                  ownerships=ownerships,
+                                                  encumbrances=encumbrances,
+                                                  tax_assessments=tax_assessments,
+                                                  chain=chain))
+        parcel_revisions.put_fragment(fragment_key, fragment)
     
-    return render_template('parcel_details.html', 
-                         parcel=parcel, 
-                         ownerships=ownerships,
-                         encumbrances=encumbrances,
-                         tax_assessments=tax_assessments)
+    ulpin, body = fragment
+    response = make_response(render_template('parcel_details.html', ulpin=ulpin, body=Markup(body)))
+    if validate:
+        parcel_revisions.add_validators(response, etag, changed_at)
+    return response
+
+@parcel_bp.route('/api/<int:parcel_id>/chain-of-title')
+@login_required
+@query_budget(4)
+def chain_of_title_api(parcel_id):
+    """Full ownership lineage of a parcel, oldest first"""
+    version, changed_at = parcel_revisions.get(parcel_id)
+    etag = parcel_revisions.etag(parcel_id, version, 'chain')
+    if parcel_revisions.not_modified(etag, changed_at):
+        return parcel_revisions.add_validators(make_response('', 304), etag, changed_at)
+
+    parcel = Parcel.query.get_or_404(parcel_id)
+    response = jsonify({
+        'parcel_id': parcel.parcel_id,
+        'ulpin': parcel.ulpin,
+        'chain': chain_of_title.get_chain(parcel_id)
+    })
+    return parcel_revisions.add_validators(response, etag, changed_at)
 
 @parcel_bp.route('/create', methods=['GET', 'POST'])
 @login_required
@@ -3,11 +3,21 @@ from flask_login import login_required, current_user
 from models import db
 from models.tax_assessment import TaxAssessment
 from models.parcel import Parcel
+from utils.exports import export_response, TAX_COLUMNS
 from datetime import datetime, date
 import traceback
 
 tax_bp = Blueprint('tax', __name__, url_prefix='/tax')
 
+def _filter_tax_assessments(query, status_filter, year_filter):
+    """Status/year filters shared by the list page and the export"""
+    if status_filter:
+        query = query.filter_by(status=status_filter)
+    
+    if year_filter:
+        query = query.filter_by(assessment_year=int(year_filter))
+    return query
+
 @tax_bp.route('/')
 @login_required
 def list_tax_assessments():
@@ -15,13 +25,7 @@ def list_tax_assessments():
     status_filter = request.args.get('status', '')
     year_filter = request.args.get('year', '')
     
-    query = TaxAssessment.query
-    
-    if status_filter:
-        query = query.filter_by(status=status_filter)
-    
-    if year_filter:
-        query = query.filter_by(assessment_year=int(year_filter))
+    query = _filter_tax_assessments(TaxAssessment.query, status_filter, year_filter)
     
     tax_assessments = query.order_by(TaxAssessment.assessment_year.desc()).paginate(
         page=page, per_page=20, error_out=False
@@ -37,6 +41,15 @@ def list_tax_assessments():
                          year_filter=year_filter,
                          years=years)
 
+@tax_bp.route('/export')
+@login_required
+def export_tax_assessments():
+    """Stream tax assessments (same filters as the list page) as CSV/NDJSON"""
+    query = _filter_tax_assessments(TaxAssessment.query, request.args.get('status', ''), request.args.get('year', ''))
+    query = query.join(Parcel, TaxAssessment.parcel_id == Parcel.parcel_id)
+    query = query.order_by(TaxAssessment.assessment_year.desc(), TaxAssessment.tax_id)
+    return export_response(query, TAX_COLUMNS, 'tax_assessments')
+
 @tax_bp.route('/<int:tax_id>')
 @login_required
 def view_tax_assessment(tax_id):
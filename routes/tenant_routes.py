@@ -4,7 +4,9 @@ from models import db
 from models.tenant_agreement import TenantAgreement
 from models.owner import Owner
 from models.parcel import Parcel
-from utils.decorators import registrar_required
+from models.agreement_notice import AgreementNotice
+from utils.decorators import registrar_required, query_budget
+from utils.agreement_expiry import agreement_expiry
 from datetime import datetime
 
 tenant_bp = Blueprint('tenant', __name__, url_prefix='/tenant')
@@ -106,3 +108,59 @@ def get_tenant_info(tenant_id):
         'name': tenant.name,
         'phone': tenant.contact_no
     })
+
+@tenant_bp.route('/expiring')
+@login_required
+@query_budget(3)
+def expiring_agreements():
+    """Agreements ending soon, soonest first (range scan on end_date)"""
+    days = min(max(request.args.get('days', agreement_expiry.DEFAULT_LEAD_DAYS, type=int), 1), 365)
+    include_renewed = request.args.get('renewed') == '1'
+    agreements = agreement_expiry.expiring(days=days, cursor=request.args.get('cursor', ''),
+                                           per_page=25, include_renewed=include_renewed)
+    notices = agreement_expiry.notices_for(agreements.items)
+    return render_template('tenant_expiring.html', agreements=agreements, notices=notices,
+                           days=days, include_renewed=include_renewed)
+
+@tenant_bp.route('/api/expiring')
+@login_required
+@query_budget(3)
+def expiring_agreements_api():
+    days = min(max(request.args.get('days', agreement_expiry.DEFAULT_LEAD_DAYS, type=int), 1), 365)
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
+    agreements = agreement_expiry.expiring(days=days, cursor=request.args.get('cursor', ''), per_page=per_page,
+                                           include_renewed=request.args.get('renewed') == '1')
+    notices = agreement_expiry.notices_for(agreements.items)
+    
+    return jsonify({
+        'items': [{
+            'agreement_id': agreement.agreement_id,
+            'parcel_id': agreement.parcel_id,
+            'ulpin': agreement.parcel.ulpin,
+            'owner_id': agreement.owner_id,
+            'owner_name': agreement.property_owner.name,
+            'tenant_id': agreement.tenant_id,
+            'tenant_name': agreement.tenant_name or agreement.tenant.name,
+            'end_date': agreement.end_date.isoformat(),
+            'rent_amount': float(agreement.rent_amount) if agreement.rent_amount is not None else None,
+            'notice_status': notices[agreement.agreement_id].status if agreement.agreement_id in notices else None
+        } for agreement in agreements.items],
+        'next_cursor': agreements.next_cursor,
+        'prev_cursor': agreements.prev_cursor
+    })
+
+@tenant_bp.route('/notices/<int:notice_id>/acknowledge', methods=['POST'])
+@registrar_required
+def acknowledge_notice(notice_id):
+    """Mark an expiry notice as handled"""
+    notice = AgreementNotice.query.get_or_404(notice_id)
+    try:
+        notice.status = 'Acknowledged'
+        notice.acknowledged_by = current_user.user_id
+        notice.acknowledged_at = datetime.utcnow()
+        db.session.commit()
+        flash('Expiry notice acknowledged.', 'success')
+    except Exception as e:
+        db.session.rollback()
+        flash(f'Error acknowledging notice: {str(e)}', 'error')
+    return redirect(request.referrer or url_for('tenant.expiring_agreements'))
@@ -0,0 +1,72 @@
+"""
+Shared fixtures for the LRMS test suite
+One application per test session on a temporary SQLite database, filled by the
+seeded synthetic data generator (benchmarks/generate_data.py) so every run sees
+the same rows
+"""
+
+import os
+import sys
+from argparse import Namespace
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+SEED_PARCELS = 300
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    """Application on a generated data set (admin / admin123 plus the generator's bench users)"""
+    import config
+    directory = tmp_path_factory.mktemp('lrms')
+    config.Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{directory / 'lrms.db'}"
+    config.Config.ANALYTICS_SNAPSHOT_DIR = str(directory / 'snapshots')
+    config.Config.TEMPLATE_CACHE_DIR = ''
+
+    from app import create_app
+    from models import db
+    from generate_data import Generator
+
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        Generator(Namespace(parcels=SEED_PARCELS, seed=42, as_of=date(2025, 1, 1), history_years=10,
+                            tax_years=3, owners_per_parcel=0.8, mutation_rate=0.3, batch_size=10000), db).run()
+    return app
+
+@pytest.fixture
+def admin_client(app):
+    """Test client logged in as the default admin"""
+    client = app.test_client()
+    response = client.post('/login', data={'username': 'admin', 'password': 'admin123'})
+    assert response.status_code == 302
+    return client
+
+class StatementCounter:
+    """Number of SQL statements sent to any engine while counting"""
+
+    def __init__(self):
+        self.count = 0
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+@pytest.fixture
+def count_statements():
+    """Context manager factory: `with count_statements() as counter:` ... `counter.count`"""
+    @contextmanager
+    def counting():
+        counter = StatementCounter()
+        event.listen(Engine, 'before_cursor_execute', counter._count)
+        try:
+            yield counter
+        finally:
+            event.remove(Engine, 'before_cursor_execute', counter._count)
+    return counting
@@ -0,0 +1,115 @@
+"""
+Bulk parcel import: rejected rows and resuming
+An owner row that would take a parcel past 100% is reported in the error file
+like any other invalid row; the rest of its chunk is imported and an
+interrupted import continues after its last committed chunk
+"""
+
+import csv
+from decimal import Decimal
+
+import pytest
+
+COLUMNS = ['ulpin', 'survey_no', 'total_area', 'land_category', 'village', 'taluka', 'district', 'state',
+           'pincode', 'owner_name', 'pan', 'share_fraction', 'ownership_type', 'date_from']
+
+def _row(ulpin, owner, share, pan=''):
+    return [ulpin, ulpin, '2.5', 'Agricultural', 'Testvillage', 'Testtaluka', 'Testdistrict', 'Teststate',
+            '411001', owner, pan, share, 'Joint', '2024-01-01']
+
+def _write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+
+def _read_errors(path):
+    with open(path, newline='', encoding='utf-8') as handle:
+        return list(csv.DictReader(handle))
+
+def _shares(ulpin):
+    """(sum of active ownership shares, maintained total, active owner count) of a parcel"""
+    from models import db
+    from models.parcel import Parcel
+    from models.ownership import Ownership
+    from models.parcel_share_total import ParcelShareTotal
+    parcel = Parcel.query.filter_by(ulpin=ulpin).one()
+    active = Ownership.query.filter_by(parcel_id=parcel.parcel_id, date_to=None).all()
+    total = db.session.get(ParcelShareTotal, parcel.parcel_id)
+    return sum((ownership.share_fraction for ownership in active), Decimal('0')), total.active_share_sum, len(active)
+
+@pytest.fixture
+def full_parcel(app):
+    """ULPIN of a generated parcel whose active shares already add up to 100%"""
+    from models.parcel import Parcel
+    from models.parcel_share_total import ParcelShareTotal
+    with app.app_context():
+        parcel_id = (ParcelShareTotal.query.filter(ParcelShareTotal.active_share_sum == Decimal('1'))
+                     .order_by(ParcelShareTotal.parcel_id).first().parcel_id)
+        return Parcel.query.get(parcel_id).ulpin
+
+def test_over_allocated_row_is_reported_and_chunk_imported(app, tmp_path, full_parcel):
+    from utils.bulk_import import ParcelImporter
+    path, error_path = tmp_path / 'shares.csv', tmp_path / 'shares.errors.csv'
+    _write_csv(path, [
+        _row('BI-SHARE-1', 'Asha Patil', '0.6'),
+        _row('BI-SHARE-1', 'Ravi Patil', '0.3'),
+        _row('BI-SHARE-1', 'Meera Patil', '0.2'),   # 110%: rejected mid-chunk
+        _row(full_parcel, 'Late Claimant', '0.1'),  # existing parcel is already at 100%
+        _row('BI-SHARE-1', 'Kiran Patil', '0.1'),   # still fits after the rejected row
+        _row('BI-SHARE-2', 'Sunil Rao', '1'),
+    ])
+
+    with app.app_context():
+        summary = ParcelImporter().run(str(path), chunk_size=10, error_path=str(error_path))
+
+        assert summary['rows_read'] == 6
+        assert summary['rows_imported'] == 4
+        assert summary['rows_failed'] == 2
+        assert summary['parcels'] == 2
+        assert summary['ownerships'] == 4
+        assert [(error['row'], error['ulpin']) for error in _read_errors(error_path)] == \
+            [('3', 'BI-SHARE-1'), ('4', full_parcel)]
+        assert all('maximum 100%' in error['error'] for error in _read_errors(error_path))
+        assert _shares('BI-SHARE-1') == (Decimal('1'), Decimal('1'), 3)
+        assert _shares(full_parcel)[:2] == (Decimal('1'), Decimal('1'))
+
+        from models.import_checkpoint import ImportCheckpoint
+        checkpoint = ImportCheckpoint.query.get(ParcelImporter.source_key(str(path)))
+        assert (checkpoint.status, checkpoint.rows_committed, checkpoint.error_rows) == ('Completed', 6, 2)
+        assert ParcelImporter().run(str(path), error_path=str(error_path))['completed_before']
+
+def test_interrupted_import_resumes_after_last_chunk(app, tmp_path, monkeypatch):
+    from utils.bulk_import import ParcelImporter
+    path, error_path = tmp_path / 'resume.csv', tmp_path / 'resume.errors.csv'
+    _write_csv(path, [
+        _row('BI-RESUME-1', 'Owner One', '0.5', pan='ABCDE1234F'),
+        _row('BI-RESUME-1', 'Owner Two', '0.5'),
+        _row('BI-RESUME-2', 'Owner One', '0.7', pan='ABCDE1234F'),
+        _row('BI-RESUME-2', 'Owner Three', '0.4'),  # 110%: rejected in the chunk that fails first
+        _row('BI-RESUME-3', 'Owner Four', '1'),
+    ])
+
+    importer = ParcelImporter()
+    write_chunk = importer._write_chunk
+    calls = []
+
+    def failing_second_chunk(records):
+        calls.append(len(records))
+        if len(calls) == 2:
+            raise RuntimeError('connection lost')
+        return write_chunk(records)
+
+    with app.app_context():
+        monkeypatch.setattr(importer, '_write_chunk', failing_second_chunk)
+        with pytest.raises(RuntimeError):
+            importer.run(str(path), chunk_size=2, error_path=str(error_path))
+        monkeypatch.undo()
+
+        summary = importer.run(str(path), chunk_size=2, error_path=str(error_path))
+        assert summary['resumed_from_row'] == 2
+        assert (summary['rows_read'], summary['rows_imported'], summary['rows_failed']) == (3, 2, 1)
+        assert [error['row'] for error in _read_errors(error_path)] == ['4']
+        assert _shares('BI-RESUME-1') == (Decimal('1'), Decimal('1'), 2)
+        assert _shares('BI-RESUME-2') == (Decimal('0.7'), Decimal('0.7'), 1)
+        assert _shares('BI-RESUME-3') == (Decimal('1'), Decimal('1'), 1)
@@ -0,0 +1,67 @@
+"""
+pytest-benchmark timings of the hot endpoints
+The same pages benchmarks/endpoint_benchmark.py drives, on the seeded data set
+from conftest.py. Each benchmark records the SQL statements of one request in
+extra_info. Compare runs with:
+    python -m pytest tests/test_endpoint_benchmarks.py --benchmark-autosave
+    python -m pytest tests/test_endpoint_benchmarks.py --benchmark-compare
+"""
+
+import html
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from endpoint_benchmark import OLDER_LINK
+
+APPROVALS = 10
+
+def _timed(benchmark, client, count_statements, url, method='GET'):
+    """Benchmark one request and keep its statement count; returns the last response body"""
+    def request():
+        response = client.open(url, method=method)
+        assert response.status_code < 400
+        return response.get_data(as_text=True)
+
+    with count_statements() as counter:
+        request()
+    benchmark.extra_info['statements'] = counter.count
+    return benchmark(request)
+
+@pytest.mark.parametrize('url', [
+    '/parcel/?search=Village',
+    '/dashboard',
+    '/admin/',
+    '/tax/api/summary',
+    '/admin/audit-logs',
+], ids=['parcel search', 'dashboard', 'admin dashboard', 'tax summary api', 'audit logs page 1'])
+def test_page(benchmark, admin_client, count_statements, url):
+    _timed(benchmark, admin_client, count_statements, url)
+
+def test_audit_logs_deep_page(benchmark, admin_client, count_statements):
+    """A keyset page reached by following Older links, as a deep page costs the same as the first"""
+    body = admin_client.get('/admin/audit-logs').get_data(as_text=True)
+    url = None
+    for _ in range(5):
+        match = OLDER_LINK.search(body)
+        if not match:
+            break
+        url = html.unescape(match.group(1))
+        body = admin_client.get(url).get_data(as_text=True)
+    assert url, 'the seeded audit log has more than one page'
+    _timed(benchmark, admin_client, count_statements, url)
+
+def test_mutation_approve(app, benchmark, admin_client):
+    """Approval writes, so every round approves a different pending mutation"""
+    from models import db
+    from models.mutation import Mutation
+    with app.app_context():
+        pending = [row[0] for row in db.session.query(Mutation.mutation_id).filter_by(status='Pending')
+                   .order_by(Mutation.mutation_id).limit(APPROVALS).all()]
+    assert len(pending) == APPROVALS
+
+    def approve(mutation_id):
+        assert admin_client.post(f'/mutation/{mutation_id}/approve').status_code == 302
+
+    benchmark.pedantic(approve, setup=lambda: ((pending.pop(0),), {}), rounds=APPROVALS)
@@ -0,0 +1,90 @@
+"""
+Owner portfolio deltas
+After every kind of change the flush listener turns into deltas, the
+maintained owner_portfolio rows must equal a from-scratch recompute
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+def _maintained(owner_ids):
+    from models import db
+    from models.owner_portfolio import OwnerPortfolio
+    db.session.expire_all()
+    return {row.owner_id: (row.parcel_count, row.effective_area, row.outstanding_tax, row.active_encumbrances)
+            for row in OwnerPortfolio.query.filter(OwnerPortfolio.owner_id.in_(owner_ids))}
+
+def _recomputed(owner_ids):
+    from models import db
+    from utils.owner_portfolios import owner_portfolios
+    return {row[0]: (row[1], Decimal(str(row[2])), Decimal(str(row[3])), row[4])
+            for row in db.session.execute(owner_portfolios._totals(owner_ids))}
+
+@pytest.fixture
+def holding(app):
+    """Two owners sharing a new parcel half and half, inside an app context"""
+    from models import db
+    from models.location import Location
+    from models.owner import Owner
+    from models.ownership import Ownership
+    from models.parcel import Parcel
+    with app.app_context():
+        parcel = Parcel(ulpin='OP-DELTA-1', survey_no='OP-DELTA-1', total_area=Decimal('4.0000'),
+                        land_category='Agricultural', location_id=Location.query.first().location_id)
+        owners = [Owner(name=f'Portfolio Owner {n}', owner_type='Individual') for n in range(3)]
+        db.session.add_all([parcel] + owners)
+        db.session.flush()
+        for owner in owners[:2]:
+            db.session.add(Ownership(parcel_id=parcel.parcel_id, owner_id=owner.owner_id,
+                                     share_fraction=Decimal('0.5'), ownership_type='Joint',
+                                     date_from=date(2024, 1, 1)))
+        db.session.commit()
+        yield parcel.parcel_id, [owner.owner_id for owner in owners]
+
+def test_deltas_match_recompute(holding):
+    from models import db
+    from models.encumbrance import Encumbrance
+    from models.ownership import Ownership
+    from models.parcel import Parcel
+    from models.tax_assessment import TaxAssessment
+    parcel_id, owner_ids = holding
+
+    def check():
+        db.session.commit()
+        assert _maintained(owner_ids) == _recomputed(owner_ids)
+
+    check()
+    assert _maintained(owner_ids)[owner_ids[0]] == (1, Decimal('2.0000'), Decimal('0.00'), 0)
+
+    db.session.get(Parcel, parcel_id).total_area = Decimal('6.5000')
+    check()
+
+    db.session.add(TaxAssessment(parcel_id=parcel_id, assessment_year=2024, total_assessed_value=Decimal('1000'),
+                                 tax_due=Decimal('101.00'), status='Unpaid'))
+    check()
+    tax = TaxAssessment.query.filter_by(parcel_id=parcel_id).one()
+    tax.amount_paid, tax.status = Decimal('40.00'), 'Partial'
+    check()
+
+    db.session.add(Encumbrance(parcel_id=parcel_id, type='Mortgage', start_date=date(2024, 2, 1)))
+    check()
+
+    # Transfer: owner 0 leaves, owner 2 takes the half; the parcel's area changes in the same flush
+    leaving = Ownership.query.filter_by(parcel_id=parcel_id, owner_id=owner_ids[0]).one()
+    leaving.date_to = date(2024, 6, 1)
+    db.session.add(Ownership(parcel_id=parcel_id, owner_id=owner_ids[2], share_fraction=Decimal('0.5'),
+                             ownership_type='Joint', date_from=date(2024, 6, 1)))
+    db.session.get(Parcel, parcel_id).total_area = Decimal('7.2500')
+    check()
+    assert owner_ids[0] not in _maintained(owner_ids)
+
+    Ownership.query.filter_by(parcel_id=parcel_id, owner_id=owner_ids[1]).one().share_fraction = Decimal('0.25')
+    tax.status = 'Paid'
+    Encumbrance.query.filter_by(parcel_id=parcel_id).one().status = 'Resolved'
+    check()
+
+    db.session.delete(Ownership.query.filter_by(parcel_id=parcel_id, owner_id=owner_ids[2]).one())
+    check()
+    assert list(_maintained(owner_ids)) == [owner_ids[1]]
@@ -0,0 +1,93 @@
+"""
+Statement counts of the parcel, owner and mutation pages
+A page must cost the same fixed number of statements whether it shows 5 rows or
+50 (no lazy load per row), and stay within the budget its view declares with
+@query_budget
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+# Statements per request, including loading the logged-in user
+EXPECTED_STATEMENTS = {
+    'parcel.list_parcels': 3,
+    'parcel.view_parcel': 7,
+    'owner.view_owner': 6,
+    'mutation.list_mutations': 3,
+}
+
+def _parcel(location_id, ulpin):
+    from models import db
+    from models.parcel import Parcel
+    parcel = Parcel(ulpin=ulpin, survey_no=ulpin, total_area=Decimal('1.5'), land_category='Agricultural',
+                    location_id=location_id)
+    db.session.add(parcel)
+    return parcel
+
+def _owner(name):
+    from models import db
+    from models.owner import Owner
+    owner = Owner(name=name, owner_type='Individual')
+    db.session.add(owner)
+    return owner
+
+def _ownership(parcel, owner, share):
+    from models import db
+    from models.ownership import Ownership
+    db.session.add(Ownership(parcel=parcel, owner=owner, share_fraction=share, ownership_type='Joint',
+                             date_from=date(2024, 1, 1)))
+
+@pytest.fixture(scope='module')
+def crowded(app):
+    """{rows: (parcel_id with `rows` current co-owners, owner_id holding `rows` parcels)} for 5 and 50 rows"""
+    from models import db
+    from models.location import Location
+    ids = {}
+    with app.app_context():
+        location_id = db.session.query(Location.location_id).first()[0]
+        for rows in (5, 50):
+            parcel = _parcel(location_id, f'QC-SHARED-{rows}')
+            for n in range(rows):
+                _ownership(parcel, _owner(f'Co-owner {rows}/{n}'), Decimal(1) / rows)
+            holder = _owner(f'Holder of {rows}')
+            for n in range(rows):
+                _ownership(_parcel(location_id, f'QC-HELD-{rows}-{n}'), holder, Decimal(1))
+            db.session.commit()
+            ids[rows] = (parcel.parcel_id, holder.owner_id)
+    return ids
+
+def _statements(app, client, count_statements, endpoint, url, shows=None):
+    with count_statements() as counter:
+        response = client.get(url)
+    assert response.status_code == 200, url
+    if shows:
+        assert shows in response.get_data(as_text=True), f'{url} does not show {shows}'
+    budget = getattr(app.view_functions[endpoint], 'query_budget', None)
+    assert budget is None or counter.count <= budget, f'{url}: {counter.count} statements, budget {budget}'
+    return counter.count
+
+@pytest.mark.parametrize('rows', [5, 50])
+def test_parcel_list(app, admin_client, count_statements, rows):
+    count = _statements(app, admin_client, count_statements, 'parcel.list_parcels', f'/parcel/?per_page={rows}')
+    assert count == EXPECTED_STATEMENTS['parcel.list_parcels']
+
+@pytest.mark.parametrize('rows', [5, 50])
+def test_mutation_list(app, admin_client, count_statements, rows):
+    count = _statements(app, admin_client, count_statements, 'mutation.list_mutations', f'/mutation/?per_page={rows}')
+    assert count == EXPECTED_STATEMENTS['mutation.list_mutations']
+
+@pytest.mark.parametrize('rows', [5, 50])
+def test_parcel_detail(app, admin_client, count_statements, crowded, rows):
+    parcel_id, _ = crowded[rows]
+    count = _statements(app, admin_client, count_statements, 'parcel.view_parcel', f'/parcel/{parcel_id}',
+                        shows=f'Co-owner {rows}/{rows - 1}')
+    assert count == EXPECTED_STATEMENTS['parcel.view_parcel']
+
+@pytest.mark.parametrize('rows', [5, 50])
+def test_owner_detail(app, admin_client, count_statements, crowded, rows):
+    _, owner_id = crowded[rows]
+    count = _statements(app, admin_client, count_statements, 'owner.view_owner', f'/owner/{owner_id}',
+                        shows=f'QC-HELD-{rows}-{rows - 1}')
+    assert count == EXPECTED_STATEMENTS['owner.view_owner']
@@ -0,0 +1,154 @@
+"""
+Tenant agreement expiry scanning for Government Property Management Portal
+A scheduled job walks agreements by (end_date, agreement_id) from a saved
+watermark up to today + lead days and writes one agreement_notice per
+expiring term, in batches. Each run only reads the agreements that entered
+the window since the previous run (plus any created since then), so the cost
+follows the number of expiring agreements, not the size of the table.
+"""
+
+from datetime import date, datetime, timedelta
+from sqlalchemy import and_, exists, or_
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import aliased
+from models import db
+from models.tenant_agreement import TenantAgreement
+from models.agreement_notice import AgreementNotice
+from models.scan_watermark import ScanWatermark
+from utils.eager_loading import expiring_agreement_options
+from utils.keyset import keyset_paginate
+
+NOTICE_COLUMNS = (TenantAgreement.agreement_id, TenantAgreement.parcel_id, TenantAgreement.owner_id,
+                  TenantAgreement.tenant_id, TenantAgreement.end_date)
+
+def renewed():
+    """Correlated test: a later agreement exists for the same parcel and tenant"""
+    successor = aliased(TenantAgreement)
+    return exists().where(and_(
+        successor.parcel_id == TenantAgreement.parcel_id,
+        successor.tenant_id == TenantAgreement.tenant_id,
+        successor.start_date >= TenantAgreement.end_date,
+        successor.agreement_id != TenantAgreement.agreement_id
+    ))
+
+class AgreementExpiryScanner:
+    """Watermarked expiry scan and the "expiring soon" list"""
+
+    JOB_NAME = 'agreement_expiry'
+    DEFAULT_LEAD_DAYS = 30
+
+    def _watermark(self):
+        watermark = ScanWatermark.query.get(self.JOB_NAME)
+        if watermark is None:
+            watermark = ScanWatermark(job_name=self.JOB_NAME)
+            db.session.add(watermark)
+            db.session.commit()
+        return watermark
+
+    @staticmethod
+    def _insert_notices(rows, now):
+        """Batch insert notices, skipping terms that already have one"""
+        table = AgreementNotice.__table__
+        if db.engine.dialect.name == 'mysql':
+            statement = mysql.insert(table).prefix_with('IGNORE')
+        else:
+            statement = sqlite.insert(table).on_conflict_do_nothing(index_elements=['agreement_id', 'end_date'])
+        result = db.session.execute(statement, [{
+            'agreement_id': row.agreement_id,
+            'parcel_id': row.parcel_id,
+            'owner_id': row.owner_id,
+            'tenant_id': row.tenant_id,
+            'end_date': row.end_date,
+            'status': 'Pending',
+            'created_at': now
+        } for row in rows])
+        return max(result.rowcount, 0)
+
+    def run(self, lead_days=DEFAULT_LEAD_DAYS, batch_size=1000, rescan=False, today=None):
+        """
+        Emit notices for agreements ending within lead_days
+        rescan=True restarts the walk from today (existing notices are kept,
+        so only terms without one are added, e.g. after end dates were edited)
+        Returns a summary dict
+        """
+        today = today or date.today()
+        horizon = today + timedelta(days=lead_days)
+        started = datetime.utcnow()
+        watermark = self._watermark()
+        summary = {'scanned': 0, 'notices': 0, 'batches': 0, 'horizon': horizon}
+
+        if rescan or watermark.position_date is None:
+            position_date, position_id = today, 0
+        else:
+            position_date, position_id = watermark.position_date, watermark.position_id or 0
+
+        # Agreements that entered the window since the last run, in (end_date, agreement_id) order
+        while True:
+            rows = db.session.query(*NOTICE_COLUMNS).filter(
+                TenantAgreement.end_date <= horizon,
+                or_(TenantAgreement.end_date > position_date,
+                    and_(TenantAgreement.end_date == position_date, TenantAgreement.agreement_id > position_id)),
+                ~renewed()
+            ).order_by(TenantAgreement.end_date, TenantAgreement.agreement_id).limit(batch_size).all()
+            if not rows:
+                break
+
+            now = datetime.utcnow()
+            summary['notices'] += self._insert_notices(rows, now)
+            position_date, position_id = rows[-1].end_date, rows[-1].agreement_id
+            watermark.position_date, watermark.position_id = position_date, position_id
+            watermark.updated_at = now
+            # Notices and watermark commit together, so an interrupted run resumes after the last batch
+            db.session.commit()
+            summary['scanned'] += len(rows)
+            summary['batches'] += 1
+
+        # Agreements created since the last run whose end date is already behind the watermark
+        if watermark.last_run_at is not None:
+            created_at, created_id = watermark.last_run_at, 0
+            while True:
+                rows = db.session.query(*NOTICE_COLUMNS, TenantAgreement.created_at).filter(
+                    or_(TenantAgreement.created_at > created_at,
+                        and_(TenantAgreement.created_at == created_at, TenantAgreement.agreement_id > created_id)),
+                    TenantAgreement.end_date >= today,
+                    TenantAgreement.end_date <= position_date,
+                    ~renewed()
+                ).order_by(TenantAgreement.created_at, TenantAgreement.agreement_id).limit(batch_size).all()
+                if not rows:
+                    break
+                summary['notices'] += self._insert_notices(rows, datetime.utcnow())
+                db.session.commit()
+                created_at, created_id = rows[-1].created_at, rows[-1].agreement_id
+                summary['scanned'] += len(rows)
+                summary['batches'] += 1
+
+        watermark.last_run_at = started
+        watermark.updated_at = datetime.utcnow()
+        db.session.commit()
+        return summary
+
+    def expiring(self, days=DEFAULT_LEAD_DAYS, cursor=None, per_page=50, include_renewed=False, today=None):
+        """Keyset page of agreements ending in the next days, soonest first"""
+        today = today or date.today()
+        query = TenantAgreement.query.options(*expiring_agreement_options()).filter(
+            TenantAgreement.end_date >= today,
+            TenantAgreement.end_date <= today + timedelta(days=days)
+        )
+        if not include_renewed:
+            query = query.filter(~renewed())
+        return keyset_paginate(query, TenantAgreement.end_date, TenantAgreement.agreement_id,
+                               cursor=cursor, per_page=per_page, descending=False)
+
+    @staticmethod
+    def notices_for(agreements):
+        """{agreement_id: notice} for the terms on one page"""
+        if not agreements:
+            return {}
+        notices = AgreementNotice.query.filter(
+            AgreementNotice.agreement_id.in_([agreement.agreement_id for agreement in agreements])
+        ).all()
+        terms = {(agreement.agreement_id, agreement.end_date) for agreement in agreements}
+        return {notice.agreement_id: notice for notice in notices if (notice.agreement_id, notice.end_date) in terms}
+
+# Global agreement expiry scanner instance
+agreement_expiry = AgreementExpiryScanner()
@@ -0,0 +1,338 @@
+"""
+Analytics snapshots for Government Property Management Portal
+A nightly job copies parcels, ownerships, mutations, tax assessments and
+payments into partitioned columnar files (Parquet, or compressed NumPy arrays
+when pyarrow is missing) so heavy analysis reads files instead of the live tables
+"""
+
+import glob
+import json
+import os
+import re
+import shutil
+from datetime import datetime, date
+from flask import current_app
+from sqlalchemy import Integer, Numeric, Float, Date, DateTime
+from models.parcel import Parcel
+from models.location import Location
+from models.owner import Owner
+from models.ownership import Ownership
+from models.mutation import Mutation
+from models.tax_assessment import TaxAssessment
+from utils.exports import (
+    PARCEL_COLUMNS, OWNERSHIP_COLUMNS, MUTATION_COLUMNS, TAX_COLUMNS, FromOwner, ToOwner
+)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Payments are recorded on the assessment row itself (amount_paid, paid_on)
+PAYMENT_COLUMNS = [
+    ('tax_id', TaxAssessment.tax_id), ('parcel_id', TaxAssessment.parcel_id), ('ulpin', Parcel.ulpin),
+    ('assessment_year', TaxAssessment.assessment_year), ('amount_paid', TaxAssessment.amount_paid),
+    ('tax_due', TaxAssessment.tax_due), ('paid_on', TaxAssessment.paid_on), ('status', TaxAssessment.status)
+]
+
+def _year(value):
+    return value.year if value else 'unknown'
+
+def _snapshot_sources():
+    """name -> (columns, query, (partition name, source header, key function))"""
+    return {
+        'parcels': (
+            PARCEL_COLUMNS,
+            Parcel.query.join(Location).order_by(Parcel.parcel_id),
+            ('district', 'district', None)
+        ),
+        'ownerships': (
+            OWNERSHIP_COLUMNS,
+            Ownership.query.join(Owner, Ownership.owner_id == Owner.owner_id)
+            .join(Parcel, Ownership.parcel_id == Parcel.parcel_id).order_by(Ownership.ownership_id),
+            None
+        ),
+        'mutations': (
+            MUTATION_COLUMNS,
+            Mutation.query.join(Parcel, Mutation.parcel_id == Parcel.parcel_id)
+            .join(FromOwner, Mutation.from_owner_id == FromOwner.owner_id)
+            .join(ToOwner, Mutation.to_owner_id == ToOwner.owner_id).order_by(Mutation.mutation_id),
+            ('year', 'created_at', _year)
+        ),
+        'tax_assessments': (
+            TAX_COLUMNS,
+            TaxAssessment.query.join(Parcel, TaxAssessment.parcel_id == Parcel.parcel_id).order_by(TaxAssessment.tax_id),
+            ('assessment_year', 'assessment_year', None)
+        ),
+        'payments': (
+            PAYMENT_COLUMNS,
+            TaxAssessment.query.join(Parcel, TaxAssessment.parcel_id == Parcel.parcel_id)
+            .filter(TaxAssessment.amount_paid > 0).order_by(TaxAssessment.tax_id),
+            ('year', 'paid_on', _year)
+        )
+    }
+
+def _kind(column):
+    """Storage kind for a column: int, float, date, datetime or str"""
+    column_type = column.type
+    if isinstance(column_type, Integer):
+        return 'int'
+    if isinstance(column_type, (Numeric, Float)):
+        return 'float'
+    if isinstance(column_type, DateTime):
+        return 'datetime'
+    if isinstance(column_type, Date):
+        return 'date'
+    return 'str'
+
+def _partition_dir(name, value):
+    value = re.sub(r'[^A-Za-z0-9_.-]+', '_', str(value if value not in (None, '') else 'unknown'))
+    return f'{name}={value}'
+
+def _python_values(values, kind):
+    if kind == 'float':
+        return [float(value) if value is not None else None for value in values]
+    if kind == 'str':
+        return [str(value) if value is not None else None for value in values]
+    return list(values)
+
+def _numpy_values(values, kind):
+    if kind in ('int', 'float'):
+        if kind == 'int' and None not in values:
+            return np.array(values, dtype='int64')
+        return np.array([float(value) if value is not None else np.nan for value in values], dtype='float64')
+    if kind == 'date':
+        return np.array([value.isoformat() if value else 'NaT' for value in values], dtype='datetime64[D]')
+    if kind == 'datetime':
+        return np.array([value.isoformat() if value else 'NaT' for value in values], dtype='datetime64[us]')
+    return np.array(['' if value is None else str(value) for value in values], dtype=str)
+
+class _ParquetSink:
+    """One open ParquetWriter per partition; each batch becomes a row group"""
+
+    extension = 'parquet'
+
+    def __init__(self, directory, headers, kinds):
+        self.directory = directory
+        self.headers = headers
+        types = {'int': pa.int64(), 'float': pa.float64(), 'date': pa.date32(),
+                 'datetime': pa.timestamp('us'), 'str': pa.string()}
+        self.schema = pa.schema([(header, types[kind]) for header, kind in zip(headers, kinds)])
+        self.kinds = kinds
+        self.writers = {}
+
+    def write(self, partition, columns):
+        writer = self.writers.get(partition)
+        if writer is None:
+            path = os.path.join(self.directory, partition, f'part-00000.{self.extension}')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            writer = self.writers[partition] = pq.ParquetWriter(path, self.schema, compression='zstd')
+        arrays = [pa.array(_python_values(values, kind), type=field.type)
+                  for values, kind, field in zip(columns, self.kinds, self.schema)]
+        writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+
+class _NumpySink:
+    """One compressed .npz part per partition per batch"""
+
+    extension = 'npz'
+
+    def __init__(self, directory, headers, kinds):
+        self.directory = directory
+        self.headers = headers
+        self.kinds = kinds
+        self.parts = {}
+
+    def write(self, partition, columns):
+        part = self.parts.get(partition, 0)
+        self.parts[partition] = part + 1
+        path = os.path.join(self.directory, partition, f'part-{part:05d}.{self.extension}')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(path, **{header: _numpy_values(values, kind)
+                                     for header, values, kind in zip(self.headers, columns, self.kinds)})
+
+    def close(self):
+        pass
+
+class AnalyticsSnapshot:
+    """Writes and reads the columnar analytics snapshots"""
+
+    TABLES = ['parcels', 'ownerships', 'mutations', 'tax_assessments', 'payments']
+
+    @staticmethod
+    def root():
+        return current_app.config.get('ANALYTICS_SNAPSHOT_DIR', 'snapshots')
+
+    @staticmethod
+    def resolve_format(fmt='auto'):
+        """parquet when pyarrow is installed, npz otherwise"""
+        if fmt == 'auto':
+            fmt = 'parquet' if PYARROW_AVAILABLE else 'npz'
+        if fmt == 'parquet' and not PYARROW_AVAILABLE:
+            raise ValueError('pyarrow is required for Parquet snapshots')
+        if fmt == 'npz' and not NUMPY_AVAILABLE:
+            raise ValueError('numpy is required for NumPy snapshots')
+        if fmt not in ('parquet', 'npz'):
+            raise ValueError(f'Unknown snapshot format: {fmt}')
+        return fmt
+
+    def run(self, fmt='auto', batch_size=50000, tables=None, root=None, retention=None):
+        """
+        Write a complete snapshot for today and publish it atomically
+        Returns: the snapshot manifest
+        """
+        fmt = self.resolve_format(fmt)
+        root = root or self.root()
+        retention = retention or current_app.config.get('ANALYTICS_SNAPSHOT_RETENTION', 7)
+        snapshot_id = date.today().isoformat()
+        staging = os.path.join(root, f'.{snapshot_id}.tmp')
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        manifest = {'snapshot': snapshot_id, 'format': fmt, 'created_at': datetime.utcnow().isoformat(), 'tables': {}}
+        sources = _snapshot_sources()
+        for name in tables or self.TABLES:
+            columns, query, partition = sources[name]
+            manifest['tables'][name] = self._write_table(
+                os.path.join(staging, name), columns, query, partition, fmt, batch_size
+            )
+
+        with open(os.path.join(staging, 'manifest.json'), 'w') as handle:
+            json.dump(manifest, handle, indent=2)
+
+        # Readers only ever see a finished snapshot directory
+        final = os.path.join(root, snapshot_id)
+        shutil.rmtree(final, ignore_errors=True)
+        os.replace(staging, final)
+
+        for old in self.snapshots(root)[retention:]:
+            shutil.rmtree(os.path.join(root, old), ignore_errors=True)
+        return manifest
+
+    @staticmethod
+    def _write_table(directory, columns, query, partition, fmt, batch_size):
+        headers = [header for header, _ in columns]
+        kinds = [_kind(column) for _, column in columns]
+        sink = (_ParquetSink if fmt == 'parquet' else _NumpySink)(directory, headers, kinds)
+        os.makedirs(directory, exist_ok=True)
+
+        if partition:
+            partition_name, source_header, key_function = partition
+            source_index = headers.index(source_header)
+
+        def flush(rows):
+            groups = {}
+            for row in rows:
+                if partition:
+                    value = row[source_index]
+                    key = _partition_dir(partition_name, key_function(value) if key_function else value)
+                else:
+                    key = ''
+                groups.setdefault(key, []).append(row)
+            for key, group in groups.items():
+                sink.write(key, [list(values) for values in zip(*group)])
+            return set(groups)
+
+        row_count, partitions, batch = 0, set(), []
+        try:
+            for row in query.with_entities(*[column for _, column in columns]).yield_per(min(batch_size, 5000)):
+                batch.append(tuple(row))
+                if len(batch) >= batch_size:
+                    partitions |= flush(batch)
+                    row_count += len(batch)
+                    batch = []
+            if batch:
+                partitions |= flush(batch)
+                row_count += len(batch)
+        finally:
+            sink.close()
+        return {'rows': row_count, 'partitions': sorted(key for key in partitions if key)}
+
+    @staticmethod
+    def snapshots(root=None):
+        """Published snapshot ids, newest first"""
+        root = root or AnalyticsSnapshot.root()
+        if not os.path.isdir(root):
+            return []
+        return sorted((name for name in os.listdir(root)
+                       if os.path.isfile(os.path.join(root, name, 'manifest.json'))), reverse=True)
+
+    def manifest(self, snapshot=None, root=None):
+        root = root or self.root()
+        snapshot = snapshot or next(iter(self.snapshots(root)), None)
+        if snapshot is None:
+            raise ValueError('No analytics snapshot has been written yet')
+        with open(os.path.join(root, snapshot, 'manifest.json')) as handle:
+            return json.load(handle)
+
+    def read(self, table, columns=None, partitions=None, snapshot=None, root=None):
+        """
+        Load a snapshot table as a dict of NumPy arrays
+        partitions: {partition name: value} to read a single partition, e.g. {'district': 'Pune'}
+        """
+        if not NUMPY_AVAILABLE:
+            raise ValueError('numpy is required to read analytics snapshots')
+        root = root or self.root()
+        manifest = self.manifest(snapshot, root)
+        directory = os.path.join(root, manifest['snapshot'], table)
+        if partitions:
+            name, value = next(iter(partitions.items()))
+            files = glob.glob(os.path.join(directory, _partition_dir(name, value), 'part-*'))
+        else:
+            files = glob.glob(os.path.join(directory, 'part-*')) + glob.glob(os.path.join(directory, '*', 'part-*'))
+        files.sort()
+
+        pieces = []
+        for path in files:
+            if path.endswith('.parquet'):
+                data = pq.read_table(path, columns=columns)
+                pieces.append({name: data.column(name).to_numpy(zero_copy_only=False) for name in data.column_names})
+            else:
+                with np.load(path) as data:
+                    pieces.append({name: data[name] for name in (columns or data.files)})
+
+        if not pieces:
+            return {name: np.array([]) for name in columns or []}
+        return {name: np.concatenate([piece[name] for piece in pieces]) for name in pieces[0]}
+
+    def aggregate(self, table, group_by, value=None, func='sum', where=None, snapshot=None):
+        """
+        Group a snapshot table by one column
+        func: sum, mean or count (value not needed for count)
+        where: {column: value} equality filters
+        Returns: list of (group, result) sorted by group
+        """
+        wanted = [group_by] + ([value] if value else []) + list(where or {})
+        data = self.read(table, columns=list(dict.fromkeys(wanted)), snapshot=snapshot)
+        keys = data[group_by]
+        mask = np.ones(len(keys), dtype=bool)
+        for column, expected in (where or {}).items():
+            mask &= data[column] == expected
+        keys = keys[mask]
+        if not len(keys):
+            return []
+
+        groups, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(groups))
+        if func == 'count':
+            results = counts
+        else:
+            values = np.nan_to_num(data[value][mask].astype('float64'))
+            sums = np.bincount(inverse, weights=values, minlength=len(groups))
+            results = sums if func == 'sum' else sums / np.maximum(counts, 1)
+        return [(group.item() if hasattr(group, 'item') else group, result.item())
+                for group, result in zip(groups, results)]
+
+# Global analytics snapshot instance
+analytics_snapshot = AnalyticsSnapshot()
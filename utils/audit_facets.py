@@ -0,0 +1,120 @@
+"""
+Audit log facets for Government Property Management Portal
+Maintains a daily rollup of audit events per (table, action, user) as audit
+rows are written, and serves filter-bar options with match counts from it.
+The rollup is moved by triggers on audit_log, because on MySQL every audit row
+comes from database/triggers.sql rather than from the application
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from models import db
+from models.audit_log import AuditLog
+from models.audit_facet import AuditFacetDaily
+from models.user_account import UserAccount
+from utils.db_triggers import ensure_trigger
+
+SYSTEM_USER_ID = 0
+
+class AuditFacets:
+    """Rollup maintenance and facet lookups for the audit log filter bar"""
+
+    DAY_FACET_WINDOW = 30
+
+    def ensure_triggers(self):
+        """Create the audit_log triggers that keep audit_facet_daily current (also in database/triggers.sql)"""
+        key = "{day}, {row}.table_name, {row}.action, COALESCE({row}.user_id, %d)" % SYSTEM_USER_ID
+        ensure_trigger('audit_facet_insert', 'INSERT', 'audit_log', {
+            'sqlite': ["INSERT INTO audit_facet_daily (day, table_name, action, user_id, event_count) "
+                       f"VALUES ({key.format(day='date(new.timestamp)', row='new')}, 1) "
+                       "ON CONFLICT (day, table_name, action, user_id) DO UPDATE SET event_count = event_count + 1"],
+            'mysql': ["INSERT INTO audit_facet_daily (day, table_name, action, user_id, event_count) "
+                      f"VALUES ({key.format(day='DATE(NEW.timestamp)', row='NEW')}, 1) "
+                      "ON DUPLICATE KEY UPDATE event_count = event_count + 1"]
+        })
+        match = ("day = {day} AND table_name = {row}.table_name AND action = {row}.action "
+                 "AND user_id = COALESCE({row}.user_id, %d)" % SYSTEM_USER_ID)
+        ensure_trigger('audit_facet_delete', 'DELETE', 'audit_log', {
+            'sqlite': ["UPDATE audit_facet_daily SET event_count = event_count - 1 "
+                       f"WHERE {match.format(day='date(old.timestamp)', row='old')}"],
+            'mysql': ["UPDATE audit_facet_daily SET event_count = event_count - 1 "
+                      f"WHERE {match.format(day='DATE(OLD.timestamp)', row='OLD')}"]
+        })
+
+    def rebuild(self):
+        """Recompute the rollup from audit_log (after loading rows with the triggers missing or disabled)"""
+        # DATE() exists on both SQLite (returns text) and MySQL (returns a date)
+        day = func.date(AuditLog.timestamp)
+        rows = db.session.query(
+            day, AuditLog.table_name, AuditLog.action,
+            func.coalesce(AuditLog.user_id, SYSTEM_USER_ID), func.count(AuditLog.audit_id)
+        ).group_by(day, AuditLog.table_name, AuditLog.action, AuditLog.user_id).all()
+
+        AuditFacetDaily.query.delete()
+        totals = {}
+        for row_day, table_name, action, user_id, count in rows:
+            if isinstance(row_day, str):
+                row_day = datetime.strptime(row_day, '%Y-%m-%d').date()
+            key = (row_day, table_name, action, user_id)
+            totals[key] = totals.get(key, 0) + count
+        db.session.add_all([
+            AuditFacetDaily(day=key[0], table_name=key[1], action=key[2], user_id=key[3], event_count=count)
+            for key, count in totals.items()
+        ])
+        db.session.commit()
+        return len(totals)
+
+    @staticmethod
+    def _apply_filters(query, filters, skip):
+        """Filter rollup rows by every active facet except the one being counted"""
+        query = query.filter(AuditFacetDaily.event_count > 0)
+        if filters.get('table') and skip != 'table':
+            query = query.filter(AuditFacetDaily.table_name == filters['table'])
+        if filters.get('action') and skip != 'action':
+            query = query.filter(AuditFacetDaily.action == filters['action'])
+        if filters.get('user') and skip != 'user' and str(filters['user']).isdigit():
+            query = query.filter(AuditFacetDaily.user_id == int(filters['user']))
+        if filters.get('day') and skip != 'day':
+            day = datetime.strptime(filters['day'], '%Y-%m-%d').date()
+            query = query.filter(AuditFacetDaily.day == day)
+        return query
+
+    def get_facets(self, filters):
+        """
+        Options and match counts for each facet under the other active filters
+        Returns: dict facet -> list of dicts with value, label and count
+        """
+        total = func.sum(AuditFacetDaily.event_count).label('total')
+        facets = {}
+
+        tables = self._apply_filters(
+            db.session.query(AuditFacetDaily.table_name, total), filters, 'table'
+        ).group_by(AuditFacetDaily.table_name).order_by(AuditFacetDaily.table_name).all()
+        facets['table'] = [{'value': name, 'label': name, 'count': int(count)} for name, count in tables]
+
+        actions = self._apply_filters(
+            db.session.query(AuditFacetDaily.action, total), filters, 'action'
+        ).group_by(AuditFacetDaily.action).order_by(AuditFacetDaily.action).all()
+        facets['action'] = [{'value': name, 'label': name, 'count': int(count)} for name, count in actions]
+
+        users = self._apply_filters(
+            db.session.query(AuditFacetDaily.user_id, UserAccount.username, total)
+            .outerjoin(UserAccount, UserAccount.user_id == AuditFacetDaily.user_id), filters, 'user'
+        ).group_by(AuditFacetDaily.user_id, UserAccount.username).order_by(UserAccount.username).all()
+        facets['user'] = [{
+            'value': str(user_id),
+            'label': username or ('System' if user_id == SYSTEM_USER_ID else f'User {user_id}'),
+            'count': int(count)
+        } for user_id, username, count in users]
+
+        since = datetime.utcnow().date() - timedelta(days=self.DAY_FACET_WINDOW)
+        days = self._apply_filters(
+            db.session.query(AuditFacetDaily.day, total).filter(AuditFacetDaily.day >= since), filters, 'day'
+        ).group_by(AuditFacetDaily.day).order_by(AuditFacetDaily.day.desc()).all()
+        facets['day'] = [{'value': day.isoformat(), 'label': day.strftime('%d %b %Y'), 'count': int(count)}
+                         for day, count in days]
+
+        return facets
+
+# Global audit facets instance
+audit_facets = AuditFacets()
@@ -0,0 +1,463 @@
+"""
+Bulk parcel import for Government Property Management Portal
+Streams a CSV/XLSX file in chunks, validates every row and writes parcels,
+parcel versions, owners and ownerships with executemany inserts. Owner rows
+that would take a parcel's active shares past 100% are reported with the
+other invalid rows instead of failing the chunk. Each chunk commits together with its checkpoint, so an interrupted import resumes after
+the last committed chunk.
+"""
+
+import csv
+import hashlib
+import os
+import time
+from datetime import datetime, date
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from sqlalchemy import bindparam
+from models import db
+from models.location import Location
+from models.parcel import Parcel
+from models.parcel_version import ParcelVersion
+from models.owner import Owner
+from models.ownership import Ownership
+from models.import_checkpoint import ImportCheckpoint
+from models.parcel_share_total import ParcelShareTotal
+from utils.encryption import aadhaar_crypto
+from utils.table_stats import table_stats
+from utils.share_totals import share_totals, FULL_SHARE, TOLERANCE
+from utils.owner_portfolios import owner_portfolios
+from utils.parcel_revisions import parcel_revisions
+
+try:
+    from openpyxl import load_workbook
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+LAND_CATEGORIES = ['Agricultural', 'Residential', 'Commercial', 'Industrial', 'State Owned']
+OWNER_TYPES = ['Individual', 'Company', 'Government']
+OWNERSHIP_TYPES = ['Freehold', 'Leasehold', 'Joint', 'Inherited']
+
+REQUIRED_COLUMNS = ['ulpin', 'survey_no', 'total_area', 'land_category',
+                    'village', 'taluka', 'district', 'state', 'pincode']
+ERROR_FIELDS = ['row', 'ulpin', 'error']
+
+def _header(value):
+    return str(value or '').strip().lower().replace(' ', '_')
+
+def read_rows(path):
+    """
+    Stream data rows from a CSV or XLSX file
+    Yields: (row_number, dict keyed by normalised header); row 1 is the first data row
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, newline='', encoding='utf-8-sig') as handle:
+            reader = csv.reader(handle)
+            header = [_header(value) for value in next(reader, [])]
+            for number, values in enumerate(reader, start=1):
+                yield number, dict(zip(header, values))
+    elif extension in ('.xlsx', '.xlsm'):
+        if not OPENPYXL_AVAILABLE:
+            raise ValueError('openpyxl is required to import Excel files')
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [_header(value) for value in next(rows, ())]
+            for number, values in enumerate(rows, start=1):
+                yield number, dict(zip(header, values))
+        finally:
+            workbook.close()
+    else:
+        raise ValueError(f'Unsupported import file type: {extension or "none"} (use .csv or .xlsx)')
+
+def _text(row, column):
+    value = row.get(column)
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        # Excel stores pincodes, survey numbers etc. as numbers
+        value = int(value)
+    return str(value).strip()
+
+def _decimal(row, column, low=None, high=None, required=False):
+    value = _text(row, column)
+    if not value:
+        if required:
+            raise ValueError(f'{column} is required')
+        return None
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f'{column} must be a number')
+    if (low is not None and number < low) or (high is not None and number > high):
+        raise ValueError(f'{column} must be between {low} and {high}')
+    return number
+
+def _choice(row, column, choices, default=None):
+    value = _text(row, column)
+    if not value:
+        if default is None:
+            raise ValueError(f'{column} is required')
+        return default
+    for choice in choices:
+        if choice.lower() == value.lower():
+            return choice
+    raise ValueError(f'{column} must be one of: {", ".join(choices)}')
+
+def _date(row, column):
+    value = row.get(column)
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = _text(row, column)
+    if not text:
+        return None
+    try:
+        return datetime.strptime(text, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f'{column} must be a YYYY-MM-DD date')
+
+def validate_row(row):
+    """
+    Normalise one source row
+    Raises ValueError naming the first invalid field
+    """
+    for column in REQUIRED_COLUMNS:
+        if not _text(row, column):
+            raise ValueError(f'{column} is required')
+
+    pincode = _text(row, 'pincode')
+    if not pincode.isdigit() or len(pincode) != 6:
+        raise ValueError('pincode must be 6 digits')
+
+    record = {
+        'ulpin': _text(row, 'ulpin'),
+        'survey_no': _text(row, 'survey_no'),
+        'total_area': _decimal(row, 'total_area', low=Decimal('0.0001'), required=True),
+        'land_category': _choice(row, 'land_category', LAND_CATEGORIES),
+        'current_use_type': _text(row, 'current_use_type') or None,
+        'location': tuple(_text(row, column) for column in ('village', 'taluka', 'district', 'state', 'pincode')),
+        'centroid_lat': _decimal(row, 'centroid_lat', low=-90, high=90),
+        'centroid_lon': _decimal(row, 'centroid_lon', low=-180, high=180),
+        'boundary_geometry': _text(row, 'boundary_geometry') or None,
+        'date_from': _date(row, 'date_from'),
+        'owner': None
+    }
+    if len(record['ulpin']) > 50 or len(record['survey_no']) > 50:
+        raise ValueError('ulpin and survey_no are limited to 50 characters')
+
+    owner_name = _text(row, 'owner_name')
+    if owner_name:
+        pan = _text(row, 'pan').upper() or None
+        if pan and len(pan) != 10:
+            raise ValueError('pan must be 10 characters')
+        aadhaar_number = _text(row, 'aadhaar_number')
+        record['owner'] = {
+            'name': owner_name,
+            'owner_type': _choice(row, 'owner_type', OWNER_TYPES, default='Individual'),
+            'pan': pan,
+            'aadhaar_encrypted': aadhaar_crypto.encrypt_aadhaar(aadhaar_number) if aadhaar_number else None,
+            'address': _text(row, 'address') or None,
+            'contact_no': _text(row, 'contact_no')[:15] or None
+        }
+        record['share_fraction'] = _decimal(row, 'share_fraction', low=Decimal('0.0001'), high=1, required=True)
+        record['ownership_type'] = _choice(row, 'ownership_type', OWNERSHIP_TYPES, default='Freehold')
+        if not record['date_from']:
+            raise ValueError('date_from is required for ownership rows')
+
+    return record
+
+def _owner_key(owner):
+    """Owners with a PAN are shared across rows; others only within identical details"""
+    if owner['pan']:
+        return ('pan', owner['pan'])
+    return ('details', owner['name'], owner['owner_type'], owner['contact_no'], owner['address'])
+
+class ParcelImporter:
+    """Chunked, resumable import of parcels with their owners"""
+
+    def __init__(self):
+        self._locations = {}
+
+    @staticmethod
+    def source_key(path):
+        return hashlib.sha256(os.path.abspath(path).encode()).hexdigest()
+
+    def run(self, path, chunk_size=1000, restart=False, error_path=None, on_chunk=None):
+        """
+        Import path, resuming from its checkpoint unless restart is set
+        on_chunk(summary) is called after every committed chunk
+        Returns: summary dict with row counts, inserted counts and throughput
+        """
+        path = os.path.abspath(path)
+        if not os.path.isfile(path):
+            raise ValueError(f'File not found: {path}')
+        file_size = os.path.getsize(path)
+        source_key = self.source_key(path)
+
+        checkpoint = ImportCheckpoint.query.get(source_key)
+        if checkpoint and not restart:
+            if checkpoint.file_size != file_size:
+                raise ValueError('File has changed since the last run; use --restart to import it from the beginning')
+            if checkpoint.status == 'Completed':
+                return {'completed_before': True, 'rows_committed': checkpoint.rows_committed}
+        else:
+            if checkpoint is None:
+                checkpoint = ImportCheckpoint(source_key=source_key)
+                db.session.add(checkpoint)
+            checkpoint.source_path = path[-500:]
+            checkpoint.file_size = file_size
+            checkpoint.rows_committed = 0
+            checkpoint.chunks_committed = 0
+            checkpoint.error_rows = 0
+            checkpoint.status = 'Running'
+            checkpoint.started_at = datetime.utcnow()
+            checkpoint.updated_at = checkpoint.started_at
+            db.session.commit()
+
+        self._locations = {
+            (loc.village, loc.taluka, loc.district, loc.state, loc.pincode): loc.location_id
+            for loc in db.session.query(Location).all()
+        }
+
+        summary = {
+            'completed_before': False,
+            'resumed_from_row': checkpoint.rows_committed,
+            'rows_read': 0, 'rows_imported': 0, 'rows_failed': 0,
+            'parcels': 0, 'owners': 0, 'ownerships': 0,
+            'chunks': 0, 'seconds': 0.0, 'rows_per_second': 0.0
+        }
+        started = time.perf_counter()
+        rows = islice(read_rows(path), checkpoint.rows_committed, None)
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            chunk_started = time.perf_counter()
+
+            records, errors = [], []
+            for number, row in chunk:
+                try:
+                    record = validate_row(row)
+                    record['row'] = number
+                    records.append(record)
+                except ValueError as e:
+                    errors.append({'row': number, 'ulpin': _text(row, 'ulpin'), 'error': str(e)})
+
+            try:
+                inserted, rejected = self._write_chunk(records)
+                errors = sorted(errors + rejected, key=lambda error: error['row'])
+                checkpoint.rows_committed += len(chunk)
+                checkpoint.chunks_committed += 1
+                checkpoint.error_rows += len(errors)
+                checkpoint.updated_at = datetime.utcnow()
+                # Rows and checkpoint commit together: a crash never replays a committed chunk
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+            if errors and error_path:
+                self._write_errors(error_path, errors)
+
+            summary['rows_read'] += len(chunk)
+            summary['rows_imported'] += len(records) - len(rejected)
+            summary['rows_failed'] += len(errors)
+            summary['chunks'] += 1
+            for name, count in inserted.items():
+                summary[name] += count
+            summary['seconds'] = time.perf_counter() - started
+            summary['rows_per_second'] = summary['rows_read'] / summary['seconds'] if summary['seconds'] else 0.0
+
+            if on_chunk:
+                on_chunk(dict(summary,
+                              last_row=chunk[-1][0],
+                              chunk_rows_per_second=len(chunk) / max(time.perf_counter() - chunk_started, 1e-9),
+                              errors=errors))
+
+        checkpoint.status = 'Completed'
+        checkpoint.updated_at = datetime.utcnow()
+        db.session.commit()
+        return summary
+
+    def _location_id(self, key):
+        location_id = self._locations.get(key)
+        if location_id is None:
+            village, taluka, district, state, pincode = key
+            location = Location(village=village, taluka=taluka, district=district, state=state, pincode=pincode)
+            db.session.add(location)
+            db.session.flush()
+            location_id = self._locations[key] = location.location_id
+        return location_id
+
+    @staticmethod
+    def _allocate_shares(records, parcel_ids):
+        """
+        Accept owner rows in file order while their parcel stays within 100%
+        Existing parcels start from their parcel_share_total row, read with a row
+        lock so the deltas applied later still fit; new parcels start from 0
+        Returns: (accepted records, error dicts for the rejected rows)
+        """
+        existing = {parcel_ids[record['ulpin']] for record in records
+                    if record['owner'] and record['ulpin'] in parcel_ids}
+        totals = {}
+        if existing:
+            totals = dict(db.session.query(ParcelShareTotal.parcel_id, ParcelShareTotal.active_share_sum)
+                          .filter(ParcelShareTotal.parcel_id.in_(existing))
+                          .order_by(ParcelShareTotal.parcel_id).with_for_update().all())
+
+        allocated, accepted, errors = {}, [], []
+        for record in records:
+            if record['owner']:
+                ulpin = record['ulpin']
+                if ulpin not in allocated:
+                    allocated[ulpin] = Decimal(str(totals.get(parcel_ids.get(ulpin)) or 0))
+                total = allocated[ulpin] + record['share_fraction']
+                if total > FULL_SHARE + TOLERANCE:
+                    errors.append({'row': record['row'], 'ulpin': ulpin,
+                                   'error': f'share_fraction would bring the active shares of {ulpin} '
+                                            f'to {total * 100:.2f}% (maximum 100%)'})
+                    continue
+                allocated[ulpin] = total
+            accepted.append(record)
+        return accepted, errors
+
+    def _write_chunk(self, records):
+        """
+        Insert one validated chunk in the current transaction
+        Returns: (inserted counts, error dicts for owner rows refused by the share check)
+        """
+        inserted = {'parcels': 0, 'owners': 0, 'ownerships': 0}
+        if not records:
+            return inserted, []
+
+        # Whole seconds: MySQL DATETIME rounds fractions, and this value is matched below
+        now = datetime.utcnow().replace(microsecond=0)
+
+        # Parcels: first row per new ULPIN defines the parcel; later rows only add owners
+        ulpins = list(dict.fromkeys(record['ulpin'] for record in records))
+        parcel_ids = dict(db.session.query(Parcel.ulpin, Parcel.parcel_id).filter(Parcel.ulpin.in_(ulpins)).all())
+        # A refused row is never the first row of a new ULPIN (that parcel starts at 0 and shares are at most 1),
+        # so every parcel below still gets created
+        records, rejected = self._allocate_shares(records, parcel_ids)
+        new_parcels = {}
+        for record in records:
+            if record['ulpin'] not in parcel_ids and record['ulpin'] not in new_parcels:
+                new_parcels[record['ulpin']] = record
+
+        if new_parcels:
+            db.session.execute(Parcel.__table__.insert(), [{
+                'ulpin': record['ulpin'],
+                'survey_no': record['survey_no'],
+                'total_area': record['total_area'],
+                'land_category': record['land_category'],
+                'current_use_type': record['current_use_type'],
+                'location_id': self._location_id(record['location']),
+                'centroid_lat': record['centroid_lat'],
+                'centroid_lon': record['centroid_lon'],
+                'created_at': now
+            } for record in new_parcels.values()])
+            new_ids = dict(db.session.query(Parcel.ulpin, Parcel.parcel_id)
+                           .filter(Parcel.ulpin.in_(list(new_parcels))).all())
+            parcel_ids.update(new_ids)
+
+            db.session.execute(ParcelVersion.__table__.insert(), [{
+                'parcel_id': new_ids[ulpin],
+                'valid_from': datetime.combine(record['date_from'], datetime.min.time()) if record['date_from'] else now,
+                'boundary_geometry': record['boundary_geometry'],
+                'area_at_version': record['total_area'],
+                'created_at': now
+            } for ulpin, record in new_parcels.items()])
+            versions = db.session.query(ParcelVersion.parcel_id, ParcelVersion.version_id).filter(
+                ParcelVersion.parcel_id.in_(list(new_ids.values()))
+            ).all()
+
+            parcel_table = Parcel.__table__
+            db.session.execute(
+                parcel_table.update()
+                .where(parcel_table.c.parcel_id == bindparam('b_parcel_id'))
+                .values(current_version_id=bindparam('b_version_id')),
+                [{'b_parcel_id': parcel_id, 'b_version_id': version_id} for parcel_id, version_id in versions]
+            )
+            inserted['parcels'] = len(new_parcels)
+
+        # Owners: reuse existing owners by PAN, insert the rest in one batch
+        owner_records = [record for record in records if record['owner']]
+        if owner_records:
+            owner_ids = {}
+            pans = list({record['owner']['pan'] for record in owner_records if record['owner']['pan']})
+            if pans:
+                for pan, owner_id in db.session.query(Owner.pan, Owner.owner_id).filter(
+                        Owner.pan.in_(pans)).order_by(Owner.owner_id.desc()).all():
+                    owner_ids[('pan', pan)] = owner_id
+
+            new_owners = {}
+            for record in owner_records:
+                key = _owner_key(record['owner'])
+                if key not in owner_ids and key not in new_owners:
+                    new_owners[key] = dict(record['owner'], created_at=now)
+
+            if new_owners:
+                db.session.execute(Owner.__table__.insert(), list(new_owners.values()))
+                # No natural key to read ids back by, so match on this batch's created_at and details
+                batch = db.session.query(
+                    Owner.owner_id, Owner.name, Owner.owner_type, Owner.pan, Owner.contact_no, Owner.address
+                ).filter(Owner.created_at == now).order_by(Owner.owner_id).all()
+                for owner_id, name, owner_type, pan, contact_no, address in batch:
+                    key = _owner_key({'name': name, 'owner_type': owner_type, 'pan': pan,
+                                      'contact_no': contact_no, 'address': address})
+                    if key in new_owners:
+                        owner_ids[key] = owner_id
+                inserted['owners'] = len(new_owners)
+
+            db.session.execute(Ownership.__table__.insert(), [{
+                'parcel_id': parcel_ids[record['ulpin']],
+                'owner_id': owner_ids[_owner_key(record['owner'])],
+                'share_fraction': record['share_fraction'],
+                'ownership_type': record['ownership_type'],
+                'date_from': record['date_from'],
+                'created_at': now
+            } for record in owner_records])
+            inserted['ownerships'] = len(owner_records)
+
+            shares = {}
+            for record in owner_records:
+                total = shares.setdefault(parcel_ids[record['ulpin']], [Decimal('0'), 0])
+                total[0] += record['share_fraction']
+                total[1] += 1
+            # Every total was checked by _allocate_shares, so this fits
+            share_totals.apply_deltas(db.session.connection(), shares)
+            owner_portfolios.apply_changes(db.session.connection(), [
+                (None, None, (owner_ids[_owner_key(record['owner'])], parcel_ids[record['ulpin']],
+                              record['share_fraction']))
+                for record in owner_records
+            ])
+
+        # Core inserts skip the ORM flush hooks, so move the counters here
+        touched = {parcel_ids[ulpin] for ulpin in new_parcels}
+        touched.update(parcel_ids[record['ulpin']] for record in owner_records)
+        if touched:
+            parcel_revisions.bump(db.session.connection(), touched)
+        table_stats.apply_deltas(db.session.connection(), {
+            'parcel': inserted['parcels'],
+            'owner': inserted['owners'],
+            'ownership': inserted['ownerships']
+        })
+        return inserted, rejected
+
+    @staticmethod
+    def _write_errors(error_path, errors):
+        """Append rejected rows to the error report"""
+        write_header = not os.path.exists(error_path) or os.path.getsize(error_path) == 0
+        with open(error_path, 'a', newline='', encoding='utf-8') as handle:
+            writer = csv.DictWriter(handle, fieldnames=ERROR_FIELDS)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(errors)
+
+# Global parcel importer instance
+parcel_importer = ParcelImporter()
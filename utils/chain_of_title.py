@@ -0,0 +1,133 @@
+"""
+Chain of title for Government Property Management Portal
+Rebuilds a parcel's ownership lineage in one recursive CTE instead of walking
+mutations and ownerships in Python. An approved mutation closes the seller's
+ownership on date_of_mutation and opens the buyer's on the same date, and the
+recursion follows exactly that link:
+
+    ownership(owner_id = m.from_owner_id, date_to = m.date_of_mutation)
+      -> mutation m (Approved)
+      -> ownership(owner_id = m.to_owner_id, date_from = m.date_of_mutation)
+
+Ownerships that no approved mutation created (original grants, owners added
+by hand) are the roots. Every hop is served by an index:
+idx_mutation_chain_from for the seller side, idx_ownership_chain for the buyer
+side and idx_mutation_chain_to for the root test.
+"""
+
+from sqlalchemy import and_, exists, literal, select
+from sqlalchemy.orm import aliased
+from models import db
+from models.owner import Owner
+from models.ownership import Ownership
+from models.mutation import Mutation
+
+class ChainOfTitle:
+    """Ownership lineage for a single parcel"""
+
+    # Guards against malformed data (e.g. a same-day sale back and forth)
+    MAX_DEPTH = 500
+
+    def _statement(self, parcel_id):
+        root_mutation = aliased(Mutation)
+        chain = (
+            select(
+                Ownership.ownership_id,
+                Ownership.owner_id,
+                Ownership.share_fraction,
+                Ownership.ownership_type,
+                Ownership.date_from,
+                Ownership.date_to,
+                literal(None, db.Integer).label('parent_ownership_id'),
+                literal(None, db.Integer).label('mutation_id'),
+                literal(0).label('depth')
+            )
+            .where(Ownership.parcel_id == parcel_id)
+            .where(~exists().where(and_(
+                root_mutation.parcel_id == Ownership.parcel_id,
+                root_mutation.to_owner_id == Ownership.owner_id,
+                root_mutation.date_of_mutation == Ownership.date_from,
+                root_mutation.status == 'Approved'
+            )))
+            .cte('chain', recursive=True)
+        )
+
+        previous = aliased(chain, name='previous')
+        step_mutation = aliased(Mutation)
+        successor = aliased(Ownership)
+        chain = chain.union_all(
+            select(
+                successor.ownership_id,
+                successor.owner_id,
+                successor.share_fraction,
+                successor.ownership_type,
+                successor.date_from,
+                successor.date_to,
+                previous.c.ownership_id,
+                step_mutation.mutation_id,
+                previous.c.depth + 1
+            )
+            .select_from(previous)
+            .join(step_mutation, and_(
+                step_mutation.parcel_id == parcel_id,
+                step_mutation.from_owner_id == previous.c.owner_id,
+                step_mutation.date_of_mutation == previous.c.date_to,
+                step_mutation.status == 'Approved'
+            ))
+            .join(successor, and_(
+                successor.parcel_id == parcel_id,
+                successor.owner_id == step_mutation.to_owner_id,
+                successor.date_from == step_mutation.date_of_mutation
+            ))
+            .where(previous.c.depth < self.MAX_DEPTH)
+        )
+
+        return (
+            select(
+                chain.c.ownership_id,
+                chain.c.parent_ownership_id,
+                chain.c.depth,
+                chain.c.owner_id,
+                Owner.name.label('owner_name'),
+                Owner.owner_type,
+                chain.c.share_fraction,
+                chain.c.ownership_type,
+                chain.c.date_from,
+                chain.c.date_to,
+                chain.c.mutation_id,
+                Mutation.mutation_type,
+                Mutation.from_owner_id,
+                Mutation.consideration_value,
+                Mutation.approved_on
+            )
+            .join(Owner, Owner.owner_id == chain.c.owner_id)
+            .outerjoin(Mutation, Mutation.mutation_id == chain.c.mutation_id)
+            .order_by(chain.c.date_from, chain.c.depth, chain.c.ownership_id)
+        )
+
+    def get_chain(self, parcel_id):
+        """Ordered lineage entries (oldest first) as plain dicts"""
+        rows = db.session.execute(self._statement(parcel_id)).all()
+        return [{
+            'ownership_id': row.ownership_id,
+            'parent_ownership_id': row.parent_ownership_id,
+            'depth': row.depth,
+            'owner_id': row.owner_id,
+            'owner_name': row.owner_name,
+            'owner_type': row.owner_type,
+            'share_fraction': float(row.share_fraction),
+            'ownership_type': row.ownership_type,
+            'date_from': row.date_from.isoformat() if row.date_from else None,
+            'date_to': row.date_to.isoformat() if row.date_to else None,
+            'current': row.date_to is None,
+            'mutation': {
+                'mutation_id': row.mutation_id,
+                'mutation_type': row.mutation_type,
+                'from_owner_id': row.from_owner_id,
+                'consideration_value': float(row.consideration_value) if row.consideration_value is not None else None,
+                'approved_on': row.approved_on.isoformat() if row.approved_on else None
+            } if row.mutation_id else None
+        } for row in rows]
+
+# Global chain of title instance
+chain_of_title = ChainOfTitle()
@@ -0,0 +1,47 @@
+"""
+Database triggers for Government Property Management Portal
+Counters that must also see rows written outside the ORM (the MySQL audit
+triggers, bulk SQL) are kept by triggers; this creates them on startup
+"""
+
+from flask import current_app
+from sqlalchemy import text
+from models import db
+
+def ensure_trigger(name, action, table_name, statements):
+    """
+    Create an AFTER <action> trigger on table_name unless it already exists
+    statements: {dialect: list of SQL statements using NEW/OLD (lower case on SQLite)}
+    MySQL needs the TRIGGER privilege; without it a warning points to database/triggers.sql
+    Returns: True if the trigger is in place
+    """
+    dialect = db.engine.dialect.name
+    body = statements.get(dialect)
+    if not body:
+        return False
+
+    if dialect == 'sqlite':
+        db.session.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {action} ON {table_name} BEGIN "
+            + ''.join(f'{statement}; ' for statement in body) + "END"
+        ))
+        db.session.commit()
+        return True
+
+    exists = db.session.execute(text(
+        "SELECT COUNT(*) FROM information_schema.triggers "
+        "WHERE trigger_schema = DATABASE() AND trigger_name = :name"
+    ), {'name': name}).scalar()
+    if exists:
+        return True
+    try:
+        db.session.execute(text(
+            f"CREATE TRIGGER {name} AFTER {action} ON {table_name} FOR EACH ROW BEGIN "
+            + ''.join(f'{statement}; ' for statement in body) + "END"
+        ))
+        db.session.commit()
+        return True
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.warning(f'Trigger {name} not created ({e}); run database/triggers.sql')
+        return False
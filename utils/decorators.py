@@ -47,3 +47,16 @@ def any_authenticated_user(f):
             return redirect(url_for('auth.login'))
         return f(*args, **kwargs)
     return decorated_function
+
+def query_budget(max_queries):
+    """
+    Declare the most SQL statements a view may issue per request
+    Asserted by tests/test_query_counts.py and flagged at runtime by the SQL
+    profiler; place below login/role decorators so
+    functools.wraps carries the attribute to the registered view
+    Usage: @query_budget(5)
+    """
+    def decorator(f):
+        f.query_budget = max_queries
+        return f
+    return decorator
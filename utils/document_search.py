@@ -0,0 +1,298 @@
+"""
+Document text extraction and full-text search for Government Property Management Portal
+Pulls text out of uploaded PDF/DOCX/TXT files and keeps it in an FTS5 (SQLite)
+or FULLTEXT (MySQL) index so deeds can be found by survey number or party name
+"""
+
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime
+from xml.etree import ElementTree
+from flask import current_app
+from markupsafe import Markup, escape
+from sqlalchemy import text
+from models import db
+from models.document import Document
+from models.document_text import DocumentText
+
+# Optional pypdf import for PDF extraction
+try:
+    from pypdf import PdfReader
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Extracted text is capped so a single scanned ledger cannot bloat the index
+MAX_TEXT_LENGTH = 1_000_000
+
+# Highlight markers used inside snippets; replaced after HTML escaping
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_END = '\x03'
+
+
+def _extract_pdf(file_path):
+    reader = PdfReader(file_path)
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+def _extract_docx(file_path):
+    with zipfile.ZipFile(file_path) as archive:
+        root = ElementTree.fromstring(archive.read('word/document.xml'))
+    paragraphs = []
+    for paragraph in root.iter(f'{WORD_NAMESPACE}p'):
+        paragraphs.append(''.join(node.text or '' for node in paragraph.iter(f'{WORD_NAMESPACE}t')))
+    return '\n'.join(paragraphs)
+
+
+def _extract_txt(file_path):
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read(MAX_TEXT_LENGTH)
+
+
+EXTRACTORS = {
+    'pdf': _extract_pdf,
+    'docx': _extract_docx,
+    'txt': _extract_txt,
+}
+
+
+def extract_text(file_path):
+    """
+    Extract plain text from a document on disk
+    Kept at module level so it can be shipped to a process pool
+    Returns: (status, content, error_message)
+    """
+    if not file_path or not os.path.exists(file_path):
+        return 'Failed', None, 'File not found'
+
+    extension = file_path.rsplit('.', 1)[1].lower() if '.' in file_path else ''
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None or (extension == 'pdf' and not PYPDF_AVAILABLE):
+        return 'Unsupported', None, None
+
+    try:
+        content = extractor(file_path)
+    except Exception as e:
+        return 'Failed', None, str(e)[:500]
+
+    content = re.sub(r'[ \t\r\f\v]+', ' ', content or '').strip()[:MAX_TEXT_LENGTH]
+    if not content:
+        return 'Empty', None, None
+    return 'Indexed', content, None
+
+
+class DocumentSearchIndex:
+    """Maintains the document text index and answers ranked searches"""
+
+    FTS_TABLE = 'document_fts'
+    MYSQL_FULLTEXT_INDEX = 'ft_document_text_content'
+
+    def __init__(self, max_workers=2):
+        self.max_workers = max_workers
+        self._executor = None
+
+    @staticmethod
+    def _dialect():
+        return db.engine.dialect.name
+
+    def ensure_index(self):
+        """Create the engine-specific full-text index if it does not exist yet"""
+        dialect = self._dialect()
+
+        if dialect == 'sqlite':
+            # External-content FTS5 table kept in sync with document_text by triggers
+            statements = [
+                f"""CREATE VIRTUAL TABLE IF NOT EXISTS {self.FTS_TABLE} USING fts5(
+                    content, content='document_text', content_rowid='document_id',
+                    tokenize='unicode61 remove_diacritics 2')""",
+                f"""CREATE TRIGGER IF NOT EXISTS document_text_ai AFTER INSERT ON document_text BEGIN
+                    INSERT INTO {self.FTS_TABLE}(rowid, content) VALUES (new.document_id, new.content);
+                END""",
+                f"""CREATE TRIGGER IF NOT EXISTS document_text_ad AFTER DELETE ON document_text BEGIN
+                    INSERT INTO {self.FTS_TABLE}({self.FTS_TABLE}, rowid, content) VALUES ('delete', old.document_id, old.content);
+                END""",
+                f"""CREATE TRIGGER IF NOT EXISTS document_text_au AFTER UPDATE ON document_text BEGIN
+                    INSERT INTO {self.FTS_TABLE}({self.FTS_TABLE}, rowid, content) VALUES ('delete', old.document_id, old.content);
+                    INSERT INTO {self.FTS_TABLE}(rowid, content) VALUES (new.document_id, new.content);
+                END""",
+            ]
+            for statement in statements:
+                db.session.execute(text(statement))
+            db.session.commit()
+
+        elif dialect == 'mysql':
+            exists = db.session.execute(text(
+                "SELECT COUNT(*) FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = 'document_text' AND index_name = :name"
+            ), {'name': self.MYSQL_FULLTEXT_INDEX}).scalar()
+            if not exists:
+                db.session.execute(text(
+                    f"ALTER TABLE document_text ADD FULLTEXT INDEX {self.MYSQL_FULLTEXT_INDEX} (content)"
+                ))
+                db.session.commit()
+
+    @staticmethod
+    def document_file_path(document):
+        """Absolute path of a stored document file"""
+        if not document.file_path:
+            return None
+        return os.path.join(current_app.static_folder, document.file_path)
+
+    @staticmethod
+    def _store(document_id, status, content, error_message):
+        db.session.merge(DocumentText(
+            document_id=document_id,
+            content=content,
+            status=status,
+            error_message=error_message,
+            extracted_at=datetime.utcnow()
+        ))
+
+    def index_document(self, document):
+        """Extract and index a single document synchronously"""
+        status, content, error_message = extract_text(self.document_file_path(document))
+        self._store(document.document_id, status, content, error_message)
+        db.session.commit()
+        return status
+
+    def submit(self, document_id):
+        """Queue a freshly uploaded document for extraction on the worker pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='doc-index')
+        app = current_app._get_current_object()
+        return self._executor.submit(self._index_in_context, app, document_id)
+
+    def _index_in_context(self, app, document_id):
+        with app.app_context():
+            try:
+                document = Document.query.get(document_id)
+                if document:
+                    self.index_document(document)
+            except Exception as e:
+                db.session.rollback()
+                print(f"Document indexing error for document {document_id}: {str(e)}")
+            finally:
+                db.session.remove()
+
+    def reindex_all(self, only_missing=True, workers=None, batch_size=50):
+        """
+        Extract text for the existing corpus using a process pool
+        Returns: dict of status -> count
+        """
+        query = db.session.query(Document.document_id, Document.file_path).filter(Document.file_path.isnot(None))
+        if only_missing:
+            query = query.outerjoin(DocumentText, DocumentText.document_id == Document.document_id).filter(
+                DocumentText.document_id.is_(None)
+            )
+        rows = query.order_by(Document.document_id).all()
+
+        ids = [row.document_id for row in rows]
+        paths = [os.path.join(current_app.static_folder, row.file_path) for row in rows]
+        summary = {}
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(extract_text, paths, chunksize=max(1, batch_size // 4))
+            for position, (document_id, result) in enumerate(zip(ids, results), start=1):
+                status, content, error_message = result
+                self._store(document_id, status, content, error_message)
+                summary[status] = summary.get(status, 0) + 1
+                if position % batch_size == 0:
+                    db.session.commit()
+        db.session.commit()
+        return summary
+
+    @staticmethod
+    def _fts_query(query_text):
+        """Quote each whitespace-separated term so user input is never parsed as FTS syntax"""
+        terms = [term.replace('"', '""') for term in query_text.split() if term.strip('"')]
+        return ' '.join(f'"{term}"' for term in terms)
+
+    @staticmethod
+    def _highlight(raw_snippet):
+        """HTML-escape a snippet and turn the highlight markers into <mark> tags"""
+        escaped = str(escape(raw_snippet or ''))
+        return Markup(escaped.replace(HIGHLIGHT_START, '<mark>').replace(HIGHLIGHT_END, '</mark>'))
+
+    @staticmethod
+    def _python_snippet(content, query_text, width=80):
+        """Build a snippet around the first matching term for engines without snippet()"""
+        content = content or ''
+        terms = [term for term in query_text.split() if term]
+        lowered = content.lower()
+        position = min([lowered.find(term.lower()) for term in terms if term.lower() in lowered] or [0])
+        start = max(0, position - width)
+        snippet = content[start:position + width]
+        for term in terms:
+            snippet = re.sub(re.escape(term), lambda m: f'{HIGHLIGHT_START}{m.group(0)}{HIGHLIGHT_END}', snippet, flags=re.IGNORECASE)
+        prefix = '…' if start > 0 else ''
+        suffix = '…' if position + width < len(content) else ''
+        return f'{prefix}{snippet}{suffix}'
+
+    def search(self, query_text, doc_type=None, limit=10, offset=0):
+        """
+        Ranked search over extracted document text
+        Returns: list of dicts with document_id, score and highlighted snippet
+        (higher score is a better match on every engine)
+        """
+        query_text = (query_text or '').strip()
+        if not query_text:
+            return []
+
+        dialect = self._dialect()
+        params = {'limit': limit, 'offset': offset}
+        type_join = ''
+        if doc_type:
+            type_join = 'JOIN document d ON d.document_id = {id_column} AND d.doc_type = :doc_type'
+            params['doc_type'] = doc_type
+
+        if dialect == 'sqlite':
+            params['q'] = self._fts_query(query_text)
+            if not params['q']:
+                return []
+            sql = f"""
+                SELECT f.rowid AS document_id, -bm25({self.FTS_TABLE}) AS score,
+                       snippet({self.FTS_TABLE}, 0, char(2), char(3), '…', 16) AS snippet
+                FROM {self.FTS_TABLE} f {type_join.format(id_column='f.rowid')}
+                WHERE {self.FTS_TABLE} MATCH :q
+                ORDER BY bm25({self.FTS_TABLE})
+                LIMIT :limit OFFSET :offset
+            """
+            rows = db.session.execute(text(sql), params).all()
+            return [{
+                'document_id': row.document_id,
+                'score': float(row.score),
+                'snippet': self._highlight(row.snippet)
+            } for row in rows]
+
+        if dialect == 'mysql':
+            params['q'] = query_text
+            sql = f"""
+                SELECT t.document_id, MATCH(t.content) AGAINST (:q IN NATURAL LANGUAGE MODE) AS score, t.content
+                FROM document_text t {type_join.format(id_column='t.document_id')}
+                WHERE MATCH(t.content) AGAINST (:q IN NATURAL LANGUAGE MODE)
+                ORDER BY score DESC
+                LIMIT :limit OFFSET :offset
+            """
+        else:
+            params['pattern'] = f'%{query_text}%'
+            sql = f"""
+                SELECT t.document_id, 1.0 AS score, t.content
+                FROM document_text t {type_join.format(id_column='t.document_id')}
+                WHERE t.content LIKE :pattern
+                ORDER BY t.document_id DESC
+                LIMIT :limit OFFSET :offset
+            """
+
+        rows = db.session.execute(text(sql), params).all()
+        return [{
+            'document_id': row.document_id,
+            'score': float(row.score or 0),
+            'snippet': self._highlight(self._python_snippet(row.content, query_text))
+        } for row in rows]
+
+# Global document search index instance
+document_search = DocumentSearchIndex()
@@ -0,0 +1,60 @@
+"""
+Declared loader strategies for Government Property Management Portal views
+Each function returns the query options a template needs, so rendering a page
+never falls back to one lazy load per row. Every hop the templates make is
+many-to-one, so joinedload adds columns to the page query instead of rows.
+"""
+
+from sqlalchemy.orm import joinedload, contains_eager
+from models.parcel import Parcel
+from models.ownership import Ownership
+from models.mutation import Mutation
+from models.encumbrance import Encumbrance
+from models.tenant_agreement import TenantAgreement
+
+def parcel_list_options(location_joined=False):
+    """parcel_list.html: parcel.location"""
+    if location_joined:
+        # The list query already joins Location for searching; reuse that join
+        return [contains_eager(Parcel.location)]
+    return [joinedload(Parcel.location)]
+
+def parcel_detail_options():
+    """parcel_details.html: parcel.location"""
+    return [joinedload(Parcel.location)]
+
+def parcel_ownership_options():
+    """parcel_details.html ownership rows: ownership.owner"""
+    return [joinedload(Ownership.owner)]
+
+def parcel_encumbrance_options():
+    """parcel_details.html encumbrance rows: encumbrance.related_party"""
+    return [joinedload(Encumbrance.related_party)]
+
+def mutation_list_options():
+    """mutation_list.html: mutation.parcel, mutation.from_owner, mutation.to_owner"""
+    return [
+        joinedload(Mutation.parcel),
+        joinedload(Mutation.from_owner),
+        joinedload(Mutation.to_owner)
+    ]
+
+def owner_ownership_options():
+    """owner_details.html ownership rows: ownership.parcel.location"""
+    return [joinedload(Ownership.parcel).joinedload(Parcel.location)]
+
+def owner_agreement_options():
+    """owner_details.html agreement rows: agreement.parcel, agreement.tenant, agreement.property_owner"""
+    return [
+        joinedload(TenantAgreement.parcel),
+        joinedload(TenantAgreement.tenant),
+        joinedload(TenantAgreement.property_owner)
+    ]
+
+def expiring_agreement_options():
+    """tenant_expiring.html: agreement.parcel, agreement.tenant, agreement.property_owner"""
+    return [
+        joinedload(TenantAgreement.parcel),
+        joinedload(TenantAgreement.tenant),
+        joinedload(TenantAgreement.property_owner)
+    ]
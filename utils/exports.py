@@ -0,0 +1,151 @@
+"""
+Streaming exports for Government Property Management Portal
+Writes filtered list queries as CSV or NDJSON straight into the response.
+Rows are fetched in yield_per batches over a server-side cursor and encoded
+batch by batch, so memory use stays flat however many rows are exported.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from flask import Response, abort, request, stream_with_context
+from sqlalchemy.orm import aliased
+from models.parcel import Parcel
+from models.location import Location
+from models.owner import Owner
+from models.ownership import Ownership
+from models.mutation import Mutation
+from models.tax_assessment import TaxAssessment
+from models.audit_log import AuditLog
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+YIELD_PER = 1000
+
+FromOwner = aliased(Owner)
+ToOwner = aliased(Owner)
+
+# (header, column) pairs per export; queries are projected onto these columns
+PARCEL_COLUMNS = [
+    ('parcel_id', Parcel.parcel_id), ('ulpin', Parcel.ulpin), ('survey_no', Parcel.survey_no),
+    ('total_area', Parcel.total_area), ('land_category', Parcel.land_category),
+    ('current_use_type', Parcel.current_use_type), ('village', Location.village),
+    ('taluka', Location.taluka), ('district', Location.district), ('state', Location.state),
+    ('pincode', Location.pincode), ('centroid_lat', Parcel.centroid_lat),
+    ('centroid_lon', Parcel.centroid_lon), ('created_at', Parcel.created_at)
+]
+OWNERSHIP_COLUMNS = [
+    ('ownership_id', Ownership.ownership_id), ('parcel_id', Ownership.parcel_id), ('ulpin', Parcel.ulpin),
+    ('owner_id', Ownership.owner_id), ('owner_name', Owner.name), ('owner_type', Owner.owner_type),
+    ('share_fraction', Ownership.share_fraction), ('ownership_type', Ownership.ownership_type),
+    ('date_from', Ownership.date_from), ('date_to', Ownership.date_to)
+]
+MUTATION_COLUMNS = [
+    ('mutation_id', Mutation.mutation_id), ('parcel_id', Mutation.parcel_id), ('ulpin', Parcel.ulpin),
+    ('from_owner_id', Mutation.from_owner_id), ('from_owner', FromOwner.name),
+    ('to_owner_id', Mutation.to_owner_id), ('to_owner', ToOwner.name),
+    ('mutation_type', Mutation.mutation_type), ('date_of_mutation', Mutation.date_of_mutation),
+    ('consideration_value', Mutation.consideration_value), ('status', Mutation.status),
+    ('approved_by', Mutation.approved_by), ('approved_on', Mutation.approved_on),
+    ('created_at', Mutation.created_at)
+]
+TAX_COLUMNS = [
+    ('tax_id', TaxAssessment.tax_id), ('parcel_id', TaxAssessment.parcel_id), ('ulpin', Parcel.ulpin),
+    ('assessment_year', TaxAssessment.assessment_year), ('land_value', TaxAssessment.land_value),
+    ('building_value', TaxAssessment.building_value),
+    ('total_assessed_value', TaxAssessment.total_assessed_value), ('tax_due', TaxAssessment.tax_due),
+    ('amount_paid', TaxAssessment.amount_paid), ('paid_on', TaxAssessment.paid_on),
+    ('status', TaxAssessment.status)
+]
+AUDIT_LOG_COLUMNS = [
+    ('audit_id', AuditLog.audit_id), ('timestamp', AuditLog.timestamp), ('table_name', AuditLog.table_name),
+    ('record_pk_value', AuditLog.record_pk_value), ('action', AuditLog.action),
+    ('user_id', AuditLog.user_id), ('old_values', AuditLog.old_values), ('new_values', AuditLog.new_values)
+]
+
+def _plain(value):
+    """JSON-safe form of a column value; money stays exact as a string"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(',', ':'))
+    return _plain(value)
+
+def generate_rows(query, columns, fmt='csv', yield_per=YIELD_PER):
+    """
+    Yield encoded text, one piece per yield_per rows
+    The query is projected onto the export columns, so no ORM objects pile
+    up in the session while streaming
+    """
+    headers = [header for header, _ in columns]
+    rows = query.with_entities(*[column for _, column in columns]).yield_per(yield_per)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == 'csv' else None
+
+    if writer:
+        writer.writerow(headers)
+
+    pending = 0
+    for row in rows:
+        if writer:
+            writer.writerow([_csv_value(value) for value in row])
+        else:
+            buffer.write(json.dumps({header: _plain(value) for header, value in zip(headers, row)},
+                                    separators=(',', ':'), default=str))
+            buffer.write('\n')
+        pending += 1
+        if pending >= yield_per:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def gzip_stream(chunks, level=6):
+    """Compress a stream of text pieces into a single gzip member as it goes"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+def export_response(query, columns, basename):
+    """
+    Streaming download of query in the format picked by ?format=csv|ndjson
+    ?gzip=1 sends a .gz file compressed on the fly
+    """
+    fmt = request.args.get('format', 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        abort(400)
+    compress = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+
+    filename = f"{basename}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.{fmt}"
+    chunks = generate_rows(query, columns, fmt)
+    if compress:
+        body = gzip_stream(chunks)
+        content_type = 'application/gzip'
+        filename += '.gz'
+    else:
+        body = (chunk.encode('utf-8') for chunk in chunks)
+        content_type = f'{EXPORT_FORMATS[fmt]}; charset=utf-8'
+
+    response = Response(stream_with_context(body), content_type=content_type)
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    # Keep reverse proxies from buffering the whole export before sending it on
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,123 @@
+"""
+Keyset (cursor) pagination for Government Property Management Portal
+Pages are addressed by an opaque cursor holding the (sort value, id) of the
+row at the page edge, so page 2000 costs the same index range scan as page 1
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import and_, or_
+
+class KeysetPage:
+    """One page of keyset-paginated results"""
+
+    def __init__(self, items, next_cursor=None, prev_cursor=None, total=None, total_is_estimate=False):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+        self.total_is_estimate = total_is_estimate
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+def encode_cursor(sort_value, row_id, direction):
+    """Pack the page edge into a URL-safe token"""
+    if isinstance(sort_value, datetime):
+        sort_value = {'dt': sort_value.isoformat()}
+    elif isinstance(sort_value, date):
+        sort_value = {'d': sort_value.isoformat()}
+    elif isinstance(sort_value, Decimal):
+        sort_value = {'dec': str(sort_value)}
+    payload = json.dumps([sort_value, row_id, direction], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """
+    Unpack a cursor token
+    Returns: (sort_value, row_id, direction) or None for a missing/invalid cursor
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id, direction = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(sort_value, dict):
+            if 'dec' in sort_value:
+                sort_value = Decimal(sort_value['dec'])
+            elif 'd' in sort_value:
+                sort_value = date.fromisoformat(sort_value['d'])
+            else:
+                sort_value = datetime.fromisoformat(sort_value['dt'])
+        if direction not in ('next', 'prev') or not isinstance(row_id, int):
+            return None
+        return sort_value, row_id, direction
+    except (ValueError, TypeError, KeyError, ArithmeticError):
+        return None
+
+def estimate_total(query, cap=10000):
+    """
+    Count matching rows, but never more than cap + 1 of them
+    Returns: (count, is_estimate) where is_estimate means "cap or more"
+    """
+    count = query.order_by(None).limit(cap + 1).count()
+    if count > cap:
+        return cap, True
+    return count, False
+
+def keyset_paginate(query, sort_column, id_column, cursor=None, per_page=50, descending=True):
+    """
+    Paginate query on (sort_column, id_column), newest-first unless descending=False
+    Needs a composite index on (filter columns..., sort_column, id_column)
+    """
+    position = decode_cursor(cursor)
+    direction = position[2] if position else 'next'
+    # Next page of a descending list and previous page of an ascending one both walk down
+    towards_smaller = (direction == 'next') == descending
+
+    if position:
+        sort_value, row_id, _ = position
+        if towards_smaller:
+            query = query.filter(or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < row_id)
+            ))
+        else:
+            query = query.filter(or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > row_id)
+            ))
+
+    if towards_smaller:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    rows = query.limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if direction == 'prev':
+        rows.reverse()
+
+    if not rows:
+        return KeysetPage([])
+
+    sort_key, id_key = sort_column.key, id_column.key
+    first, last = rows[0], rows[-1]
+    first_cursor = encode_cursor(getattr(first, sort_key), getattr(first, id_key), 'prev')
+    last_cursor = encode_cursor(getattr(last, sort_key), getattr(last, id_key), 'next')
+
+    if direction == 'next':
+        return KeysetPage(rows,
+                          next_cursor=last_cursor if has_more else None,
+                          prev_cursor=first_cursor if position else None)
+    return KeysetPage(rows,
+                      next_cursor=last_cursor,
+                      prev_cursor=first_cursor if has_more else None)
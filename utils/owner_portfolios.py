@@ -0,0 +1,322 @@
+"""
+Owner portfolios for Government Property Management Portal
+Materialises each owner's current holdings in owner_portfolio: parcel count,
+effective area (total_area x share), share of unpaid tax and the active
+encumbrances on the parcels held. Ownership, tax assessment, encumbrance and
+parcel area changes become per-owner deltas, computed from the changed rows'
+before and after values. They are added to the owners' rows with increment
+upserts in the same transaction, so a change costs the same however many
+parcels its owners hold. The owner page and the top landholder report read
+one row per owner instead of walking ownerships and parcels. rebuild()
+recomputes every row from scratch.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import delete, event, func, inspect, literal, select
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session, joinedload
+from models import db
+from models.parcel import Parcel
+from models.ownership import Ownership
+from models.tax_assessment import TaxAssessment
+from models.encumbrance import Encumbrance
+from models.owner_portfolio import OwnerPortfolio
+from utils.keyset import keyset_paginate
+
+PORTFOLIO_COLUMNS = ['owner_id', 'parcel_count', 'effective_area', 'outstanding_tax', 'active_encumbrances', 'updated_at']
+MEASURE_COLUMNS = PORTFOLIO_COLUMNS[1:5]
+
+# Attributes whose pre-flush values the deltas are computed from
+HOLDING_FIELDS = ('owner_id', 'parcel_id', 'share_fraction', 'date_to')
+TAX_FIELDS = ('parcel_id', 'tax_due', 'amount_paid', 'status')
+ENCUMBRANCE_FIELDS = ('parcel_id', 'status')
+
+AREA_PLACES = Decimal('0.0001')
+TAX_PLACES = Decimal('0.01')
+
+def _decimal(value):
+    return Decimal(str(value)) if value is not None else Decimal('0')
+
+def _load_replaced_value(target, value, oldvalue, initiator):
+    """No-op 'set' listener; registering it with active_history loads the replaced value into the history"""
+
+def _values(instance, names, current):
+    """Attribute values after the flush (current=True) or before it"""
+    attrs = inspect(instance).attrs
+    values = []
+    for name in names:
+        history = attrs[name].history
+        if not current and history.deleted:
+            values.append(history.deleted[0])
+        else:
+            values.append(attrs[name].value)
+    return values
+
+def _holding(owner_id, parcel_id, share_fraction, date_to):
+    """(owner_id, parcel_id, share) of an active ownership; None once it has ended"""
+    if date_to is not None or owner_id is None or parcel_id is None:
+        return None
+    return owner_id, parcel_id, _decimal(share_fraction)
+
+def _unpaid(tax_due, amount_paid, status):
+    return Decimal('0') if status == 'Paid' else _decimal(tax_due) - _decimal(amount_paid)
+
+class OwnerPortfolios:
+    """Maintains owner_portfolio and serves landholder reports from it"""
+
+    SORTS = {
+        'area': OwnerPortfolio.effective_area,
+        'parcels': OwnerPortfolio.parcel_count,
+        'tax': OwnerPortfolio.outstanding_tax,
+        'encumbrances': OwnerPortfolio.active_encumbrances
+    }
+    REFRESH_BATCH = 500
+
+    def __init__(self):
+        self._listening = False
+
+    def setup_listeners(self):
+        """Register the flush listener that moves portfolios touched by a flush"""
+        if self._listening:
+            return
+        event.listen(Session, 'after_flush', self._after_flush)
+        for model, names in ((Ownership, HOLDING_FIELDS), (TaxAssessment, TAX_FIELDS),
+                             (Encumbrance, ENCUMBRANCE_FIELDS), (Parcel, ('total_area',))):
+            for name in names:
+                event.listen(getattr(model, name), 'set', _load_replaced_value, active_history=True)
+        self._listening = True
+
+    def _after_flush(self, session, flush_context):
+        # session.new/dirty/deleted and attribute history still describe the flushed changes here
+        changes, moved = [], {}
+
+        def parcel(parcel_id):
+            return moved.setdefault(parcel_id, [None, Decimal('0'), 0])
+
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+            if instance in session.dirty and not session.is_modified(instance):
+                continue
+            created, removed = instance in session.new, instance in session.deleted
+            if isinstance(instance, Ownership):
+                before = None if created else _holding(*_values(instance, HOLDING_FIELDS, False))
+                after = None if removed else _holding(*_values(instance, HOLDING_FIELDS, True))
+                if before != after:
+                    changes.append((instance.ownership_id, before, after))
+            elif isinstance(instance, TaxAssessment):
+                if not created:
+                    parcel_id, *tax = _values(instance, TAX_FIELDS, False)
+                    parcel(parcel_id)[1] -= _unpaid(*tax)
+                if not removed:
+                    parcel_id, *tax = _values(instance, TAX_FIELDS, True)
+                    parcel(parcel_id)[1] += _unpaid(*tax)
+            elif isinstance(instance, Encumbrance):
+                if not created:
+                    parcel_id, status = _values(instance, ENCUMBRANCE_FIELDS, False)
+                    parcel(parcel_id)[2] -= status == 'Active'
+                if not removed:
+                    parcel_id, status = _values(instance, ENCUMBRANCE_FIELDS, True)
+                    parcel(parcel_id)[2] += status == 'Active'
+            elif isinstance(instance, Parcel) and not created and not removed:
+                history = inspect(instance).attrs.total_area.history
+                if history.deleted and history.deleted[0] is not None:
+                    parcel(instance.parcel_id)[0] = _decimal(history.deleted[0])
+
+        moved = {parcel_id: change for parcel_id, change in moved.items()
+                 if parcel_id is not None and (change[0] is not None or change[1] or change[2])}
+        if changes or moved:
+            self.apply_changes(session.connection(), changes, moved)
+
+    @staticmethod
+    def _parcel_measures(parcel_ids):
+        """SELECT of (parcel_id, total_area, unpaid tax, active encumbrances) as currently stored"""
+        unpaid = (
+            select(func.coalesce(func.sum(TaxAssessment.tax_due - func.coalesce(TaxAssessment.amount_paid, 0)), 0))
+            .where(TaxAssessment.parcel_id == Parcel.parcel_id, TaxAssessment.status != 'Paid')
+            .scalar_subquery()
+        )
+        encumbrances = (
+            select(func.count(Encumbrance.encumbrance_id))
+            .where(Encumbrance.parcel_id == Parcel.parcel_id, Encumbrance.status == 'Active')
+            .scalar_subquery()
+        )
+        return select(Parcel.parcel_id, Parcel.total_area, unpaid, encumbrances).where(Parcel.parcel_id.in_(parcel_ids))
+
+    def apply_changes(self, connection, changes, moved=None):
+        """
+        Move portfolios by per-row deltas on connection (same transaction as the caller)
+        changes: (ownership_id, holding before, holding after) per changed ownership,
+        a holding being (owner_id, parcel_id, share) while active and None otherwise
+        moved: {parcel_id: [area before or None, unpaid tax delta, active encumbrance delta]}
+        for parcels whose area, tax or encumbrances changed
+        Also for bulk writes that bypass the ORM flush
+        """
+        moved = moved or {}
+        parcel_ids = set(moved)
+        for _, before, after in changes:
+            parcel_ids.update(holding[1] for holding in (before, after) if holding)
+        current = {
+            parcel_id: (_decimal(area), _decimal(unpaid), encumbrances)
+            for parcel_id, area, unpaid, encumbrances in connection.execute(self._parcel_measures(parcel_ids))
+        }
+        previous = {}
+        for parcel_id, (area, unpaid, encumbrances) in current.items():
+            area_before, unpaid_delta, encumbrance_delta = moved.get(parcel_id, (None, 0, 0))
+            previous[parcel_id] = (area if area_before is None else area_before,
+                                   unpaid - unpaid_delta, encumbrances - encumbrance_delta)
+
+        deltas, recount = {}, set()
+
+        def add(holding, measures, sign):
+            owner_id, parcel_id, share = holding
+            if parcel_id not in measures:
+                # Parcel deleted in the same transaction: its old measures are gone
+                recount.add(owner_id)
+                return
+            area, unpaid, encumbrances = measures[parcel_id]
+            delta = deltas.setdefault(owner_id, [0, Decimal('0'), Decimal('0'), 0])
+            delta[0] += sign
+            delta[1] += sign * area * share
+            delta[2] += sign * unpaid * share
+            delta[3] += sign * encumbrances
+
+        for _, before, after in changes:
+            if before:
+                add(before, previous, -1)
+            if after:
+                add(after, current, 1)
+
+        # Holders whose ownership did not change still see their parcel's area, tax or encumbrances move
+        changed = sorted(parcel_id for parcel_id in moved if parcel_id in current and current[parcel_id] != previous[parcel_id])
+        if changed:
+            touched = [ownership_id for ownership_id, _, _ in changes if ownership_id is not None]
+            holders = select(Ownership.owner_id, Ownership.parcel_id, Ownership.share_fraction).where(
+                Ownership.parcel_id.in_(changed), Ownership.date_to.is_(None))
+            if touched:
+                holders = holders.where(Ownership.ownership_id.notin_(touched))
+            for owner_id, parcel_id, share in connection.execute(holders):
+                add((owner_id, parcel_id, _decimal(share)), previous, -1)
+                add((owner_id, parcel_id, _decimal(share)), current, 1)
+
+        for owner_id in recount:
+            deltas.pop(owner_id, None)
+        self._increment(connection, deltas)
+        if recount:
+            self.refresh_owners(connection, recount)
+
+    @staticmethod
+    def _increment(connection, deltas):
+        """Add {owner_id: [parcels, area, tax, encumbrances]} to the owners' rows (creating missing rows)"""
+        now = datetime.utcnow()
+        rows = []
+        for owner_id in sorted(deltas):
+            parcels, area, tax, encumbrances = deltas[owner_id]
+            area, tax = area.quantize(AREA_PLACES), tax.quantize(TAX_PLACES)
+            if parcels or area or tax or encumbrances:
+                rows.append({'owner_id': owner_id, 'parcel_count': parcels, 'effective_area': area,
+                             'outstanding_tax': tax, 'active_encumbrances': encumbrances, 'updated_at': now})
+        if not rows:
+            return
+
+        table = OwnerPortfolio.__table__
+        if connection.dialect.name == 'mysql':
+            statement = mysql.insert(table)
+            statement = statement.on_duplicate_key_update(
+                updated_at=statement.inserted.updated_at,
+                **{name: table.c[name] + statement.inserted[name] for name in MEASURE_COLUMNS})
+        else:
+            # SQLite 3.24+ upsert
+            statement = sqlite.insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=['owner_id'],
+                set_=dict({name: table.c[name] + statement.excluded[name] for name in MEASURE_COLUMNS},
+                          updated_at=statement.excluded.updated_at))
+        # Rows are written in owner id order so concurrent writers take the row locks in the same order
+        connection.execute(statement, rows)
+        # Owners left without active holdings lose their row
+        connection.execute(delete(table).where(table.c.owner_id.in_([row['owner_id'] for row in rows]),
+                                               table.c.parcel_count <= 0))
+
+    @staticmethod
+    def _totals(owner_ids=None):
+        """SELECT producing owner_portfolio rows, for all owners or only owner_ids"""
+        active = [Ownership.date_to.is_(None)]
+        if owner_ids is not None:
+            active.append(Ownership.owner_id.in_(owner_ids))
+
+        holdings = (
+            select(Ownership.owner_id,
+                   func.count(Ownership.ownership_id).label('parcel_count'),
+                   func.sum(Parcel.total_area * Ownership.share_fraction).label('effective_area'))
+            .join(Parcel, Parcel.parcel_id == Ownership.parcel_id)
+            .where(*active)
+            .group_by(Ownership.owner_id)
+            .subquery('holdings')
+        )
+        tax = (
+            select(Ownership.owner_id,
+                   func.sum((TaxAssessment.tax_due - func.coalesce(TaxAssessment.amount_paid, 0))
+                            * Ownership.share_fraction).label('outstanding_tax'))
+            .join(TaxAssessment, TaxAssessment.parcel_id == Ownership.parcel_id)
+            .where(*active, TaxAssessment.status != 'Paid')
+            .group_by(Ownership.owner_id)
+            .subquery('tax')
+        )
+        encumbrances = (
+            select(Ownership.owner_id,
+                   func.count(Encumbrance.encumbrance_id).label('active_encumbrances'))
+            .join(Encumbrance, Encumbrance.parcel_id == Ownership.parcel_id)
+            .where(*active, Encumbrance.status == 'Active')
+            .group_by(Ownership.owner_id)
+            .subquery('encumbrances')
+        )
+        return (
+            select(holdings.c.owner_id,
+                   holdings.c.parcel_count,
+                   func.round(func.coalesce(holdings.c.effective_area, 0), 4),
+                   func.round(func.coalesce(tax.c.outstanding_tax, 0), 2),
+                   func.coalesce(encumbrances.c.active_encumbrances, 0),
+                   literal(datetime.utcnow(), db.DateTime))
+            .outerjoin(tax, tax.c.owner_id == holdings.c.owner_id)
+            .outerjoin(encumbrances, encumbrances.c.owner_id == holdings.c.owner_id)
+        )
+
+    def refresh_owners(self, connection, owner_ids):
+        """
+        Re-aggregate the given owners from scratch on connection (same transaction as the caller)
+        Owners left without active holdings lose their row
+        """
+        table = OwnerPortfolio.__table__
+        owner_ids = sorted(owner_ids)
+        for start in range(0, len(owner_ids), self.REFRESH_BATCH):
+            batch = owner_ids[start:start + self.REFRESH_BATCH]
+            connection.execute(delete(table).where(table.c.owner_id.in_(batch)))
+            connection.execute(table.insert().from_select(PORTFOLIO_COLUMNS, self._totals(batch)))
+
+    def rebuild(self):
+        """Recompute every portfolio from scratch; returns the number of owners with holdings"""
+        table = OwnerPortfolio.__table__
+        db.session.execute(delete(table))
+        db.session.execute(table.insert().from_select(PORTFOLIO_COLUMNS, self._totals()))
+        db.session.commit()
+        return db.session.query(func.count(OwnerPortfolio.owner_id)).scalar()
+
+    def ensure_seeded(self):
+        """Build portfolios once for databases that already hold ownerships"""
+        if db.session.query(OwnerPortfolio.owner_id).first() is not None:
+            return
+        if db.session.query(Ownership.ownership_id).first() is not None:
+            self.rebuild()
+
+    def get(self, owner_id):
+        """Portfolio row of one owner, or None when they hold nothing"""
+        return OwnerPortfolio.query.get(owner_id)
+
+    def top(self, sort='area', cursor=None, per_page=50):
+        """Keyset page of portfolios, largest first on the chosen measure"""
+        sort_column = self.SORTS.get(sort, OwnerPortfolio.effective_area)
+        query = OwnerPortfolio.query.options(joinedload(OwnerPortfolio.owner))
+        return keyset_paginate(query, sort_column, OwnerPortfolio.owner_id, cursor=cursor, per_page=per_page)
+
+# Global owner portfolios instance
+owner_portfolios = OwnerPortfolios()
@@ -0,0 +1,191 @@
+"""
+Parcel revision counters for Government Property Management Portal
+Every flush that touches a parcel, its versions, ownerships, mutations, tax
+assessments or encumbrances (or renames an owner shown on it) bumps the
+parcel's row in parcel_revision in the same transaction. The counter is the
+validator for the parcel page and its APIs: it becomes a weak ETag (and
+changed_at the Last-Modified date), so a browser revalidating an unchanged
+parcel gets a 304 after one primary-key read, and it keys an in-process
+cache of the rendered page body.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from flask import current_app, request, session
+from sqlalchemy import event, inspect, literal, select
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+from models import db
+from models.parcel import Parcel
+from models.parcel_version import ParcelVersion
+from models.ownership import Ownership
+from models.mutation import Mutation
+from models.tax_assessment import TaxAssessment
+from models.encumbrance import Encumbrance
+from models.owner import Owner
+from models.parcel_revision import ParcelRevision
+
+TRACKED = (Parcel, ParcelVersion, Ownership, Mutation, TaxAssessment, Encumbrance)
+
+def _parcel_ids(instance, current):
+    """parcel_id of a tracked row after the flush, plus the previous one if it moved"""
+    attr = inspect(instance).attrs.parcel_id
+    ids = {attr.value}
+    if not current:
+        ids.update(attr.history.deleted)
+    return ids
+
+class ParcelRevisions:
+    """Maintains the per-parcel change counter and the page fragment cache"""
+
+    def __init__(self):
+        self._listening = False
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    def setup_listeners(self):
+        """Register the flush listener that bumps counters with ORM changes"""
+        if self._listening:
+            return
+        event.listen(Session, 'after_flush', self._after_flush)
+        self._listening = True
+
+    def _after_flush(self, session, flush_context):
+        parcel_ids, owner_ids, removed = set(), set(), set()
+        for instance in session.new:
+            if isinstance(instance, TRACKED):
+                parcel_ids |= _parcel_ids(instance, current=True)
+        for instance in session.dirty:
+            if not session.is_modified(instance):
+                continue
+            if isinstance(instance, TRACKED):
+                parcel_ids |= _parcel_ids(instance, current=False)
+            elif isinstance(instance, Owner):
+                owner_ids.add(instance.owner_id)
+        for instance in session.deleted:
+            if isinstance(instance, Parcel):
+                # The revision row goes with the parcel (ON DELETE CASCADE)
+                removed.add(instance.parcel_id)
+            elif isinstance(instance, TRACKED):
+                parcel_ids |= _parcel_ids(instance, current=False)
+
+        if owner_ids:
+            parcel_ids |= self._parcels_of_owners(session.connection(), owner_ids)
+        parcel_ids -= removed
+        parcel_ids.discard(None)
+        if parcel_ids:
+            self.bump(session.connection(), parcel_ids)
+
+    @staticmethod
+    def _parcels_of_owners(connection, owner_ids):
+        """Parcels whose page names one of the owners (chain of title or encumbrance party)"""
+        statement = select(Ownership.parcel_id).where(Ownership.owner_id.in_(owner_ids)).union(
+            select(Encumbrance.parcel_id).where(Encumbrance.related_party_id.in_(owner_ids))
+        )
+        return set(connection.execute(statement).scalars())
+
+    @staticmethod
+    def bump(connection, parcel_ids):
+        """
+        Advance the counter of each parcel on connection (creating missing rows)
+        Also for bulk writes that bypass the ORM flush. Rows are written in id
+        order so concurrent writers take the row locks in the same order.
+        """
+        table = ParcelRevision.__table__
+        now = datetime.utcnow()
+        rows = [{'parcel_id': parcel_id, 'version': 1, 'changed_at': now} for parcel_id in sorted(parcel_ids)]
+        if connection.dialect.name == 'mysql':
+            statement = mysql.insert(table).on_duplicate_key_update(version=table.c.version + 1, changed_at=now)
+        else:
+            # SQLite 3.24+ upsert
+            statement = sqlite.insert(table).on_conflict_do_update(
+                index_elements=['parcel_id'],
+                set_={'version': table.c.version + 1, 'changed_at': now}
+            )
+        connection.execute(statement, rows)
+
+    @staticmethod
+    def get(parcel_id):
+        """(version, changed_at) of a parcel; (0, None) if it has no row yet"""
+        row = db.session.query(ParcelRevision.version, ParcelRevision.changed_at).filter(
+            ParcelRevision.parcel_id == parcel_id
+        ).first()
+        if row is None:
+            return 0, None
+        return row.version, row.changed_at
+
+    def seed_missing(self):
+        """Give every parcel without a counter row version 1; existing counters are never reset"""
+        table = ParcelRevision.__table__
+        missing = select(Parcel.parcel_id, literal(1), literal(datetime.utcnow(), db.DateTime)).where(
+            ~select(table.c.parcel_id).where(table.c.parcel_id == Parcel.parcel_id).exists()
+        )
+        result = db.session.execute(table.insert().from_select(['parcel_id', 'version', 'changed_at'], missing))
+        db.session.commit()
+        return max(result.rowcount, 0)
+
+    def ensure_seeded(self):
+        """Create the counters once for databases that already hold parcels"""
+        if db.session.query(ParcelRevision.parcel_id).first() is not None:
+            return
+        if db.session.query(Parcel.parcel_id).first() is not None:
+            self.seed_missing()
+
+    @staticmethod
+    def etag(parcel_id, version, variant):
+        """Weak ETag for one representation (variant) of a parcel at a version"""
+        tag = f'parcel-{parcel_id}-{version}-{variant}'
+        release = current_app.config.get('RELEASE_ID')
+        return f'{tag}-{release}' if release else tag
+
+    @staticmethod
+    def can_validate():
+        """
+        False while flashed messages are pending: the page about to be rendered
+        shows them once, so it must not be answered from (or stored in) a browser cache
+        """
+        return '_flashes' not in session
+
+    @staticmethod
+    def not_modified(etag, changed_at):
+        """True when the request's cached copy is still current (If-None-Match wins over If-Modified-Since)"""
+        if request.if_none_match:
+            return request.if_none_match.contains_weak(etag)
+        if request.if_modified_since and changed_at:
+            return changed_at.replace(microsecond=0, tzinfo=timezone.utc) <= request.if_modified_since
+        return False
+
+    @staticmethod
+    def add_validators(response, etag, changed_at):
+        """Attach the ETag / Last-Modified and make the browser revalidate on every use"""
+        response.set_etag(etag, weak=True)
+        if changed_at:
+            response.last_modified = changed_at.replace(tzinfo=timezone.utc)
+        # Pages are per login: keep them out of shared caches
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        response.vary.add('Cookie')
+        return response
+
+    def get_fragment(self, key):
+        """Cached rendering for key (which must include the parcel version), or None"""
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+            return fragment
+
+    def put_fragment(self, key, fragment):
+        """Keep a rendering; older versions of a parcel just age out of the LRU"""
+        size = current_app.config.get('PARCEL_FRAGMENT_CACHE_SIZE', 0)
+        if size <= 0:
+            return
+        with self._lock:
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > size:
+                self._fragments.popitem(last=False)
+
+# Global parcel revisions instance
+parcel_revisions = ParcelRevisions()
@@ -0,0 +1,92 @@
+"""
+Read-replica routing for Government Property Management Portal
+Sends read-only (GET/HEAD) request traffic to replica binds and keeps a
+client on the primary for a short window after it writes (read-your-writes)
+"""
+
+import random
+import sqlite3
+import time
+from flask import g, has_request_context, request, session as flask_session
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND_PREFIX = 'replica_'
+SAFE_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+PIN_SESSION_KEY = '_replica_pin_until'
+
+def replica_bind_keys(binds):
+    """Bind keys that name read replicas"""
+    return [key for key in binds if key and key.startswith(REPLICA_BIND_PREFIX)]
+
+def _replica_allowed():
+    """True when the current request may read from a replica"""
+    if not has_request_context():
+        return False
+    if request.method not in SAFE_METHODS or g.get('_db_wrote'):
+        return False
+    pin_until = flask_session.get(PIN_SESSION_KEY)
+    return not pin_until or pin_until < time.time()
+
+class RoutingSession(Session):
+    """Session that routes reads to a replica and everything else to the primary"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if self._flushing and has_request_context():
+            # Any later read in this request must see the write
+            g._db_wrote = True
+
+        if bind is None and not self._flushing and _replica_allowed():
+            bind_key = mapper.persist_selectable.metadata.info.get('bind_key') if mapper is not None else None
+            if bind_key is None:
+                if '_replica_engine' not in g:
+                    # One replica per request so a page never mixes snapshots
+                    engines = self._db.engines
+                    keys = replica_bind_keys(engines)
+                    g._replica_engine = engines[random.choice(keys)] if keys else None
+                if g._replica_engine is not None:
+                    return g._replica_engine
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+def init_replica_routing(app):
+    """Pin writers to the primary for REPLICA_STICKY_SECONDS after each write"""
+    if not replica_bind_keys(app.config.get('SQLALCHEMY_BINDS') or {}):
+        return False
+
+    sticky_seconds = app.config.get('REPLICA_STICKY_SECONDS', 10)
+
+    @app.after_request
+    def pin_writer_to_primary(response):
+        if g.get('_db_wrote'):
+            flask_session[PIN_SESSION_KEY] = time.time() + sticky_seconds
+        return response
+
+    return True
+
+def sync_sqlite_replicas(db):
+    """
+    Copy the primary SQLite database into every SQLite replica bind
+    Uses the online backup API, so the primary stays writable meanwhile
+    Returns: list of replica bind keys that were refreshed
+    """
+    primary = db.engines[None]
+    if primary.dialect.name != 'sqlite':
+        raise ValueError('Replica sync is only available for SQLite primaries')
+
+    synced = []
+    source = sqlite3.connect(primary.url.database)
+    try:
+        for key in replica_bind_keys(db.engines):
+            replica = db.engines[key]
+            if replica.dialect.name != 'sqlite':
+                continue
+            replica.dispose()
+            target = sqlite3.connect(replica.url.database)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+            synced.append(key)
+    finally:
+        source.close()
+    return synced
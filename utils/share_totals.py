@@ -0,0 +1,188 @@
+"""
+Parcel share totals for Government Property Management Portal
+Keeps the active share sum and owner count of every parcel in
+parcel_share_total, updated in the same transaction as the ownership rows.
+The update is a single conditional UPDATE on the parcel's row: it takes the
+row lock (InnoDB) or the write lock (SQLite), so two approvals racing for the
+same parcel are serialised and the second one sees the first one's total.
+A change that would push a parcel past 100% fails the flush instead.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import event, func, inspect, literal, select
+from sqlalchemy.orm import Session
+from models import db
+from models.ownership import Ownership
+from models.parcel_share_total import ParcelShareTotal
+
+# share_fraction has four decimal places; thirds stored as 0.3333/0.3333/0.3334 still total 1
+FULL_SHARE = Decimal('1.0000')
+TOLERANCE = Decimal('0.0001')
+
+class ShareAllocationError(ValueError):
+    """Raised when a parcel's active shares would total more than 1"""
+
+    def __init__(self, parcel_id, total):
+        self.parcel_id = parcel_id
+        self.total = total
+        super().__init__(f'Active ownership shares of parcel {parcel_id} would total {total * 100:.2f}% (maximum 100%).')
+
+def _decimal(value):
+    return Decimal(str(value)) if value is not None else Decimal('0')
+
+class ShareTotals:
+    """Maintains and serves the per-parcel active share aggregate"""
+
+    def __init__(self):
+        self._listening = False
+
+    def setup_listeners(self):
+        """Register the flush listener that moves totals with ORM ownership changes"""
+        if self._listening:
+            return
+        event.listen(Session, 'after_flush', self._after_flush)
+        self._listening = True
+
+    @staticmethod
+    def _state(instance, current):
+        """(parcel_id, active share) of an ownership before (current=False) or after the flush"""
+        attrs = inspect(instance).attrs
+        values = []
+        for name in ('parcel_id', 'share_fraction', 'date_to'):
+            history = attrs[name].history
+            if current:
+                values.append(attrs[name].value)
+            elif history.deleted:
+                values.append(history.deleted[0])
+            elif history.unchanged:
+                values.append(history.unchanged[0])
+            else:
+                values.append(attrs[name].value)
+        parcel_id, share_fraction, date_to = values
+        return parcel_id, (_decimal(share_fraction) if date_to is None else None)
+
+    def _after_flush(self, session, flush_context):
+        # Attribute history still holds the pre-flush values here
+        deltas = {}
+
+        def move(parcel_id, share, sign):
+            if parcel_id is None or share is None:
+                return
+            total = deltas.setdefault(parcel_id, [Decimal('0'), 0])
+            total[0] += sign * share
+            total[1] += sign
+
+        for instance in session.new:
+            if isinstance(instance, Ownership):
+                move(*self._state(instance, current=True), 1)
+        for instance in session.dirty:
+            if isinstance(instance, Ownership) and session.is_modified(instance):
+                move(*self._state(instance, current=False), -1)
+                move(*self._state(instance, current=True), 1)
+        for instance in session.deleted:
+            if isinstance(instance, Ownership):
+                move(*self._state(instance, current=False), -1)
+
+        deltas = {parcel_id: delta for parcel_id, delta in deltas.items() if delta[0] or delta[1]}
+        if deltas:
+            self.apply_deltas(session.connection(), deltas)
+
+    def apply_deltas(self, connection, deltas):
+        """
+        Move totals by {parcel_id: (share_delta, owner_delta)} on connection
+        Also for bulk writes that bypass the ORM flush. Parcels are visited in
+        id order so concurrent writers always take row locks in the same order.
+        """
+        table = ParcelShareTotal.__table__
+        now = datetime.utcnow()
+        for parcel_id in sorted(deltas):
+            share_delta, owner_delta = deltas[parcel_id]
+            statement = (
+                table.update()
+                .where(table.c.parcel_id == parcel_id)
+                .values(active_share_sum=table.c.active_share_sum + share_delta,
+                        active_owner_count=table.c.active_owner_count + owner_delta,
+                        updated_at=now)
+            )
+            if share_delta > 0:
+                statement = statement.where(table.c.active_share_sum + share_delta <= FULL_SHARE + TOLERANCE)
+            if connection.execute(statement).rowcount:
+                continue
+
+            current = connection.execute(
+                select(table.c.active_share_sum).where(table.c.parcel_id == parcel_id)
+            ).scalar()
+            if current is not None:
+                raise ShareAllocationError(parcel_id, _decimal(current) + share_delta)
+            # First change for this parcel: the flushed ownership rows already hold the new state
+            self._insert_from_ownerships(connection, parcel_id, now)
+
+    def _insert_from_ownerships(self, connection, parcel_id, now):
+        share_sum, owner_count = connection.execute(
+            select(func.coalesce(func.sum(Ownership.share_fraction), 0), func.count(Ownership.ownership_id))
+            .where(Ownership.parcel_id == parcel_id, Ownership.date_to.is_(None))
+        ).one()
+        share_sum = _decimal(share_sum)
+        if share_sum > FULL_SHARE + TOLERANCE:
+            raise ShareAllocationError(parcel_id, share_sum)
+        connection.execute(ParcelShareTotal.__table__.insert().values(
+            parcel_id=parcel_id, active_share_sum=share_sum, active_owner_count=owner_count, updated_at=now
+        ))
+
+    def get(self, parcel_id, lock=False):
+        """
+        (active share sum, active owner count) of a parcel from its single row
+        lock=True reads with SELECT ... FOR UPDATE so a caller can check the
+        remaining share and write without another transaction slipping in
+        """
+        query = db.session.query(ParcelShareTotal.active_share_sum, ParcelShareTotal.active_owner_count)
+        query = query.filter(ParcelShareTotal.parcel_id == parcel_id)
+        if lock:
+            query = query.with_for_update()
+        row = query.first()
+        if row is None:
+            return Decimal('0'), 0
+        return _decimal(row.active_share_sum), row.active_owner_count
+
+    def available(self, parcel_id, lock=False):
+        """Share that can still be allocated to new owners of a parcel"""
+        share_sum, _ = self.get(parcel_id, lock=lock)
+        return max(FULL_SHARE - share_sum, Decimal('0'))
+
+    def rebuild(self):
+        """
+        Recompute every total from the ownership table
+        Returns (parcels with active owners, list of (parcel_id, share sum) over 100%)
+        """
+        table = ParcelShareTotal.__table__
+        now = datetime.utcnow()
+        totals = (
+            select(Ownership.parcel_id,
+                   func.sum(Ownership.share_fraction),
+                   func.count(Ownership.ownership_id),
+                   literal(now, db.DateTime))
+            .where(Ownership.date_to.is_(None))
+            .group_by(Ownership.parcel_id)
+        )
+        db.session.execute(table.delete())
+        db.session.execute(table.insert().from_select(
+            ['parcel_id', 'active_share_sum', 'active_owner_count', 'updated_at'], totals
+        ))
+        db.session.commit()
+
+        parcels = db.session.query(func.count(ParcelShareTotal.parcel_id)).scalar()
+        over_allocated = db.session.query(ParcelShareTotal.parcel_id, ParcelShareTotal.active_share_sum).filter(
+            ParcelShareTotal.active_share_sum > FULL_SHARE + TOLERANCE
+        ).order_by(ParcelShareTotal.parcel_id).all()
+        return parcels, [(parcel_id, _decimal(share_sum)) for parcel_id, share_sum in over_allocated]
+
+    def ensure_seeded(self):
+        """Build the totals once for databases that already hold ownerships"""
+        if db.session.query(ParcelShareTotal.parcel_id).first() is not None:
+            return
+        if db.session.query(Ownership.ownership_id).first() is not None:
+            self.rebuild()
+
+# Global share totals instance
+share_totals = ShareTotals()
@@ -0,0 +1,161 @@
+"""
+Per-request SQL profiling for Government Property Management Portal
+Counts and times every statement a request issues, flags repeated statement
+shapes (N+1 suspects) and keeps recent requests in an in-memory ring buffer
+"""
+
+import math
+import re
+import threading
+import time
+from collections import deque
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+def fingerprint(statement):
+    """Normalise a SQL statement so repeated shapes compare equal"""
+    normalized = re.sub(r'\s+', ' ', statement).strip()
+    normalized = re.sub(r"'(?:[^']|'')*'", '?', normalized)
+    normalized = re.sub(r'\b\d+(\.\d+)?\b', '?', normalized)
+    normalized = re.sub(r'(%\(\w+\)s|%s|:\w+)', '?', normalized)
+    normalized = re.sub(r'IN \((?:\?|, )+\)', 'IN (...)', normalized, flags=re.IGNORECASE)
+    return normalized
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+class SQLProfiler:
+    """Opt-in request profiler fed by SQLAlchemy cursor events"""
+
+    def __init__(self):
+        self.enabled = False
+        self.n_plus_one_threshold = 5
+        self.slow_statement_count = 5
+        self._records = deque(maxlen=500)
+        self._lock = threading.Lock()
+        self._listening = False
+
+    def init_app(self, app):
+        self.enabled = app.config.get('SQL_PROFILER_ENABLED', False)
+        if not self.enabled:
+            return False
+
+        self.n_plus_one_threshold = app.config.get('SQL_PROFILER_N_PLUS_ONE_THRESHOLD', 5)
+        self.slow_statement_count = app.config.get('SQL_PROFILER_SLOW_STATEMENTS', 5)
+        self._records = deque(maxlen=app.config.get('SQL_PROFILER_BUFFER_SIZE', 500))
+
+        if not self._listening:
+            event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+            self._listening = True
+
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        return True
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('_profiler_start', []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['_profiler_start'].pop()
+        if not has_request_context():
+            return
+        profile = g.get('_sql_profile')
+        if profile is not None:
+            profile['statements'].append((time.perf_counter() - started, statement))
+
+    @staticmethod
+    def _start_request():
+        if request.endpoint == 'static':
+            return
+        g._sql_profile = {'started': time.perf_counter(), 'statements': []}
+
+    def _finish_request(self, response):
+        profile = g.pop('_sql_profile', None)
+        if profile is None:
+            return response
+
+        statements = profile['statements']
+        shapes = {}
+        for _, statement in statements:
+            shape = fingerprint(statement)
+            shapes[shape] = shapes.get(shape, 0) + 1
+
+        # Views declare their statement ceiling with @query_budget
+        view = current_app.view_functions.get(request.endpoint)
+        budget = getattr(view, 'query_budget', None)
+        over_budget = budget is not None and len(statements) > budget
+        if over_budget:
+            print(f"Query budget exceeded on {request.endpoint}: {len(statements)} statements (budget {budget})")
+
+        slowest = sorted(statements, key=lambda item: item[0], reverse=True)[:self.slow_statement_count]
+        record = {
+            'timestamp': time.time(),
+            'endpoint': request.endpoint or request.path,
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'status': response.status_code,
+            'duration_ms': (time.perf_counter() - profile['started']) * 1000,
+            'query_count': len(statements),
+            'query_budget': budget,
+            'over_budget': over_budget,
+            'sql_ms': sum(duration for duration, _ in statements) * 1000,
+            'slowest': [{'ms': duration * 1000, 'statement': statement[:500]} for duration, statement in slowest],
+            'n_plus_one': sorted(
+                [{'fingerprint': shape[:500], 'count': count}
+                 for shape, count in shapes.items() if count >= self.n_plus_one_threshold],
+                key=lambda item: item['count'], reverse=True
+            )
+        }
+
+        with self._lock:
+            self._records.append(record)
+        return response
+
+    def recent(self, limit=50):
+        """Most recent request records, newest first"""
+        with self._lock:
+            records = list(self._records)
+        return list(reversed(records))[:limit]
+
+    def endpoint_summary(self):
+        """Latency percentiles and query statistics per endpoint over the ring buffer"""
+        with self._lock:
+            records = list(self._records)
+
+        grouped = {}
+        for record in records:
+            grouped.setdefault(record['endpoint'], []).append(record)
+
+        summary = []
+        for endpoint, items in grouped.items():
+            durations = [item['duration_ms'] for item in items]
+            summary.append({
+                'endpoint': endpoint,
+                'requests': len(items),
+                'p50_ms': percentile(durations, 0.50),
+                'p95_ms': percentile(durations, 0.95),
+                'p99_ms': percentile(durations, 0.99),
+                'avg_queries': sum(item['query_count'] for item in items) / len(items),
+                'max_queries': max(item['query_count'] for item in items),
+                'query_budget': items[-1]['query_budget'],
+                'over_budget_requests': sum(1 for item in items if item['over_budget']),
+                'avg_sql_ms': sum(item['sql_ms'] for item in items) / len(items),
+                'n_plus_one_requests': sum(1 for item in items if item['n_plus_one'])
+            })
+        return sorted(summary, key=lambda item: item['p95_ms'], reverse=True)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+# Global SQL profiler instance
+sql_profiler = SQLProfiler()
@@ -0,0 +1,41 @@
+"""
+SQLite tuning for Government Property Management Portal
+Applies the configured PRAGMA profile (WAL, cache, mmap, busy timeout,
+foreign keys) to every connection the engine opens
+"""
+
+from sqlalchemy import event
+
+def apply_pragmas(dbapi_connection, pragmas):
+    """Run PRAGMA statements on a raw DB-API sqlite3 connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+def configure_sqlite_engine(engine, pragmas):
+    """
+    Register a connect listener applying pragmas to each new pooled connection
+    Does nothing for non-SQLite engines or an empty profile
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return False
+    
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, pragmas)
+    
+    return True
+
+def init_sqlite_profile(app, db):
+    """Apply the profile named by SQLITE_PROFILE to the app's engines (primary and binds)"""
+    profile = app.config.get('SQLITE_PROFILE', 'default')
+    pragmas = app.config.get('SQLITE_PROFILES', {}).get(profile)
+    if pragmas is None:
+        raise ValueError(f"Unknown SQLITE_PROFILE '{profile}'")
+    
+    with app.app_context():
+        configured = [configure_sqlite_engine(engine, pragmas) for engine in db.engines.values()]
+    return any(configured)
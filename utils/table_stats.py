@@ -0,0 +1,142 @@
+"""
+Table statistics for Government Property Management Portal
+Keeps per-table row counters up to date from ORM flush events so that
+system pages never have to run COUNT(*) over large tables.
+audit_log is the exception: on MySQL its rows come from database/triggers.sql,
+never from an ORM flush, so its counter is moved by triggers on audit_log itself
+"""
+
+from datetime import datetime
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from models import db
+from models.table_statistic import TableStatistic
+from utils.db_triggers import ensure_trigger
+
+class TableStatistics:
+    """Maintains and serves row counters for the main tables"""
+
+    TRACKED_TABLES = ['owner', 'parcel', 'ownership', 'mutation', 'tax_assessment', 'audit_log', 'user_account']
+    # Counted by AFTER INSERT/DELETE triggers whatever writes the rows (see ensure_triggers)
+    TRIGGER_COUNTED_TABLES = ['audit_log']
+
+    def __init__(self):
+        self._listening = False
+
+    def setup_listeners(self):
+        """Register the flush listener that keeps counters in step with ORM inserts/deletes"""
+        if self._listening:
+            return
+        event.listen(Session, 'after_flush', self._after_flush)
+        self._listening = True
+
+    def _after_flush(self, session, flush_context):
+        # session.new / session.deleted still hold the pre-flush state here
+        deltas = {}
+        for instance in session.new:
+            table_name = getattr(instance, '__tablename__', None)
+            if table_name in self.TRACKED_TABLES and table_name not in self.TRIGGER_COUNTED_TABLES:
+                deltas[table_name] = deltas.get(table_name, 0) + 1
+        for instance in session.deleted:
+            table_name = getattr(instance, '__tablename__', None)
+            if table_name in self.TRACKED_TABLES and table_name not in self.TRIGGER_COUNTED_TABLES:
+                deltas[table_name] = deltas.get(table_name, 0) - 1
+
+        if deltas:
+            # Same connection, same transaction: the counter commits or rolls back with the rows
+            self.apply_deltas(session.connection(), deltas)
+
+    @staticmethod
+    def apply_deltas(connection, deltas):
+        """Adjust counters by {table_name: delta}; for bulk writes that bypass the ORM flush"""
+        stats_table = TableStatistic.__table__
+        now = datetime.utcnow()
+        for table_name, delta in deltas.items():
+            connection.execute(
+                stats_table.update()
+                .where(stats_table.c.table_name == table_name)
+                .values(row_count=stats_table.c.row_count + delta, updated_at=now)
+            )
+
+    def ensure_triggers(self):
+        """
+        Create the counting triggers on TRIGGER_COUNTED_TABLES if they do not exist yet
+        (they also ship in database/triggers.sql for MySQL)
+        """
+        for table_name in self.TRIGGER_COUNTED_TABLES:
+            for action, delta in (('INSERT', '+ 1'), ('DELETE', '- 1')):
+                update = (f"UPDATE table_statistic SET row_count = row_count {delta}, updated_at = {{now}} "
+                          f"WHERE table_name = '{table_name}'")
+                ensure_trigger(f'{table_name}_count_{action.lower()}', action, table_name, {
+                    'sqlite': [update.format(now='CURRENT_TIMESTAMP')],
+                    'mysql': [update.format(now='UTC_TIMESTAMP()')]
+                })
+
+    @staticmethod
+    def _estimated_counts():
+        """Row estimates from engine metadata; cheap but approximate"""
+        dialect = db.engine.dialect.name
+        try:
+            if dialect == 'mysql':
+                rows = db.session.execute(text(
+                    "SELECT table_name, table_rows FROM information_schema.tables "
+                    "WHERE table_schema = DATABASE()"
+                )).all()
+                return {row[0]: int(row[1] or 0) for row in rows}
+            if dialect == 'sqlite':
+                # sqlite_stat1 only exists after ANALYZE; first number of stat is the row count
+                rows = db.session.execute(text(
+                    "SELECT tbl, MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 GROUP BY tbl"
+                )).all()
+                return {row[0]: int(row[1] or 0) for row in rows}
+        except Exception:
+            db.session.rollback()
+        return {}
+
+    def refresh(self, estimated=False, tables=None):
+        """
+        Recompute counters from scratch
+        estimated=True reads engine metadata instead of scanning each table
+        """
+        tables = tables or self.TRACKED_TABLES
+        estimates = self._estimated_counts() if estimated else {}
+        now = datetime.utcnow()
+
+        for table_name in tables:
+            if table_name in estimates:
+                row_count, source = estimates[table_name], 'Estimated'
+            else:
+                row_count = db.session.execute(text(f"SELECT COUNT(*) FROM {table_name}")).scalar()
+                source = 'Exact'
+            db.session.merge(TableStatistic(
+                table_name=table_name,
+                row_count=row_count,
+                source=source,
+                refreshed_at=now,
+                updated_at=now
+            ))
+        db.session.commit()
+
+    def ensure_seeded(self):
+        """Create counters for tables that have none yet, preferring metadata estimates"""
+        existing = {row[0] for row in db.session.query(TableStatistic.table_name).all()}
+        missing = [table for table in self.TRACKED_TABLES if table not in existing]
+        if missing:
+            self.refresh(estimated=True, tables=missing)
+
+    def get_count(self, table_name):
+        """Counter row for one table, or None before it has been seeded"""
+        return TableStatistic.query.get(table_name)
+
+    def get_counts(self):
+        """
+        Current counters keyed by table name, in TRACKED_TABLES order
+        A single primary-key range read regardless of table sizes
+        """
+        stats = {stat.table_name: stat for stat in TableStatistic.query.filter(
+            TableStatistic.table_name.in_(self.TRACKED_TABLES)
+        ).all()}
+        return {table: stats[table] for table in self.TRACKED_TABLES if table in stats}
+
+# Global table statistics instance
+table_stats = TableStatistics()